@@ -0,0 +1,75 @@
+"""
+Game tick benchmark for The Land RPG
+
+Adds thousands of bot players to a headless game, has every bot queue a chop or
+an attack each tick, and reports how long resolving a tick's actions takes, next
+to the whole update (entity updates, the tick and the event dispatch).
+
+Usage:
+    python scripts/bench_actions.py [--bots N] [--ticks N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.main import Game  # noqa: E402
+from src.entities.enemy import Enemy  # noqa: E402
+from src.entities.player import Player  # noqa: E402
+from src.entities.tree import Tree  # noqa: E402
+from src.systems.actions import ActionType  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark game tick processing")
+    parser.add_argument("--bots", type=int, default=5000, help="number of bot players")
+    parser.add_argument("--ticks", type=int, default=100, help="number of ticks")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    game = Game()
+    rng = random.Random(0)
+
+    for _ in range(args.bots // 2):
+        game._add_entity(Tree(rng.randrange(10_000), rng.randrange(10_000)))
+    for _ in range(args.bots // 4):
+        game._add_entity(Enemy(rng.randrange(10_000), rng.randrange(10_000)))
+    bots = [Player(rng.randrange(10_000), rng.randrange(10_000), game.events, game.movement)
+            for _ in range(args.bots)]
+
+    queue = game.actions.queue
+    update_times = []
+    for _ in range(args.ticks):
+        for bot in bots:
+            if rng.random() < 0.5:
+                queue(ActionType.CHOP, bot, rng.choice(game.trees))
+            elif bot.attacking_enemy is None:
+                enemy = rng.choice(game.enemies)
+                if enemy.alive:
+                    bot.start_attack(enemy)
+                    queue(ActionType.ATTACK, bot, enemy)
+
+        # Advance by exactly one tick's worth of game time
+        start = time.perf_counter()
+        game.update(game.actions.tick_ms)
+        update_times.append((time.perf_counter() - start) * 1000)
+
+    tick_times = list(game.actions.tick_times)
+    print(f"{args.bots} bots, {len(game.trees)} trees, {len(game.enemies)} enemies, "
+          f"{game.actions.tick} ticks")
+    print(f"  resolve actions   mean {statistics.mean(tick_times):7.2f} ms, "
+          f"max {max(tick_times):7.2f} ms")
+    print(f"  whole update      mean {statistics.mean(update_times):7.2f} ms, "
+          f"max {max(update_times):7.2f} ms")
+    print(f"  tick budget       {game.actions.tick_ms:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
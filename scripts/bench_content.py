@@ -0,0 +1,70 @@
+"""
+Content pack loading benchmark for The Land RPG
+
+Writes a temporary pack with many placements and times opening it and reading
+every placement with its entity type, next to parsing the same data as JSON.
+
+Usage:
+    python scripts/bench_content.py [--placements N]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.content import ContentPack, EntityKind, NO_LOOT, write_pack  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark content pack loading")
+    parser.add_argument("--placements", type=int, default=100_000, help="number of placements")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    items = [("Logs", 1000)]
+    entity_types = [
+        (f"type_{i}", None, None, EntityKind.TREE if i % 2 else EntityKind.ENEMY,
+         40, 100, 300, 25, NO_LOOT)
+        for i in range(500)
+    ]
+    placements = [(rng.randrange(len(entity_types)), rng.randrange(100_000), rng.randrange(100_000))
+                  for _ in range(args.placements)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "bench.pack")
+        json_path = os.path.join(tmp, "bench.json")
+        write_pack(pack_path, items, entity_types, placements)
+        with open(json_path, "w") as f:
+            json.dump({"placements": [{"type": f"type_{t}", "x": x, "y": y}
+                                      for t, x, y in placements]}, f)
+
+        start = time.perf_counter()
+        pack = ContentPack(pack_path)
+        opened = time.perf_counter()
+        count = 0
+        for type_id, x, y in pack.iter_placements():
+            pack.entity_type(type_id)
+            count += 1
+        read = time.perf_counter()
+        pack.close()
+
+        start_json = time.perf_counter()
+        with open(json_path) as f:
+            parsed = json.load(f)["placements"]
+        parsed_json = time.perf_counter()
+
+        print(f"{count} placements, {len(entity_types)} entity types")
+        print(f"  pack: open {(opened - start) * 1000:7.2f} ms, "
+              f"read all {(read - opened) * 1000:7.2f} ms "
+              f"({os.path.getsize(pack_path) / 1024:.0f} KiB)")
+        print(f"  json: parse {(parsed_json - start_json) * 1000:7.2f} ms "
+              f"({os.path.getsize(json_path) / 1024:.0f} KiB, {len(parsed)} records)")
+
+
+if __name__ == "__main__":
+    main()
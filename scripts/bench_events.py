@@ -0,0 +1,68 @@
+"""
+Event bus benchmark for The Land RPG
+
+Measures the cost of emitting and dispatching batches of events, with and without
+merging, next to calling the listener directly for each event.
+
+Usage:
+    python scripts/bench_events.py [--events N] [--rounds N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.events import EventBus, EventType  # noqa: E402
+
+
+class Target:
+    """Stand-in for a player receiving grants"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event bus dispatch")
+    parser.add_argument("--events", type=int, default=10_000, help="events per batch")
+    parser.add_argument("--rounds", type=int, default=50, help="batches to average over")
+    args = parser.parse_args()
+
+    calls = 0
+
+    def listener(event) -> None:
+        nonlocal calls
+        calls += 1
+
+    targets = [Target() for _ in range(args.events)]
+    shared = Target()
+
+    def run(label: str, event_type: EventType, distinct_targets: bool) -> None:
+        nonlocal calls
+        bus = EventBus()
+        bus.subscribe(event_type, listener)
+        emit = bus.emit
+        calls = 0
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for i in range(args.events):
+                emit(event_type, None, targets[i] if distinct_targets else shared, i & 7, 1)
+            bus.dispatch()
+        elapsed = (time.perf_counter() - start) * 1000 / args.rounds
+        print(f"  {label:<34} {elapsed:7.2f} ms/batch, {calls // args.rounds:6d} listener calls")
+
+    print(f"{args.events} events per batch, {args.rounds} batches")
+    run("damage (no merging)", EventType.DAMAGE_DEALT, True)
+    run("item grants, all distinct", EventType.ITEM_GRANTED, True)
+    run("item grants, 8 items x 1 target", EventType.ITEM_GRANTED, False)
+
+    calls = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for i in range(args.events):
+            listener(None)
+    elapsed = (time.perf_counter() - start) * 1000 / args.rounds
+    print(f"  {'direct calls (baseline)':<34} {elapsed:7.2f} ms/batch, {calls // args.rounds:6d} listener calls")
+
+
+if __name__ == "__main__":
+    main()
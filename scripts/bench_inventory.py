@@ -0,0 +1,107 @@
+"""
+Inventory benchmark for The Land RPG
+
+Runs ticks of mixed add / has / remove operations against the slot-based
+Inventory and the previous dict-of-names implementation, then times a bank
+deposit-all of a full inventory.
+
+Usage:
+    python scripts/bench_inventory.py [--ops N] [--ticks N] [--item-types N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import GameBalance  # noqa: E402
+from src.systems.inventory import Inventory  # noqa: E402
+from src.systems.items import ItemRegistry  # noqa: E402
+
+
+class DictInventory:
+    """The previous inventory: item name -> quantity in a dict"""
+
+    def __init__(self) -> None:
+        self.items: Dict[str, int] = {}
+
+    def add_item(self, item_name: str, quantity: int = 1) -> None:
+        if item_name in self.items:
+            self.items[item_name] += quantity
+        else:
+            self.items[item_name] = quantity
+
+    def remove_item(self, item_name: str, quantity: int = 1) -> bool:
+        if item_name not in self.items:
+            return False
+        if self.items[item_name] < quantity:
+            return False
+        self.items[item_name] -= quantity
+        if self.items[item_name] == 0:
+            del self.items[item_name]
+        return True
+
+    def has_item(self, item_name: str, quantity: int = 1) -> bool:
+        return self.items.get(item_name, 0) >= quantity
+
+
+def run_ticks(inventory, operations, ticks: int) -> float:
+    """Apply the operation list once per tick and return the mean ms per tick"""
+    add, has, remove = inventory.add_item, inventory.has_item, inventory.remove_item
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for op, item, quantity in operations:
+            if op == 0:
+                add(item, quantity)
+            elif op == 1:
+                has(item, quantity)
+            else:
+                remove(item, quantity)
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark inventory operations")
+    parser.add_argument("--ops", type=int, default=10_000, help="operations per tick")
+    parser.add_argument("--ticks", type=int, default=50, help="number of ticks")
+    parser.add_argument("--item-types", type=int, default=200, help="distinct item types")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    registry = ItemRegistry()
+    names = [f"Item {i}" for i in range(args.item_types)]
+    ids = [registry.intern(name, stack_limit=rng.choice((1, 100, 1000))) for name in names]
+
+    # Same random sequence expressed with names and with interned IDs
+    choices = [(rng.randrange(3), rng.randrange(args.item_types), rng.randrange(1, 5))
+               for _ in range(args.ops)]
+    by_name = [(op, names[i], q) for op, i, q in choices]
+    by_id = [(op, ids[i], q) for op, i, q in choices]
+
+    slot_capacity = args.item_types * 8
+    print(f"{args.ops} ops/tick over {args.item_types} item types, {args.ticks} ticks")
+    print(f"  dict (names)         {run_ticks(DictInventory(), by_name, args.ticks):7.2f} ms/tick")
+    print(f"  slots (names)        "
+          f"{run_ticks(Inventory(slot_capacity, registry=registry), by_name, args.ticks):7.2f} ms/tick")
+    print(f"  slots (item IDs)     "
+          f"{run_ticks(Inventory(slot_capacity, registry=registry), by_id, args.ticks):7.2f} ms/tick")
+
+    # Deposit-all of a full 28-slot inventory into a bank
+    bank = Inventory(GameBalance.BANK_SLOTS, max_stack=GameBalance.BANK_STACK_LIMIT, registry=registry)
+    inventory = Inventory(registry=registry)
+    rounds = 1000
+    elapsed = 0.0
+    for _ in range(rounds):
+        for item_id in ids[:GameBalance.INVENTORY_SLOTS]:
+            inventory.add_item(item_id, 1)
+        start = time.perf_counter()
+        inventory.transfer_all(bank)
+        elapsed += time.perf_counter() - start
+    print(f"  deposit-all (28 slots) {elapsed * 1e6 / rounds:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Simulation LOD benchmark for The Land RPG
+
+Spreads tens of thousands of trees and enemies over a large area around the
+player, half of them waiting to respawn, and times the per-frame entity updates
+with every entity updated every frame and with distance-based LOD. Also checks
+that respawn timers keep game time in the far band and across a freeze.
+
+Usage:
+    python scripts/bench_lod.py [--trees N] [--enemies N] [--frames N] [--area PIXELS]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.config import FPS, SimulationSettings, WorldSettings  # noqa: E402
+from src.main import Game  # noqa: E402
+
+
+def build(args: argparse.Namespace, near_radius: float, active_radius: float) -> Game:
+    """Create a game with many trees and enemies, half of them respawning"""
+    game = Game()
+    game.world.close()  # keep the entity count fixed
+    game.world.poll = lambda: []
+    game.world.request_around = lambda x, y: 0
+    for lod in (game.tree_lod, game.enemy_lod):
+        lod.near_radius = near_radius
+        lod.active_radius = active_radius
+
+    content = game.content
+    tree_type = content.entity_type(content.entity_type_id(WorldSettings.TREE_TYPE))
+    enemy_type = content.entity_type(content.entity_type_id(WorldSettings.ENEMY_TYPE))
+    rng = random.Random(0)
+    half = args.area / 2
+
+    def position() -> tuple:
+        return game.player.x + rng.uniform(-half, half), game.player.y + rng.uniform(-half, half)
+
+    for i in range(args.trees):
+        tree = game._spawn(tree_type, *position())
+        if i % 2:
+            tree.active = False
+            tree.respawn_timer = tree.respawn_delay * rng.uniform(1, 20)
+    for i in range(args.enemies):
+        enemy = game._spawn(enemy_type, *position())
+        if i % 2:
+            enemy.alive = False
+            enemy.respawn_timer = enemy.respawn_delay * rng.uniform(1, 20)
+    return game
+
+
+def time_updates(game: Game, frames: int) -> list:
+    """Run frames of update() and return each one's time in milliseconds"""
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update(1000 / FPS)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def check_timers() -> None:
+    """Respawn timers must count game time the same in every band"""
+    game = Game()
+    tree_type = game.content.entity_type(game.content.entity_type_id(WorldSettings.TREE_TYPE))
+    px, py = game.player.x, game.player.y
+    far = game._spawn(tree_type, px + (SimulationSettings.LOD_NEAR_RADIUS
+                                       + SimulationSettings.LOD_ACTIVE_RADIUS) / 2, py)
+    frozen = game._spawn(tree_type, px + SimulationSettings.LOD_ACTIVE_RADIUS * 2, py)
+
+    # Chop both a few frames in; their timers start at the chop
+    game.update(1000 / FPS)
+    for tree in (far, frozen):
+        tree.chop(game.player, game.events)
+    game.events.dispatch()
+    chopped_at = game.game_time_ms
+
+    for _ in range(2 * FPS):
+        game.update(1000 / FPS)
+    waited = game.game_time_ms - chopped_at
+    far_error = far.respawn_delay - waited - far.respawn_timer
+
+    # Bring the frozen tree into range and let it catch up
+    frozen_before = frozen.respawn_timer
+    game.tree_lod.positions[game.trees.index(frozen)] = (px, py)
+    game.update(1000 / FPS)
+    waited = game.game_time_ms - chopped_at
+    frozen_error = frozen.respawn_delay - waited - frozen.respawn_timer
+
+    print(f"\nTimer check after {waited / 1000:.2f} s of game time:")
+    print(f"  far tree     timer off by {far_error:6.1f} ms "
+          f"(up to {SimulationSettings.LOD_FAR_INTERVAL - 1} frames behind between its updates)")
+    print(f"  frozen tree  {frozen_before:.0f} ms left while frozen, "
+          f"timer off by {frozen_error:6.1f} ms after fast-forward")
+    game.close()  # one pygame session for the whole script; close only at the end
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark simulation LOD")
+    parser.add_argument("--trees", type=int, default=40_000, help="number of trees")
+    parser.add_argument("--enemies", type=int, default=20_000, help="number of enemies")
+    parser.add_argument("--frames", type=int, default=300, help="frames to time")
+    parser.add_argument("--area", type=float, default=20_000, help="side of the square they are spread over")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    print(f"{args.trees} trees and {args.enemies} enemies over {args.area:.0f} x {args.area:.0f} px, "
+          f"half respawning; {args.frames} frames")
+
+    inf = float("inf")
+    for label, near, active in (
+            ("every frame", inf, inf),
+            ("LOD", SimulationSettings.LOD_NEAR_RADIUS, SimulationSettings.LOD_ACTIVE_RADIUS)):
+        game = build(args, near, active)
+        times = time_updates(game, args.frames)
+        bands = ", ".join(f"{band} {total} ({updated} run)"
+                          for band, (total, updated) in game.lod_counts().items())
+        print(f"  {label:<12} update mean {statistics.mean(times):7.2f} ms, "
+              f"max {max(times):7.2f} ms | {bands}")
+
+    check_timers()
+
+
+if __name__ == "__main__":
+    main()
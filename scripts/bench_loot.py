@@ -0,0 +1,91 @@
+"""
+Loot table benchmark for The Land RPG
+
+Times single rolls of a content pack loot table with the alias method against a
+linear scan and random.choices over cumulative weights (binary search), then
+simulates millions of kills with the NumPy batch roller and compares the
+observed drop rates with the exact ones.
+
+Usage:
+    python scripts/bench_loot.py [--table goblin] [--rolls N] [--kills N]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import AssetPaths  # noqa: E402
+from src.systems.content import ContentPack, NO_ITEM  # noqa: E402
+from src.systems.items import ITEMS  # noqa: E402
+from src.systems.loot import load_tables  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark loot table rolls")
+    parser.add_argument("--table", default="goblin", help="loot table to roll")
+    parser.add_argument("--rolls", type=int, default=1_000_000, help="single rolls per method")
+    parser.add_argument("--kills", type=int, default=10_000_000, help="kills in the batch simulation")
+    args = parser.parse_args()
+
+    with ContentPack(AssetPaths.CONTENT_PACK) as content:
+        ITEMS.load_content(content)
+        tables = load_tables(content)
+        names = [content.loot_table(i).name for i in range(content.loot_table_count)]
+        definition = content.loot_table(names.index(args.table))
+    table = tables[names.index(args.table)]
+
+    weights = [entry.weight for entry in definition.weighted]
+    cum_weights = list(itertools.accumulate(weights))
+    total = cum_weights[-1]
+    indexes = range(len(weights))
+
+    def linear(rng: random.Random) -> int:
+        target = rng.random() * total
+        for index, cumulative in enumerate(cum_weights):
+            if target < cumulative:
+                return index
+        return len(cum_weights) - 1
+
+    def bisect(rng: random.Random) -> int:
+        return rng.choices(indexes, cum_weights=cum_weights)[0]
+
+    print(f"Loot table {args.table!r}: {len(definition.guaranteed)} guaranteed, "
+          f"{len(weights)} weighted entries; {args.rolls} picks per method")
+    for label, pick in (("linear scan", linear), ("random.choices", bisect), ("alias", table.pick)):
+        rng = random.Random(0)
+        start = time.perf_counter()
+        for _ in range(args.rolls):
+            pick(rng)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<16} {elapsed * 1000:8.1f} ms ({elapsed / args.rolls * 1e9:6.0f} ns/pick)")
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(args.rolls):
+        table.roll(rng)
+    elapsed = time.perf_counter() - start
+    print(f"  {'roll (+qty)':<16} {elapsed * 1000:8.1f} ms ({elapsed / args.rolls * 1e9:6.0f} ns/roll)")
+
+    # Batch simulation of many kills
+    start = time.perf_counter()
+    totals = table.simulate(args.kills, np.random.default_rng(0))
+    elapsed = time.perf_counter() - start
+    print(f"\nSimulated {args.kills:,} kills in {elapsed * 1000:.0f} ms "
+          f"({elapsed / args.kills * 1e9:.1f} ns/kill)")
+
+    print(f"  {'item':<24} {'expected':>10} {'observed':>10} {'drops':>10} {'avg qty':>8}")
+    for item_id, rate in sorted(table.drop_rates().items(), key=lambda pair: -pair[1]):
+        drops, quantity = totals.get(item_id, (0, 0))
+        print(f"  {ITEMS.name(item_id):<24} {rate:>10.6f} {drops / args.kills:>10.6f} {drops:>10,} "
+              f"{quantity / drops if drops else 0:>8.2f}")
+    assert NO_ITEM not in totals
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Frame pacing benchmark for The Land RPG
+
+Runs the real game loop (headless) for a few seconds in each situation and reports
+the CPU time used per second of wall time: standing still at a fixed 60 FPS (the
+previous loop), standing still with adaptive pacing (idle), walking with the window
+unfocused (background), and walking with focus (active).
+
+Usage:
+    python scripts/bench_pacing.py [--seconds N]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.main import Game  # noqa: E402
+from src.rendering import sprites  # noqa: E402
+from src.rendering.pacing import FramePacer  # noqa: E402
+
+
+def run_for(game: Game, seconds: float, walking: bool, focused: bool, adaptive: bool) -> tuple:
+    """Run the game loop for a while and return (CPU ms per second, frames, mode)"""
+    pacer = game.pacer
+    pacer.reset_stats()
+    frames = 0
+    end = time.perf_counter() + seconds
+    x, y = game.player.x, game.player.y
+    while time.perf_counter() < end:
+        if walking and not game.movement.active_count:
+            # Walk back and forth between two points
+            game.player.move_to(x + 200 if frames % 2 else x, y)
+        busy = game.is_busy() if adaptive else True
+        pacer.select(busy, focused)
+        elapsed_ms, events = pacer.wait()
+        game.handle_events(events)
+        game.update(elapsed_ms)
+        game.draw()
+        frames += 1
+
+    usage = pacer.cpu_ms_per_second()
+    mode = max(pacer.seconds_per_mode().items(), key=lambda item: item[1])[0]
+    return usage[mode], frames, mode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark adaptive frame pacing")
+    parser.add_argument("--seconds", type=float, default=3.0, help="seconds per scenario")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    game = Game()
+
+    # Let world generation and sprite loading settle first
+    while game.world.pending or sprites.pending_count():
+        game.update()
+        game.draw()
+        time.sleep(0.01)
+
+    scenarios = [
+        ("standing still, fixed 60 FPS", False, True, False),
+        ("standing still, adaptive", False, True, True),
+        ("walking, unfocused, adaptive", True, False, True),
+        ("walking, focused, adaptive", True, True, True),
+    ]
+    print(f"{args.seconds:g} s per scenario; CPU ms per wall second (1000 = one core)")
+    for name, walking, focused, adaptive in scenarios:
+        # Stop and let the game settle (and go idle) between scenarios
+        game.pacer = FramePacer()
+        game.player.movement.stop(game.player.mover)
+        run_for(game, 1.5, False, True, True)
+        cpu, frames, mode = run_for(game, args.seconds, walking, focused, adaptive)
+        print(f"  {name:<30} {cpu:7.1f} ms/s  {frames / args.seconds:6.1f} fps  ({mode})")
+
+    game.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Particle benchmark for The Land RPG
+
+Keeps a big fight's worth of hit splats, floating XP text and wood chips alive
+and reports update + draw time per frame, plus garbage collector runs, for the
+pooled ParticleSystem and for one Python object with its own freshly rendered
+surface per splat, text or chip.
+
+Usage:
+    python scripts/bench_particles.py [--spawns N] [--frames N]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.config import Colors, RenderSettings, SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+from src.rendering.particles import ParticleSystem  # noqa: E402
+from src.ui.fonts import get_font  # noqa: E402
+
+
+class ObjectParticle:
+    """One object and one surface per particle, as a naive version would"""
+
+    def __init__(self, x: float, y: float, surface: pygame.Surface, vx: float, vy: float,
+                 gravity: float, lifetime_ms: float) -> None:
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.gravity = gravity
+        self.surface = surface
+        self.lifetime = lifetime_ms
+
+    def update(self, elapsed_ms: float) -> bool:
+        dt = elapsed_ms / 1000
+        self.vy += self.gravity * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.lifetime -= elapsed_ms
+        return self.lifetime > 0
+
+
+def spawn_objects(objects: list, rng: random.Random, x: float, y: float, damage: int) -> None:
+    """Spawn a hit splat, XP text and wood chips as individual objects"""
+    font = get_font(RenderSettings.PARTICLE_FONT_SIZE)
+    size = RenderSettings.HIT_SPLAT_SIZE
+    splat = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(splat, Colors.RED, (size // 2, size // 2), size // 2)
+    splat.blit(font.render(str(damage), True, Colors.WHITE), (4, 4))
+    objects.append(ObjectParticle(x, y, splat, 0, 0, 0, RenderSettings.HIT_SPLAT_LIFETIME_MS))
+
+    text = font.render("+25 XP", True, Colors.GOLD)
+    objects.append(ObjectParticle(x, y, text, 0, -RenderSettings.FLOATING_TEXT_SPEED, 0,
+                                  RenderSettings.FLOATING_TEXT_LIFETIME_MS))
+
+    for _ in range(RenderSettings.WOOD_CHIP_COUNT):
+        chip = pygame.Surface((RenderSettings.WOOD_CHIP_SIZE,) * 2)
+        chip.fill(Colors.BROWN)
+        speed = rng.uniform(0.5, 1.0) * RenderSettings.WOOD_CHIP_SPEED
+        objects.append(ObjectParticle(x, y, chip, rng.uniform(-1, 1) * speed, -speed,
+                                      RenderSettings.PARTICLE_GRAVITY,
+                                      RenderSettings.WOOD_CHIP_LIFETIME_MS))
+
+
+def gc_runs() -> int:
+    """Total garbage collections so far, across all generations"""
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark particle update and draw")
+    parser.add_argument("--spawns", type=int, default=5, help="hits spawned per frame")
+    parser.add_argument("--frames", type=int, default=300, help="frames to average over")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame_ms = 1000 / 60
+
+    rng = random.Random(0)
+    points = [(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+              for _ in range(args.spawns * args.frames)]
+
+    particles = ParticleSystem()
+    peak = 0
+    collections = gc_runs()
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        for x, y in points[frame * args.spawns:(frame + 1) * args.spawns]:
+            particles.spawn_hit_splat(x, y, rng.randrange(30))
+            particles.spawn_xp_text(x, y, 25)
+            particles.spawn_wood_chips(x, y)
+        particles.update(frame_ms)
+        particles.draw(screen)
+        peak = max(peak, particles.active_count)
+    pooled_ms = (time.perf_counter() - start) * 1000 / args.frames
+    pooled_gc = gc_runs() - collections
+
+    objects = []
+    collections = gc_runs()
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        for x, y in points[frame * args.spawns:(frame + 1) * args.spawns]:
+            spawn_objects(objects, rng, x, y, rng.randrange(30))
+        objects = [particle for particle in objects if particle.update(frame_ms)]
+        screen.blits([(particle.surface, (particle.x, particle.y)) for particle in objects],
+                     doreturn=False)
+    object_ms = (time.perf_counter() - start) * 1000 / args.frames
+    object_gc = gc_runs() - collections
+
+    print(f"{args.spawns} hits per frame, {args.frames} frames, "
+          f"peak {peak} of {particles.capacity} pooled particles")
+    print(f"  ParticleSystem          {pooled_ms:7.2f} ms/frame, {pooled_gc:4d} GC runs")
+    print(f"  object + surface each   {object_ms:7.2f} ms/frame, {object_gc:4d} GC runs")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
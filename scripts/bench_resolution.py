@@ -0,0 +1,125 @@
+"""
+Render resolution benchmark for The Land RPG
+
+Fills the view with enemies and particles and times draw() at each internal
+render scale, in a window the size of the logical screen and in one twice that
+size, upscaling with plain scale and with scale2x. Then runs the game loop with
+dynamic resolution on while an extra load pushes frames over budget for a while,
+and prints how the render scale follows.
+
+Usage:
+    python scripts/bench_resolution.py [--frames N] [--enemies N]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, ResolutionSettings, WorldSettings  # noqa: E402
+from src.main import Game  # noqa: E402
+from src.rendering import sprites  # noqa: E402
+from src.rendering.resolution import DynamicResolution, RenderTarget  # noqa: E402
+
+
+def populate(game: Game, enemies: int) -> None:
+    """Spread enemies over the view and start a few particle bursts"""
+    content = game.content
+    enemy_type = content.entity_type(content.entity_type_id(WorldSettings.ENEMY_TYPE))
+    rng = random.Random(0)
+    left, top = game.camera
+    for _ in range(enemies):
+        game._spawn(enemy_type, left + rng.uniform(0, SCREEN_WIDTH), top + rng.uniform(0, SCREEN_HEIGHT))
+
+    # Let world generation and sprite loading (at every scale drawn below) settle
+    for scale in (1.0, *ResolutionSettings.SCALE_STEPS):
+        game.display.set_render_scale(scale)
+        game.draw()
+        while game.world.pending or sprites.pending_count():
+            game.update()
+            game.draw()
+            time.sleep(0.01)
+
+
+def burst(game: Game) -> None:
+    """Keep particles on screen (hit splats, XP text and wood chips)"""
+    x, y = game.player.x, game.player.y
+    game.particles.spawn_hit_splat(x, y, 7)
+    game.particles.spawn_xp_text(x, y - 20, 25)
+    game.particles.spawn_wood_chips(x, y)
+
+
+def time_draws(game: Game, frames: int) -> list:
+    """Draw frames and return each one's time in milliseconds"""
+    times = []
+    for frame in range(frames):
+        if frame % 10 == 0:
+            burst(game)
+        game.update()
+        start = time.perf_counter()
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def run_dynamic(game: Game, frames: int, extra_ms: float) -> None:
+    """Run the loop with dynamic resolution, adding extra_ms of work in the middle third"""
+    game.display.set_render_scale(1.0)
+    controller = game.dynamic_resolution = DynamicResolution(game.display)
+    print(f"\nDynamic resolution (budget {controller.budget_ms:.1f} ms, "
+          f"+{extra_ms:.0f} ms of extra work per frame in the middle third):")
+
+    phases = (("before", 0.0), ("loaded", extra_ms), ("after", 0.0))
+    for label, extra in phases:
+        scales = []
+        for _ in range(frames // 3):
+            game._begin_frame()
+            game.update()
+            if extra:
+                end = time.perf_counter() + extra / 1000
+                while time.perf_counter() < end:
+                    pass
+            game.draw()
+            scales.append(game.display.render_scale)
+        steps = " -> ".join(f"{scale:g}" for i, scale in enumerate(scales)
+                            if i == 0 or scale != scales[i - 1])
+        print(f"  {label:<7} render scale {steps}")
+    print(f"  {controller.changes} scale changes")
+    game.dynamic_resolution = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark internal render resolution")
+    parser.add_argument("--frames", type=int, default=300, help="frames to time per configuration")
+    parser.add_argument("--enemies", type=int, default=600, help="enemies spread over the view")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    game = Game()
+    populate(game, args.enemies)
+    print(f"{args.enemies} enemies in view, {args.frames} frames per configuration")
+
+    for window_scale, scale2x in ((1.0, False), (1.0, True), (2.0, False), (2.0, True)):
+        # One pygame session for the whole script; only the window is replaced
+        game.display = RenderTarget(window_scale, scale2x=scale2x)
+        game.static_layer.invalidate()
+        present = " (scale2x)" if scale2x else " (scale)"
+        for render_scale in ResolutionSettings.SCALE_STEPS:
+            game.display.set_render_scale(render_scale)
+            times = time_draws(game, args.frames)
+            print(f"  window x{window_scale:g}{present:<10} render scale {render_scale:<5g} "
+                  f"draw mean {statistics.mean(times):6.2f} ms, max {max(times):6.2f} ms")
+
+    game.display = RenderTarget()
+    run_dynamic(game, args.frames, ResolutionSettings.FRAME_BUDGET_MS * 1.5)
+    game.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Sprite loading benchmark for The Land RPG
+
+Writes a few hundred distinct PNG textures, then requests them all in one frame,
+as a large spawn of new entity types would. Reports the main-thread cost of that
+frame and of the frames that follow when sprites are decoded synchronously, versus
+through the background loader (which also reports queue depth and load latency).
+
+Usage:
+    python scripts/bench_sprites.py [--textures N] [--size PX]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from src.config import GameBalance  # noqa: E402
+from src.rendering import sprites  # noqa: E402
+
+
+def write_textures(directory: str, count: int, size: int) -> list:
+    """Write count random-noise RGBA PNGs and return their paths"""
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(count):
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pixels = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+        pygame.surfarray.blit_array(surface, pixels)
+        path = os.path.join(directory, f"texture_{i}.png")
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sprite loading")
+    parser.add_argument("--textures", type=int, default=300, help="distinct textures to load")
+    parser.add_argument("--size", type=int, default=256, help="texture width and height in pixels")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    draw_size = GameBalance.TREE_SIZE
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_textures(directory, args.textures, args.size)
+
+        # Synchronous: decode, scale and convert everything in the spawn frame
+        start = time.perf_counter()
+        for path in paths:
+            sprites._decode(path, draw_size).convert_alpha()
+        sync_ms = (time.perf_counter() - start) * 1000
+
+        # Background loader: request everything, then pump once per frame
+        start = time.perf_counter()
+        for path in paths:
+            sprites.get_sprite(path, draw_size)
+        request_ms = (time.perf_counter() - start) * 1000
+        peak_depth = sprites.pending_count()
+
+        frames = 0
+        worst_frame_ms = 0.0
+        while sprites.pending_count():
+            frame_start = time.perf_counter()
+            sprites.pump()
+            worst_frame_ms = max(worst_frame_ms, (time.perf_counter() - frame_start) * 1000)
+            frames += 1
+            time.sleep(1 / 120)  # rest of a frame
+        total_ms = (time.perf_counter() - start) * 1000
+        stats = sprites.load_stats()
+        sprites.shutdown()
+
+    print(f"{args.textures} textures of {args.size}x{args.size} px scaled to {draw_size} px")
+    print(f"  synchronous        spawn frame {sync_ms:8.1f} ms")
+    print(f"  background loader  spawn frame {request_ms:8.1f} ms, worst later frame "
+          f"{worst_frame_ms:6.2f} ms, all loaded after {total_ms:.0f} ms ({frames} frames)")
+    print(f"                     peak queue depth {peak_depth}, latency mean "
+          f"{stats['latency_mean_ms']:.0f} ms, max {stats['latency_max_ms']:.0f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup benchmark for The Land RPG
+
+Measures how long a cold start takes, broken down into importing pygame itself,
+importing the game, initialization (Game construction) and first frame (one
+update + draw). Each run happens in a fresh interpreter using SDL's dummy video
+driver, so it works headless.
+
+'import pygame' is measured on its own because it dominates and is outside this
+codebase's control: pygame.pkgdata imports pkg_resources and pygame.surfarray
+imports numpy. Since numpy is loaded there, the game's own modules importing it
+add nothing.
+
+Usage:
+    python scripts/bench_startup.py [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGET_MS = 100.0
+PHASES = ("pygame", "import", "init", "first_frame")
+
+
+def measure_once() -> None:
+    """Time a single cold start and print the phases as JSON (child process)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+
+    start = time.perf_counter()
+    import pygame  # noqa: F401
+    pygame_imported = time.perf_counter()
+    from src.main import Game
+    imported = time.perf_counter()
+
+    game = Game()
+    initialized = time.perf_counter()
+
+    game.update()
+    game.draw()
+    first_frame = time.perf_counter()
+
+    print(json.dumps({
+        "pygame": (pygame_imported - start) * 1000,
+        "import": (imported - pygame_imported) * 1000,
+        "init": (initialized - imported) * 1000,
+        "first_frame": (first_frame - initialized) * 1000,
+    }))
+
+
+def main() -> None:
+    """Run several cold starts and report the median time per phase"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="number of cold starts")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure_once()
+        return
+
+    results = {phase: [] for phase in PHASES}
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        for phase in PHASES:
+            results[phase].append(timings[phase])
+
+    print(f"Startup over {args.runs} runs (median / min / max, ms)")
+    total = 0.0
+    for phase in PHASES:
+        median = statistics.median(results[phase])
+        total += median
+        print(f"  {phase:<12} {median:8.1f} {min(results[phase]):8.1f} {max(results[phase]):8.1f}")
+    status = "OK" if total <= TARGET_MS else "OVER TARGET"
+    print(f"  {'total':<12} {total:8.1f}   (target {TARGET_MS:.0f} ms: {status})")
+    own = total - statistics.median(results["pygame"])
+    print(f"  {'without pygame':<12} {own:6.1f}   (import pygame: {total - own:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+World generation benchmark for The Land RPG
+
+Reports how many chunks per second the seeded world generator produces, both
+called directly and through the worker-thread ChunkStreamer (with the longest
+time the main thread spent taking finished chunks). It then checks determinism:
+the same seed must give identical placements whatever order and thread the
+chunks are generated in, and a different seed must give a different world.
+Exits with status 1 if the determinism check fails.
+
+Usage:
+    python scripts/bench_worldgen.py [--chunks N] [--seed N]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from src.systems.worldgen import ChunkStreamer, WorldGenerator  # noqa: E402
+
+
+def chunk_grid(count: int) -> list:
+    """Keys of a square block of about count chunks centered on the origin"""
+    side = math.isqrt(count)
+    half = side // 2
+    return [(cx, cy) for cy in range(-half, side - half) for cx in range(-half, side - half)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark procedural world generation")
+    parser.add_argument("--chunks", type=int, default=2500, help="chunks to generate")
+    parser.add_argument("--seed", type=int, default=12345, help="world seed")
+    args = parser.parse_args()
+
+    keys = chunk_grid(args.chunks)
+    generator = WorldGenerator(args.seed)
+
+    start = time.perf_counter()
+    direct = {key: generator.generate(key) for key in keys}
+    direct_s = time.perf_counter() - start
+    trees = sum(len(chunk.trees) for chunk in direct.values())
+    enemies = sum(len(chunk.enemies) for chunk in direct.values())
+
+    # Same seed through the worker thread, requested in a shuffled order
+    streamer = ChunkStreamer(WorldGenerator(args.seed), radius=0)
+    shuffled = keys[:]
+    random.Random(0).shuffle(shuffled)
+    size = streamer.generator.chunk_size
+    threaded = {}
+    longest_poll = 0.0
+    start = time.perf_counter()
+    for cx, cy in shuffled:
+        streamer.request_around(cx * size, cy * size)
+    while len(threaded) < len(keys):
+        poll_start = time.perf_counter()
+        chunks = streamer.poll(limit=len(keys))
+        longest_poll = max(longest_poll, time.perf_counter() - poll_start)
+        for chunk in chunks:
+            threaded[chunk.key] = chunk
+        time.sleep(0.001)
+    threaded_s = time.perf_counter() - start
+    streamer.close()
+
+    print(f"{len(keys)} chunks of {generator.chunk_size} px ({trees} trees, {enemies} enemies)")
+    print(f"  generate() on main thread   {len(keys) / direct_s:9.0f} chunks/s "
+          f"({direct_s * 1000 / len(keys):.2f} ms/chunk)")
+    print(f"  ChunkStreamer worker        {len(keys) / threaded_s:9.0f} chunks/s "
+          f"(longest poll {longest_poll * 1000:.3f} ms)")
+
+    same = all(np.array_equal(direct[key].trees, threaded[key].trees)
+               and np.array_equal(direct[key].enemies, threaded[key].enemies)
+               for key in keys)
+    other = WorldGenerator(args.seed + 1)
+    differs = any(not np.array_equal(direct[key].trees, other.generate(key).trees)
+                  for key in keys[:16])
+
+    print(f"  same seed, shuffled on worker   {'identical' if same else 'DIFFERENT'}")
+    print(f"  seed {args.seed + 1} vs seed {args.seed}     {'different' if differs else 'IDENTICAL'}")
+    if not (same and differs):
+        print("Determinism check FAILED")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
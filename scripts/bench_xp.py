@@ -0,0 +1,51 @@
+"""
+XP system benchmark for The Land RPG
+
+Applies a million random XP grants one at a time with add_xp and all at once with
+add_xp_batch, and checks both end in the same state.
+
+Usage:
+    python scripts/bench_xp.py [--grants N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.xp_system import SKILLS, XPSystem  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark XP grants")
+    parser.add_argument("--grants", type=int, default=1_000_000, help="number of XP grants")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    grants = [(rng.randrange(len(SKILLS)), rng.randrange(1, 50)) for _ in range(args.grants)]
+
+    single = XPSystem()
+    start = time.perf_counter()
+    for skill_id, amount in grants:
+        single.add_xp(skill_id, amount)
+    single_time = time.perf_counter() - start
+
+    batched = XPSystem()
+    start = time.perf_counter()
+    batched.add_xp_batch(grants)
+    batch_time = time.perf_counter() - start
+
+    assert list(single.xp) == list(batched.xp) and list(single.levels) == list(batched.levels)
+
+    print(f"{args.grants} grants over {len(SKILLS)} skills")
+    print(f"  add_xp        {single_time * 1000:8.1f} ms ({single_time / args.grants * 1e9:6.0f} ns/grant)")
+    print(f"  add_xp_batch  {batch_time * 1000:8.1f} ms ({batch_time / args.grants * 1e9:6.0f} ns/grant)")
+    for skill_id, name in enumerate(SKILLS):
+        level, xp = batched.get_skill_info(skill_id)
+        print(f"  {name}: Lv {level} ({xp} XP)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Build the content pack for The Land RPG
+
+Compiles the human-editable JSON sources in content/ (items, loot tables, entity
+types and placements) into the binary pack the game memory-maps at startup.
+
+Usage:
+    python scripts/build_content.py [--source content] [--output assets/content.pack]
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import AssetPaths  # noqa: E402
+from src.systems.content import EntityKind, NO_ITEM, NO_LOOT, write_pack  # noqa: E402
+
+
+def load_json(source_dir: str, name: str) -> dict:
+    """Load one JSON source file from the content directory"""
+    with open(os.path.join(source_dir, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_ids(records: list, what: str) -> list:
+    """
+    Sort records by ID and make sure IDs are unique and dense (0..n-1)
+
+    IDs are explicit in the sources so they stay stable across edits; the pack
+    stores records in ID order so lookups are a direct index.
+    """
+    records = sorted(records, key=lambda r: r["id"])
+    for expected, record in enumerate(records):
+        if record["id"] != expected:
+            raise SystemExit(f"{what} IDs must be unique and run 0..{len(records) - 1}; "
+                             f"missing or duplicate ID near {record['id']} ({record['name']})")
+    names = [r["name"] for r in records]
+    if len(set(names)) != len(names):
+        raise SystemExit(f"Duplicate {what} names")
+    return records
+
+
+def loot_entries(entries: list, item_ids: dict, table: str) -> list:
+    """Convert one list of loot table entries to (item_id, weight, min, max) rows"""
+    rows = []
+    for entry in entries:
+        item = entry.get("item")
+        if item is not None and item not in item_ids:
+            raise SystemExit(f"Loot table {table} drops unknown item {item!r}")
+        low = entry.get("min", 1)
+        high = entry.get("max", low)
+        if entry.get("weight", 1) < 0 or high < low:
+            raise SystemExit(f"Loot table {table} has an invalid weight or quantity for {item!r}")
+        rows.append((NO_ITEM if item is None else item_ids[item], entry.get("weight", 1), low, high))
+    return rows
+
+
+def build(source_dir: str, output: str) -> None:
+    """Compile the sources in source_dir into a pack at output"""
+    items = check_ids(load_json(source_dir, "items.json")["items"], "Item")
+    loot_tables = check_ids(load_json(source_dir, "loot.json")["loot_tables"], "Loot table")
+    entity_types = check_ids(load_json(source_dir, "entities.json")["entity_types"], "Entity type")
+    placements = load_json(source_dir, "spawns.json")["placements"]
+
+    item_ids = {item["name"]: item["id"] for item in items}
+    loot_ids = {table["name"]: table["id"] for table in loot_tables}
+    type_ids = {entity_type["name"]: entity_type["id"] for entity_type in entity_types}
+
+    item_rows = [(item["name"], item.get("stack_limit", 1)) for item in items]
+
+    loot_rows = []
+    for table in loot_tables:
+        guaranteed = loot_entries(table.get("guaranteed", []), item_ids, table["name"])
+        weighted = loot_entries(table.get("weighted", []), item_ids, table["name"])
+        if weighted and sum(row[1] for row in weighted) <= 0:
+            raise SystemExit(f"Loot table {table['name']} has no weight on its weighted entries")
+        loot_rows.append((table["name"], guaranteed, weighted))
+
+    entity_rows = []
+    for entity_type in entity_types:
+        loot = entity_type.get("loot")
+        if loot is not None and loot not in loot_ids:
+            raise SystemExit(f"Entity type {entity_type['name']} uses unknown loot table {loot!r}")
+        entity_rows.append((
+            entity_type["name"],
+            entity_type.get("sprite"),
+            entity_type.get("depleted_sprite"),
+            EntityKind[entity_type["kind"].upper()],
+            entity_type["size"],
+            entity_type.get("max_hp", 0),
+            entity_type.get("respawn_delay", 0),
+            entity_type.get("xp", 0),
+            NO_LOOT if loot is None else loot_ids[loot],
+        ))
+
+    placement_rows = []
+    for placement in placements:
+        if placement["type"] not in type_ids:
+            raise SystemExit(f"Placement uses unknown entity type {placement['type']!r}")
+        placement_rows.append((type_ids[placement["type"]], int(placement["x"]), int(placement["y"])))
+
+    write_pack(output, item_rows, entity_rows, placement_rows, loot_rows)
+    print(f"Wrote {output}: {len(item_rows)} items, {len(loot_rows)} loot tables, "
+          f"{len(entity_rows)} entity types, {len(placement_rows)} placements "
+          f"({os.path.getsize(output)} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile content/ sources into a content pack")
+    parser.add_argument("--source", default="content", help="directory with the JSON sources")
+    parser.add_argument("--output", default=AssetPaths.CONTENT_PACK, help="pack file to write")
+    args = parser.parse_args()
+    build(args.source, args.output)
+
+
+if __name__ == "__main__":
+    main()
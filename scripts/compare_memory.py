@@ -0,0 +1,62 @@
+"""
+Memory report comparison for The Land RPG
+
+Compares two JSON memory reports (written by F9 in game or by
+`python run_game.py --memory-report`) and prints the change in bytes per entity
+instance and in sprite memory per source, flagging growth above a threshold.
+
+Usage:
+    python scripts/compare_memory.py OLD.json NEW.json [--threshold PERCENT]
+"""
+import argparse
+import json
+import sys
+from typing import Dict, Tuple
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(title: str, old: Dict[str, int], new: Dict[str, int], threshold: float) -> int:
+    """Print one comparison table and return the number of regressions"""
+    regressions = 0
+    print(f"\n  {title:<44} {'old':>12} {'new':>12} {'change':>8}")
+    for name in sorted(old.keys() | new.keys()):
+        before, after = old.get(name, 0), new.get(name, 0)
+        change = (after - before) / before * 100 if before else (100.0 if after else 0.0)
+        flag = ""
+        if change > threshold:
+            flag = "  <-- grew"
+            regressions += 1
+        print(f"  {name:<44} {before:>12,} {after:>12,} {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def summarize(report: dict) -> Tuple[Dict[str, int], Dict[str, int]]:
+    entities = {row["class"]: row["bytes_per_instance"] for row in report["entities"]}
+    sprites = {row["source"]: row["bytes"] for row in report["sprites"]}
+    return entities, sprites
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two memory reports")
+    parser.add_argument("old", help="baseline report")
+    parser.add_argument("new", help="report to check")
+    parser.add_argument("--threshold", type=float, default=5.0,
+                        help="percent growth reported as a regression")
+    args = parser.parse_args()
+
+    old_entities, old_sprites = summarize(load(args.old))
+    new_entities, new_sprites = summarize(load(args.new))
+
+    regressions = compare("bytes per instance", old_entities, new_entities, args.threshold)
+    regressions += compare("sprite bytes", old_sprites, new_sprites, args.threshold)
+
+    print(f"\n{regressions} regression(s) over {args.threshold:g}%")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
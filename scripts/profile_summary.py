@@ -0,0 +1,33 @@
+"""
+Profile capture summary for The Land RPG
+
+Prints the functions with the highest cumulative time in one or more .pstats
+captures (written by F10/F11 in game or by `python run_game.py --profile N`).
+Several captures are merged into one summary.
+
+Usage:
+    python scripts/profile_summary.py CAPTURE.pstats [MORE.pstats ...] [--limit N]
+"""
+import argparse
+import os
+import pstats
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import DiagnosticsSettings  # noqa: E402
+from src.diagnostics.profiler import print_summary  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize cProfile captures")
+    parser.add_argument("captures", nargs="+", help=".pstats files to summarize")
+    parser.add_argument("--limit", type=int, default=DiagnosticsSettings.PROFILE_SUMMARY_LINES,
+                        help="number of functions to list")
+    args = parser.parse_args()
+
+    print_summary(pstats.Stats(*args.captures), args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,9 +26,11 @@ class Colors:
     WHITE: Tuple[int, int, int] = (255, 255, 255)
     GREEN: Tuple[int, int, int] = (0, 200, 0)
     BROWN: Tuple[int, int, int] = (139, 69, 19)
+    LIGHT_BROWN: Tuple[int, int, int] = (181, 128, 72)
     RED: Tuple[int, int, int] = (200, 0, 0)
     GRAY: Tuple[int, int, int] = (128, 128, 128)
     LIGHT_GRAY: Tuple[int, int, int] = (200, 200, 200)
+    GOLD: Tuple[int, int, int] = (255, 215, 0)
 
 
 # ============================================================================
@@ -36,34 +38,178 @@ class Colors:
 # ============================================================================
 
 class GameBalance:
-    """Game balance constants for entities and systems"""
+    """
+    Game balance constants for entities and systems
+
+    Entity stats here are defaults; entities spawned from the content pack use
+    the values in their compiled definitions instead.
+    """
 
     # Player settings
     PLAYER_SIZE = 30
-    PLAYER_SPEED = 3
+    PLAYER_SPEED = 0.18  # pixels per millisecond (3 per frame at 60 FPS)
+    MOVEMENT_MAX_STEP_MS = 100  # longest frame time movement advances by in one step
     PLAYER_ATTACK_DAMAGE = 10
-    PLAYER_ATTACK_DELAY = 60  # frames between attacks (1 second at 60 FPS)
+    PLAYER_ATTACK_DELAY = 2  # game ticks between attacks (1.2 seconds)
 
     # Tree settings
     TREE_SIZE = 40
-    TREE_RESPAWN_DELAY = 300  # frames (5 seconds at 60 FPS)
+    TREE_RESPAWN_DELAY = 5000  # milliseconds
     TREE_XP_PER_LOG = 25
 
     # Enemy settings
     ENEMY_SIZE = 35
     ENEMY_MAX_HP = 100
-    ENEMY_RESPAWN_DELAY = 600  # frames (10 seconds at 60 FPS)
+    ENEMY_RESPAWN_DELAY = 10000  # milliseconds
     ENEMY_XP_PER_KILL = 50
 
+    # Inventory settings
+    INVENTORY_SLOTS = 28
+    DEFAULT_STACK_LIMIT = 1000  # per-slot limit for items without one in the content pack
+    BANK_SLOTS = 400
+    BANK_STACK_LIMIT = 2_147_483_647  # everything stacks in the bank
+
     # XP System settings
-    XP_PER_LEVEL = 100  # XP required per level (level = xp // 100 + 1)
+    MAX_LEVEL = 120  # Levels follow a RuneScape-style curve (level 99 at ~13M XP)
 
     # UI settings
     INVENTORY_PANEL_WIDTH = 400
     INVENTORY_PANEL_HEIGHT = 400
+    INVENTORY_COLUMNS = 7
     HP_BAR_HEIGHT = 5
 
 
+# ============================================================================
+# Simulation
+# ============================================================================
+
+class SimulationSettings:
+    """Game loop and simulation settings"""
+
+    GAME_TICK_MS = 600  # actions (chop, attack, respawn) resolve once per game tick
+    MAX_CATCHUP_TICKS = 5  # ticks resolved at most per frame after a stall
+    TICK_STATS_WINDOW = 100  # recent ticks kept for processing time stats
+
+    EVENT_QUEUE_CAPACITY = 1024  # event records preallocated per queue
+    EVENT_MAX_CASCADE = 8  # follow-up batches delivered per dispatch (events emitted by listeners)
+
+    LOOT_SIMULATION_BATCH = 1 << 20  # rolls drawn per NumPy batch when simulating drop rates
+
+    # Simulation level of detail: how often trees and enemies update, by distance from the player
+    LOD_NEAR_RADIUS = 640  # pixels; updated every frame (covers the whole screen)
+    LOD_ACTIVE_RADIUS = 2048  # pixels; beyond this entities are frozen until the player returns
+    LOD_FAR_INTERVAL = 4  # frames between updates of entities between the two radii
+
+
+# ============================================================================
+# World Generation
+# ============================================================================
+
+class WorldSettings:
+    """Procedural world generation settings"""
+
+    SEED = 20240611  # default world seed (override with --seed)
+    CHUNK_SIZE = 512  # pixels per side of a generated world chunk
+    GENERATION_RADIUS = 2  # chunks generated in every direction around the player
+    UNLOAD_RADIUS = 4  # generated chunks further than this from the player are unloaded
+    CHUNKS_PER_FRAME = 2  # finished chunks spawned into the game per frame at most
+    CLEAR_RADIUS = 450  # pixels around the start kept free for the hand-placed spawns
+
+    # Trees: one candidate per tree cell, kept with a chance set by the forest field
+    TREE_CELL = 64  # pixels; trees are TREE_SIZE wide, so jitter keeps them apart
+    TREE_JITTER = 12  # max offset from the cell center in pixels
+    TREE_MAX_DENSITY = 0.85  # chance of a tree in the densest forest
+    FOREST_FREQUENCY = 1 / 1500  # lattice points per pixel of the forest field's base octave
+    FOREST_OCTAVES = 3
+    FOREST_THRESHOLD = 0.45  # forest density below which no trees grow
+
+    # Enemies: one candidate per enemy cell, more likely away from forest
+    ENEMY_CELL = 256
+    ENEMY_JITTER = 96
+    ENEMY_CHANCE = 0.5  # chance of a spawn in a cell with no forest at all
+
+    # Content types the generator places (names from content/entities.json)
+    TREE_TYPE = "tree"
+    ENEMY_TYPE = "goblin"
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+class RenderSettings:
+    """Rendering and surface caching settings"""
+
+    STATIC_CHUNK_SIZE = 256  # pixels per side of a cached static layer chunk
+    STATIC_CHUNK_CACHE = 64  # baked chunks kept (least recently drawn are re-baked later)
+
+    # Background sprite loading
+    SPRITE_LOADER_THREADS = 2  # threads decoding and scaling sprite files
+    SPRITE_INSTALLS_PER_FRAME = 32  # decoded sprites swapped in per frame at most
+    SPRITE_LATENCY_WINDOW = 256  # recent loads kept for latency stats
+
+    # Particles (hit splats, floating XP text, wood chips)
+    PARTICLE_CAPACITY = 4096  # live particles at most; allocated once at startup
+    PARTICLE_FONT_SIZE = 22
+    PARTICLE_GRAVITY = 600  # pixels per second^2
+    FLOATING_TEXT_SPEED = 40  # pixels per second upwards
+    FLOATING_TEXT_LIFETIME_MS = 1200
+    HIT_SPLAT_SIZE = 24
+    HIT_SPLAT_MAX_VALUE = 99  # splats are pre-rendered for damage 0..this
+    HIT_SPLAT_LIFETIME_MS = 600
+    WOOD_CHIP_COUNT = 8
+    WOOD_CHIP_SIZE = 4
+    WOOD_CHIP_SPEED = 150  # pixels per second
+    WOOD_CHIP_LIFETIME_MS = 500
+
+
+class PacingSettings:
+    """Adaptive frame rate settings (see src/rendering/pacing.py)"""
+
+    BACKGROUND_FPS = 10  # frame rate while the window is unfocused or minimized
+    IDLE_DELAY_MS = 1000  # time with nothing changing before the loop goes idle
+    IDLE_WAKE_MS = 500  # longest idle wait for input before drawing a frame anyway
+
+
+class ResolutionSettings:
+    """Window size and internal render resolution (see src/rendering/resolution.py)"""
+
+    WINDOW_SCALE = 1.0  # window size as a multiple of SCREEN_WIDTH x SCREEN_HEIGHT
+    RENDER_SCALE = 1.0  # world render resolution as a fraction of SCREEN_WIDTH x SCREEN_HEIGHT
+    SCALE2X = False  # present exact 2x upscales with scale2x (smoother edges, but slower than scale)
+
+    # Dynamic resolution: lower the render scale while frames run over budget
+    DYNAMIC = False
+    SCALE_STEPS = (1.0, 0.75, 0.5)  # render scales dynamic resolution moves between
+    FRAME_BUDGET_MS = 1000 / FPS  # update + draw time per frame to stay under
+    HEADROOM = 0.6  # raise the scale again once frames take less than this share of the budget
+    SAMPLE_FRAMES = 30  # frames averaged before each decision
+
+
+# ============================================================================
+# Diagnostics
+# ============================================================================
+
+class DiagnosticsSettings:
+    """Debug reporting settings"""
+
+    REPORT_DIR = "diagnostics"  # reports are written here, one timestamped file each
+
+    # Memory report (F9 in game, or --memory-report)
+    MEMORY_REPORT_FRAMES = 300  # frames between the two tracemalloc snapshots
+    MEMORY_TOP_ALLOCATIONS = 15  # allocation sites listed in the report
+    MEMORY_TRACEBACK_DEPTH = 1  # frames kept per allocation by tracemalloc
+
+    # Headless runs (--headless, --memory-report, --profile)
+    HEADLESS_FRAMES = 300
+
+    # Profiling (F10 in game, or --profile N / --profile-budget MS)
+    PROFILE_CAPTURE_FRAMES = 120  # frames in one requested capture
+    FRAME_BUDGET_MS = 1000 / FPS  # frames slower than this trigger an automatic capture
+    PROFILE_WINDOW_FRAMES = 10  # recent frames saved with an automatic capture
+    PROFILE_SUMMARY_LINES = 15  # functions listed by a capture summary
+
+
 # ============================================================================
 # Asset Paths
 # ============================================================================
@@ -76,3 +222,6 @@ class AssetPaths:
     TREE_ACTIVE_SPRITE = "assets/sprites/tree_active.png"
     TREE_CHOPPED_SPRITE = "assets/sprites/tree_chopped.png"
     ENEMY_SPRITE = "assets/sprites/enemy.png"
+
+    # Compiled content pack (built from content/ by scripts/build_content.py)
+    CONTENT_PACK = "assets/content.pack"
@@ -0,0 +1 @@
+# Debug diagnostics (memory reports, profiling)
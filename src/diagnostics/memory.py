@@ -0,0 +1,310 @@
+"""
+Memory Report - Entity, sprite and allocation accounting
+
+Builds a report of how much memory the game is using and where it is growing:
+instance counts and approximate bytes per instance for each entity class, surface
+bytes grouped by sprite source, and the top allocation sites from two tracemalloc
+snapshots taken N frames apart. Reports print as tables and are saved as JSON so
+two builds can be compared.
+"""
+from collections import deque
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import array
+import json
+import os
+import platform
+import sys
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from src.config import DiagnosticsSettings
+from src.entities.base import Entity
+from src.rendering.sprites import cached_sprites, load_stats
+
+# Never counted towards an instance: shared constants, surfaces (reported as
+# sprites), modules and other entities it merely points at
+_SKIPPED_TYPES = (str, bytes, pygame.Surface, ModuleType, Entity)
+
+
+class AllocationTracker:
+    """Diffs tracemalloc snapshots taken a number of frames apart"""
+
+    def __init__(self, frames: int = DiagnosticsSettings.MEMORY_REPORT_FRAMES,
+                 top: int = DiagnosticsSettings.MEMORY_TOP_ALLOCATIONS) -> None:
+        """
+        Initialize tracker (call start() to take the first snapshot)
+
+        Args:
+            frames: Frames to run between the two snapshots
+            top: Number of allocation sites to report
+        """
+        self.frames = frames
+        self.top = top
+        self.frames_left = frames
+        self.traced_memory: Tuple[int, int] = (0, 0)  # (current, peak) bytes at the end
+        self._started_tracing = False
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._after: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        """Start tracing (if not already on) and take the first snapshot"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(DiagnosticsSettings.MEMORY_TRACEBACK_DEPTH)
+            self._started_tracing = True
+        self._before = _snapshot()
+
+    def tick(self) -> bool:
+        """
+        Count one finished frame, taking the second snapshot after the last one
+
+        Returns:
+            True once all frames have run and the results are ready
+        """
+        if self._after is not None:
+            return True
+
+        self.frames_left -= 1
+        if self.frames_left > 0:
+            return False
+
+        self._after = _snapshot()
+        self.traced_memory = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+        return True
+
+    def results(self) -> List[Dict[str, Any]]:
+        """
+        Get the allocation sites whose memory grew the most between snapshots
+
+        Returns:
+            One dict per site with its location, size and block count deltas
+        """
+        if self._before is None or self._after is None:
+            return []
+
+        stats = self._after.compare_to(self._before, "lineno")
+        return [
+            {
+                "site": _site(stat.traceback[0]),
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size": stat.size,
+            }
+            for stat in stats[:self.top]
+        ]
+
+
+def entity_memory(entities: Iterable[Entity], shared: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+    """
+    Count entities and estimate their memory per class
+
+    An instance's size is the object, its attribute dict and every container or
+    array it owns. Objects in shared (game-wide systems an entity points at),
+    strings, surfaces and other entities are not counted.
+
+    Args:
+        entities: Entities to measure
+        shared: Objects to leave out of every instance's size
+
+    Returns:
+        One dict per class with count, mean bytes per instance and total bytes
+    """
+    shared_ids = {id(obj) for obj in shared}
+    totals: Dict[str, List[int]] = {}
+    for entity in entities:
+        seen = set(shared_ids)
+        seen.add(id(entity))
+        size = sys.getsizeof(entity) + _owned_size(vars(entity), seen)
+        totals.setdefault(type(entity).__name__, []).append(size)
+
+    return [
+        {
+            "class": name,
+            "count": len(sizes),
+            "bytes_per_instance": sum(sizes) // len(sizes),
+            "total_bytes": sum(sizes),
+        }
+        for name, sizes in sorted(totals.items())
+    ]
+
+
+def sprite_memory(extra: Optional[Dict[str, Iterable[pygame.Surface]]] = None) -> List[Dict[str, Any]]:
+    """
+    Sum surface pixel memory by source
+
+    Args:
+        extra: Other surface pools to report, keyed by a label
+
+    Returns:
+        One dict per sprite path (and extra label) with surface count and bytes,
+        largest first
+    """
+    sources: Dict[str, List[int]] = {}
+    for path, sprite in cached_sprites():
+        sources.setdefault(path, []).append(surface_bytes(sprite))
+    for label, surfaces in (extra or {}).items():
+        sources.setdefault(label, []).extend(surface_bytes(surface) for surface in surfaces)
+
+    rows = [
+        {"source": source, "surfaces": len(sizes), "bytes": sum(sizes)}
+        for source, sizes in sources.items()
+    ]
+    rows.sort(key=lambda row: row["bytes"], reverse=True)
+    return rows
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Get the pixel memory of a surface
+
+    Args:
+        surface: Pygame surface
+
+    Returns:
+        Bytes used by the surface's pixel rows (including row padding)
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+def build_report(entities: Iterable[Entity], shared: Iterable[Any] = (),
+                 surfaces: Optional[Dict[str, Iterable[pygame.Surface]]] = None,
+                 tracker: Optional[AllocationTracker] = None) -> Dict[str, Any]:
+    """
+    Build a full memory report
+
+    Args:
+        entities: Entities to measure
+        shared: Game-wide objects left out of entity sizes
+        surfaces: Surface pools reported next to the sprite cache, keyed by a label
+        tracker: Finished allocation tracker (allocations are left empty if None)
+
+    Returns:
+        JSON-serializable report dict
+    """
+    if tracker is not None:
+        current, peak = tracker.traced_memory
+    else:
+        current, peak = tracemalloc.get_traced_memory()
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": tracker.frames if tracker is not None else 0,
+        "entities": entity_memory(entities, shared),
+        "sprites": sprite_memory(surfaces),
+        "sprite_loader": load_stats(),
+        "allocations": tracker.results() if tracker is not None else [],
+        "traced_memory": {"current": current, "peak": peak},
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """
+    Print a memory report as tables on stdout
+
+    Args:
+        report: Report from build_report()
+    """
+    print(f"Memory report ({report['timestamp']})")
+
+    print(f"\n  {'entity class':<20} {'count':>8} {'bytes/inst':>12} {'total':>12}")
+    for row in report["entities"]:
+        print(f"  {row['class']:<20} {row['count']:>8} {row['bytes_per_instance']:>12,} "
+              f"{row['total_bytes']:>12,}")
+
+    print(f"\n  {'sprite source':<44} {'surfaces':>8} {'bytes':>12}")
+    for row in report["sprites"]:
+        print(f"  {row['source']:<44} {row['surfaces']:>8} {row['bytes']:>12,}")
+    total = sum(row["bytes"] for row in report["sprites"])
+    print(f"  {'total':<44} {'':>8} {total:>12,}")
+
+    loader = report["sprite_loader"]
+    print(f"  loader: {loader['pending']} pending, {loader['loaded']} loaded "
+          f"({loader['failed']} failed), latency mean {loader['latency_mean_ms']:.1f} ms, "
+          f"max {loader['latency_max_ms']:.1f} ms")
+
+    if report["allocations"]:
+        print(f"\n  top allocation sites over {report['frames']} frames")
+        print(f"  {'site':<52} {'size diff':>12} {'blocks':>8}")
+        for row in report["allocations"]:
+            print(f"  {_shorten(row['site'], 52):<52} {row['size_diff']:>+12,} "
+                  f"{row['count_diff']:>+8,}")
+
+
+def write_report(report: Dict[str, Any], directory: str = DiagnosticsSettings.REPORT_DIR) -> str:
+    """
+    Save a memory report as a timestamped JSON file
+
+    Args:
+        report: Report from build_report()
+        directory: Directory to write into (created if missing)
+
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"memory-{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Take a tracemalloc snapshot without tracemalloc's and the importer's own frames"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+
+def _owned_size(obj: Any, seen: Set[int]) -> int:
+    """
+    Size of an object and everything it owns, skipping objects already seen
+
+    Args:
+        obj: Object to measure
+        seen: IDs of objects already counted or excluded (updated in place)
+
+    Returns:
+        Size in bytes
+    """
+    if obj is None or id(obj) in seen or isinstance(obj, _SKIPPED_TYPES) or callable(obj):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        # getsizeof already includes the data of arrays that own it
+        return size
+    if isinstance(obj, array.array):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(_owned_size(key, seen) + _owned_size(value, seen)
+                          for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return size + sum(_owned_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += _owned_size(vars(obj), seen)
+    for name in getattr(type(obj), "__slots__", ()):
+        size += _owned_size(getattr(obj, name, None), seen)
+    return size
+
+
+def _site(frame: tracemalloc.Frame) -> str:
+    """Format an allocation site, relative to the working directory when inside it"""
+    filename = frame.filename
+    if os.path.isabs(filename) and filename.startswith(os.getcwd() + os.sep):
+        filename = os.path.relpath(filename)
+    return f"{filename}:{frame.lineno}"
+
+
+def _shorten(text: str, width: int) -> str:
+    """Trim text from the left to fit a column"""
+    return text if len(text) <= width else "..." + text[-(width - 3):]
@@ -0,0 +1,196 @@
+"""
+Frame Profiler - On-demand cProfile captures of selected frames
+
+Wraps frames of the game loop in cProfile, either for the next N frames on request
+or automatically when a single frame goes over a time budget. For automatic
+captures each recent frame is profiled separately in a small ring, so a slow frame
+is saved together with the frames that led up to it. Every capture is written to
+its own timestamped .pstats file.
+"""
+from datetime import datetime
+from typing import List, Optional, Union
+import cProfile
+import os
+import pstats
+import time
+
+from src.config import DiagnosticsSettings
+
+
+class FrameProfiler:
+    """Profiles requested frame ranges and frames over a time budget"""
+
+    def __init__(self, budget_ms: Optional[float] = None,
+                 window: int = DiagnosticsSettings.PROFILE_WINDOW_FRAMES,
+                 directory: str = DiagnosticsSettings.REPORT_DIR) -> None:
+        """
+        Initialize profiler (idle until capture() is called or a budget is set)
+
+        Args:
+            budget_ms: Frame time that triggers an automatic capture (None = off)
+            window: Recent frames kept and saved with an automatic capture
+            directory: Directory capture files are written to
+        """
+        self.directory = directory
+        self.window = window
+        self.budget_ms: Optional[float] = None
+        self.last_frame_ms = 0.0
+
+        # Requested capture: one profile spanning the next frames_left frames
+        self._capture: Optional[cProfile.Profile] = None
+        self._capture_frames = 0
+        self.frames_left = 0
+
+        # Automatic capture: one profile per recent frame, reused round-robin
+        self._ring: List[cProfile.Profile] = []
+        self._ring_index = 0
+        self._ring_filled = 0
+        self._cooldown = 0  # frames until the next automatic capture is allowed
+
+        # Profile enabled by begin_frame(), if any; end_frame() only finishes a
+        # frame that begin_frame() started
+        self._frame_profile: Optional[cProfile.Profile] = None
+        self._frame_open = False
+        self._frame_start = 0.0
+        self.captures: List[str] = []  # Paths of files written so far
+        self.set_budget(budget_ms)
+
+    def set_budget(self, budget_ms: Optional[float]) -> None:
+        """
+        Turn automatic capture on or off
+
+        Every frame is profiled while it is on, which slows the game down.
+
+        Args:
+            budget_ms: Frame time that triggers a capture, or None to turn it off
+        """
+        self.budget_ms = budget_ms
+        self._ring = [cProfile.Profile() for _ in range(self.window)] if budget_ms is not None else []
+        self._ring_index = 0
+        self._ring_filled = 0
+        self._cooldown = 0
+
+    def capture(self, frames: int = DiagnosticsSettings.PROFILE_CAPTURE_FRAMES) -> None:
+        """
+        Profile the next frames frames into one capture file
+
+        Args:
+            frames: Number of frames to profile
+        """
+        if self._capture is not None:
+            return
+        self._capture = cProfile.Profile()
+        self._capture_frames = frames
+        self.frames_left = frames
+
+    @property
+    def active(self) -> bool:
+        """Whether any frames are being profiled (requested or automatic)"""
+        return self._capture is not None or self.budget_ms is not None
+
+    @property
+    def capturing(self) -> bool:
+        """Whether a requested capture is in progress"""
+        return self._capture is not None
+
+    def begin_frame(self) -> None:
+        """Start timing (and profiling, if active) a frame"""
+        profile = None
+        if self._capture is not None:
+            profile = self._capture
+        elif self._ring:
+            profile = self._ring[self._ring_index]
+            profile.clear()
+        if profile is not None:
+            profile.enable()
+        self._frame_profile = profile
+        self._frame_open = True
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> Optional[str]:
+        """
+        Finish the current frame and write a capture if one is complete
+
+        A capture requested or a budget set partway through a frame starts with
+        the next frame.
+
+        Returns:
+            Path of the capture file written this frame, or None
+        """
+        if not self._frame_open:
+            # Created partway through a frame; there is nothing to finish yet
+            return None
+        self._frame_open = False
+        self.last_frame_ms = (time.perf_counter() - self._frame_start) * 1000
+
+        profile, self._frame_profile = self._frame_profile, None
+        if profile is not None:
+            profile.disable()
+
+        if self._capture is not None:
+            if profile is not self._capture:
+                return None
+            self.frames_left -= 1
+            if self.frames_left > 0:
+                return None
+            profile, self._capture = self._capture, None
+            return self._save([profile], f"frames{self._capture_frames}")
+
+        if not self._ring or profile is not self._ring[self._ring_index]:
+            return None
+
+        self._ring_index = (self._ring_index + 1) % self.window
+        self._ring_filled = min(self._ring_filled + 1, self.window)
+        if self._cooldown:
+            self._cooldown -= 1
+            return None
+        if self.last_frame_ms <= self.budget_ms:
+            return None
+
+        # Save the slow frame and the ones before it, then wait for a fresh window
+        # so a run of slow frames does not write a file every frame
+        profiles = [self._ring[(self._ring_index - 1 - i) % self.window]
+                    for i in range(self._ring_filled)]
+        self._ring_filled = 0
+        self._cooldown = self.window
+        return self._save(profiles, f"spike{self.last_frame_ms:.0f}ms")
+
+    def _save(self, profiles: List[cProfile.Profile], label: str) -> Optional[str]:
+        """
+        Merge profiles and write them to a timestamped .pstats file
+
+        Args:
+            profiles: Profiles to merge into one capture
+            label: Short description added to the file name
+
+        Returns:
+            Path of the written file, or None if no profile recorded any calls
+        """
+        # pstats cannot load a profile that never recorded a call
+        profiles = [profile for profile in profiles if profile.getstats()]
+        if not profiles:
+            return None
+
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(self.directory, f"profile-{stamp}-{label}.pstats")
+        stats.dump_stats(path)
+        self.captures.append(path)
+        return path
+
+
+def print_summary(capture: Union[str, pstats.Stats],
+                  limit: int = DiagnosticsSettings.PROFILE_SUMMARY_LINES) -> None:
+    """
+    Print the functions with the highest cumulative time in a capture
+
+    Args:
+        capture: Path of a .pstats file, or loaded stats
+        limit: Number of functions to list
+    """
+    stats = capture if isinstance(capture, pstats.Stats) else pstats.Stats(capture)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
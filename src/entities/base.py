@@ -5,9 +5,10 @@ This abstract base class provides shared functionality for Player, Tree, and Ene
 eliminating code duplication and ensuring consistent interface.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import pygame
-import os
+
+from src.rendering.sprites import get_sprite
 
 
 class Entity(ABC):
@@ -25,7 +26,10 @@ class Entity(ABC):
         self.x = x
         self.y = y
         self.size = size
-        self.sprite: Optional[pygame.Surface] = None
+        self.sprite_path: Optional[str] = None
+
+        # Called when the entity's appearance changes (used by render caches)
+        self.on_state_change: Optional[Callable[['Entity'], None]] = None
 
     def get_rect(self) -> pygame.Rect:
         """
@@ -41,31 +45,94 @@ class Entity(ABC):
             self.size
         )
 
+    @property
+    def sprite(self) -> Optional[pygame.Surface]:
+        """
+        Current sprite, decoded on first access
+
+        Returns:
+            Sprite scaled to entity size, or None if none is set or it failed to load
+        """
+        if self.sprite_path is None:
+            return None
+        return get_sprite(self.sprite_path, self.size)
+
+    def sprite_at(self, scale: float) -> Optional[pygame.Surface]:
+        """
+        Current sprite for a surface drawn at a scale
+
+        Args:
+            scale: Surface pixels per world pixel
+
+        Returns:
+            Sprite scaled to the entity's size on that surface, or None (see sprite)
+        """
+        if scale == 1.0:
+            return self.sprite
+        if self.sprite_path is None:
+            return None
+        return get_sprite(self.sprite_path, max(1, round(self.size * scale)))
+
+    def screen_rect(self, offset: Tuple[int, int], scale: float = 1.0) -> pygame.Rect:
+        """
+        Get the entity's rectangle on a surface
+
+        Args:
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel
+
+        Returns:
+            pygame.Rect the entity covers on the surface
+        """
+        if scale == 1.0:
+            return self.get_rect().move(-offset[0], -offset[1])
+        size = max(1, round(self.size * scale))
+        return pygame.Rect(
+            round((self.x - offset[0]) * scale) - size // 2,
+            round((self.y - offset[1]) * scale) - size // 2,
+            size,
+            size
+        )
+
     def load_sprite(self, path: str, fallback_color: Tuple[int, int, int]) -> None:
         """
-        Load sprite from file with graceful fallback to colored square
+        Set sprite file with graceful fallback to colored square
+
+        The file is not decoded here; decoding is deferred until the sprite is
+        first drawn so that creating entities stays cheap.
 
         Args:
             path: Path to sprite image file
             fallback_color: RGB color tuple to use if sprite fails to load
         """
-        if os.path.exists(path):
-            try:
-                self.sprite = pygame.image.load(path).convert_alpha()
-                # Scale sprite to entity size
-                self.sprite = pygame.transform.scale(self.sprite, (self.size, self.size))
-            except pygame.error:
-                # If loading fails, sprite stays None (will use fallback)
-                self.sprite = None
-        # If file doesn't exist or loading failed, sprite remains None
+        self.sprite_path = path
+        # If the file doesn't exist or loading fails, sprite will be None
         # Subclasses will handle fallback rendering
 
+    def _notify_state_change(self) -> None:
+        """Notify the registered listener (if any) that this entity changed appearance"""
+        if self.on_state_change:
+            self.on_state_change(self)
+
     @abstractmethod
-    def update(self) -> None:
-        """Update entity state - must be implemented by subclasses"""
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Update entity state - must be implemented by subclasses
+
+        Args:
+            elapsed_ms: Game time since the previous update in milliseconds
+        """
         pass
 
     @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw entity to screen - must be implemented by subclasses"""
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
+        """
+        Draw entity to screen - must be implemented by subclasses
+
+        Args:
+            screen: Pygame surface to draw on
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel (below 1 for a reduced render resolution)
+        """
         pass
@@ -3,27 +3,43 @@ Enemy Entity - Hostile creature that can be attacked for Combat XP
 
 Enemies have HP, can be defeated, and respawn after a delay.
 """
+from typing import TYPE_CHECKING, Optional, Tuple
 import pygame
 
 from src.entities.base import Entity
 from src.config import GameBalance, Colors, AssetPaths
 
+if TYPE_CHECKING:
+    from src.systems.content import EntityDef
+    from src.systems.loot import LootTable
+
 
 class Enemy(Entity):
     """Enemy entity that can be attacked"""
 
-    def __init__(self, x: float, y: float) -> None:
+    def __init__(self, x: float, y: float, definition: Optional['EntityDef'] = None,
+                 loot: Optional['LootTable'] = None) -> None:
         """
         Initialize enemy at position
 
         Args:
             x: X coordinate
             y: Y coordinate
+            definition: Entity type from the content pack (default: GameBalance values)
+            loot: Loot table rolled when defeated (None for no items)
         """
-        super().__init__(x, y, GameBalance.ENEMY_SIZE)
+        super().__init__(x, y, definition.size if definition else GameBalance.ENEMY_SIZE)
 
         # Combat stats
-        self.max_hp = GameBalance.ENEMY_MAX_HP
+        if definition:
+            self.max_hp = definition.max_hp
+            self.respawn_delay = definition.respawn_delay
+            self.xp_reward = definition.xp
+        else:
+            self.max_hp = GameBalance.ENEMY_MAX_HP
+            self.respawn_delay = GameBalance.ENEMY_RESPAWN_DELAY
+            self.xp_reward = GameBalance.ENEMY_XP_PER_KILL
+        self.loot = loot
         self.hp = self.max_hp
         self.alive = True
 
@@ -31,7 +47,8 @@ class Enemy(Entity):
         self.respawn_timer = 0
 
         # Load sprite with fallback to red square
-        self.load_sprite(AssetPaths.ENEMY_SPRITE, Colors.RED)
+        sprite_path = definition.sprite if definition and definition.sprite else AssetPaths.ENEMY_SPRITE
+        self.load_sprite(sprite_path, Colors.RED)
 
     def take_damage(self, damage: int) -> bool:
         """
@@ -46,52 +63,82 @@ class Enemy(Entity):
         self.hp -= damage
 
         if self.hp <= 0:
-            self.hp = 0
-            self.alive = False
-            self.respawn_timer = GameBalance.ENEMY_RESPAWN_DELAY
+            self.deplete(self.respawn_delay)
             return True  # Defeated
 
         return False
 
-    def update(self) -> None:
-        """Update enemy state and handle respawning"""
-        if not self.alive:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.alive = True
-                self.hp = self.max_hp
+    def deplete(self, respawn_ms: float) -> None:
+        """
+        Put the enemy in its defeated state
+
+        Args:
+            respawn_ms: Game time in milliseconds until it respawns
+        """
+        self.hp = 0
+        self.alive = False
+        self.respawn_timer = respawn_ms
+
+    @property
+    def respawn_due(self) -> bool:
+        """True once a defeated enemy's respawn timer has run out"""
+        return not self.alive and self.respawn_timer <= 0
+
+    def respawn(self) -> None:
+        """Bring the enemy back with full HP"""
+        self.alive = True
+        self.hp = self.max_hp
+        self.respawn_timer = 0
+
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Count down the respawn timer
+
+        The respawn itself happens on the next game tick once respawn_due is set.
+
+        Args:
+            elapsed_ms: Game time since the previous update in milliseconds
+        """
+        if not self.alive and self.respawn_timer > 0:
+            self.respawn_timer -= elapsed_ms
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
         """
         Draw enemy to screen with HP bar
 
         Args:
             screen: Pygame surface to draw on
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel
         """
         if not self.alive:
             return
 
         # Draw sprite or fallback to red square
-        if self.sprite:
-            sprite_rect = self.sprite.get_rect(center=(self.x, self.y))
-            screen.blit(self.sprite, sprite_rect)
+        rect = self.screen_rect(offset, scale)
+        sprite = self.sprite_at(scale)
+        if sprite:
+            screen.blit(sprite, rect)
         else:
-            pygame.draw.rect(screen, Colors.RED, self.get_rect())
+            pygame.draw.rect(screen, Colors.RED, rect)
 
         # Draw HP bar
-        self._draw_hp_bar(screen)
+        self._draw_hp_bar(screen, rect, scale)
 
-    def _draw_hp_bar(self, screen: pygame.Surface) -> None:
+    def _draw_hp_bar(self, screen: pygame.Surface, rect: pygame.Rect, scale: float) -> None:
         """
         Draw HP bar above enemy
 
         Args:
             screen: Pygame surface to draw on
+            rect: Enemy's rectangle on the surface
+            scale: Surface pixels per world pixel
         """
-        bar_width = self.size
-        bar_height = GameBalance.HP_BAR_HEIGHT
-        bar_x = self.x - bar_width // 2
-        bar_y = self.y - self.size // 2 - 10
+        bar_width = rect.width
+        bar_height = max(1, round(GameBalance.HP_BAR_HEIGHT * scale))
+        bar_x = rect.x
+        bar_y = rect.y - round(10 * scale)
 
         # Background (red - damage taken)
         pygame.draw.rect(screen, Colors.RED, (bar_x, bar_y, bar_width, bar_height))
@@ -3,13 +3,14 @@ Player Entity - Player character with movement, combat, and progression
 
 Manages player movement, combat mechanics, inventory, and skill progression.
 """
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 import pygame
-import math
 
 from src.entities.base import Entity
 from src.systems.xp_system import XPSystem
 from src.systems.inventory import Inventory
+from src.systems.events import EventBus, EventType
+from src.systems.movement import MovementSystem
 from src.config import GameBalance, Colors, AssetPaths
 
 if TYPE_CHECKING:
@@ -19,22 +20,28 @@ if TYPE_CHECKING:
 class Player(Entity):
     """Player character with movement, stats, and combat abilities"""
 
-    def __init__(self, x: float, y: float) -> None:
+    def __init__(self, x: float, y: float, events: EventBus,
+                 movement: Optional[MovementSystem] = None) -> None:
         """
         Initialize player at position
 
         Args:
             x: Starting X coordinate
             y: Starting Y coordinate
+            events: Event bus the player's attacks are emitted on
+            movement: Shared movement system stepped by the game (default: a
+                private one stepped in update())
         """
-        super().__init__(x, y, GameBalance.PLAYER_SIZE)
-
-        # Movement
+        # Movement (position lives in the movement system's arrays)
+        self.movement = movement if movement is not None else MovementSystem(capacity=1)
+        self._owns_movement = movement is None
         self.speed = GameBalance.PLAYER_SPEED
-        self.target_x = x
-        self.target_y = y
+        self.mover = self.movement.add(x, y, self.speed)
+
+        super().__init__(x, y, GameBalance.PLAYER_SIZE)
 
         # Systems
+        self.events = events
         self.xp_system = XPSystem()
         self.inventory = Inventory()
 
@@ -45,6 +52,24 @@ class Player(Entity):
         # Load sprite with fallback to green square
         self.load_sprite(AssetPaths.PLAYER_SPRITE, Colors.GREEN)
 
+    @property
+    def x(self) -> float:
+        """X coordinate (center), read from the movement system"""
+        return float(self.movement.positions[self.mover, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self.movement.positions[self.mover, 0] = value
+
+    @property
+    def y(self) -> float:
+        """Y coordinate (center), read from the movement system"""
+        return float(self.movement.positions[self.mover, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self.movement.positions[self.mover, 1] = value
+
     def move_to(self, x: float, y: float) -> None:
         """
         Set movement target position
@@ -53,8 +78,7 @@ class Player(Entity):
             x: Target X coordinate
             y: Target Y coordinate
         """
-        self.target_x = x
-        self.target_y = y
+        self.movement.move_to(self.mover, x, y)
 
     def start_attack(self, enemy: 'Enemy') -> None:
         """
@@ -70,54 +94,65 @@ class Player(Entity):
         """Stop attacking current enemy"""
         self.attacking_enemy = None
 
-    def update(self) -> None:
-        """Update player position and combat state"""
-        self._update_movement()
-        self._update_combat()
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Update player position
 
-    def _update_movement(self) -> None:
-        """Update player movement towards target"""
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        dist = math.sqrt(dx**2 + dy**2)
+        Combat is resolved on game ticks through attack_tick() rather than here.
 
-        if dist > self.speed:
-            self.x += (dx / dist) * self.speed
-            self.y += (dy / dist) * self.speed
-        else:
-            self.x = self.target_x
-            self.y = self.target_y
+        Args:
+            elapsed_ms: Game time since the previous update in milliseconds
+        """
+        self._update_movement(elapsed_ms)
+
+    def _update_movement(self, elapsed_ms: float) -> None:
+        """Step movement towards target (only when not using a shared system)"""
+        if self._owns_movement:
+            self.movement.step(elapsed_ms)
+
+    def attack_tick(self, enemy: 'Enemy') -> bool:
+        """
+        Resolve one game tick of auto-attacking an enemy
 
-    def _update_combat(self) -> None:
-        """Handle auto-attack logic"""
-        if not self.attacking_enemy:
-            return
+        Args:
+            enemy: Enemy the attack action was queued against
+
+        Returns:
+            True if the player keeps attacking (the action should be queued again)
+        """
+        # Stop if the player switched targets or the enemy has been defeated
+        if self.attacking_enemy is not enemy or not enemy.alive:
+            if self.attacking_enemy is enemy:
+                self.attacking_enemy = None
+            return False
 
         # Count down attack cooldown
         if self.attack_cooldown > 0:
             self.attack_cooldown -= 1
-            return
+        if self.attack_cooldown > 0:
+            return True
 
-        # Attack the enemy
-        if self.attacking_enemy.take_damage(GameBalance.PLAYER_ATTACK_DAMAGE):
-            # Enemy defeated
-            self.xp_system.add_xp('Combat', GameBalance.ENEMY_XP_PER_KILL)
-            self.attacking_enemy = None
-        else:
-            # Reset cooldown for next attack
-            self.attack_cooldown = GameBalance.PLAYER_ATTACK_DELAY
+        # Attack the enemy (damage is applied at dispatch) and reset cooldown
+        self.events.emit(EventType.DAMAGE_DEALT, self, enemy,
+                         amount=GameBalance.PLAYER_ATTACK_DAMAGE)
+        self.attack_cooldown = GameBalance.PLAYER_ATTACK_DELAY
+        return True
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
         """
         Draw player to screen
 
         Args:
             screen: Pygame surface to draw on
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel
         """
-        if self.sprite:
+        rect = self.screen_rect(offset, scale)
+        sprite = self.sprite_at(scale)
+        if sprite:
             # Draw sprite centered on position
-            sprite_rect = self.sprite.get_rect(center=(self.x, self.y))
-            screen.blit(self.sprite, sprite_rect)
+            screen.blit(sprite, rect)
         else:
             # Fallback: draw green square
-            pygame.draw.rect(screen, Colors.GREEN, self.get_rect())
+            pygame.draw.rect(screen, Colors.GREEN, rect)
@@ -3,57 +3,64 @@ Tree Entity - Harvestable resource for Woodcutting skill
 
 Trees can be chopped for logs and XP, then respawn after a delay.
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 import pygame
 
 from src.entities.base import Entity
 from src.config import GameBalance, Colors, AssetPaths
+from src.systems.events import EventBus, EventType
+from src.systems.xp_system import SKILL_IDS
 
 if TYPE_CHECKING:
     from src.entities.player import Player
+    from src.systems.content import EntityDef
+    from src.systems.loot import LootTable
 
 
 class Tree(Entity):
     """Tree entity that can be chopped for logs"""
 
-    def __init__(self, x: float, y: float) -> None:
+    def __init__(self, x: float, y: float, definition: Optional['EntityDef'] = None,
+                 loot: Optional['LootTable'] = None) -> None:
         """
         Initialize tree at position
 
         Args:
             x: X coordinate
             y: Y coordinate
+            definition: Entity type from the content pack (default: GameBalance values)
+            loot: Loot table rolled when chopped (None for no items)
         """
-        super().__init__(x, y, GameBalance.TREE_SIZE)
+        super().__init__(x, y, definition.size if definition else GameBalance.TREE_SIZE)
+
+        # Stats
+        if definition:
+            self.respawn_delay = definition.respawn_delay
+            self.xp_reward = definition.xp
+            self.active_sprite_path = definition.sprite or AssetPaths.TREE_ACTIVE_SPRITE
+            self.chopped_sprite_path = definition.depleted_sprite or AssetPaths.TREE_CHOPPED_SPRITE
+        else:
+            self.respawn_delay = GameBalance.TREE_RESPAWN_DELAY
+            self.xp_reward = GameBalance.TREE_XP_PER_LOG
+            self.active_sprite_path = AssetPaths.TREE_ACTIVE_SPRITE
+            self.chopped_sprite_path = AssetPaths.TREE_CHOPPED_SPRITE
+        self.loot = loot
 
         # State
         self.active = True
         self.respawn_timer = 0
 
-        # Load sprites for both states
-        self.sprite_active: pygame.Surface | None = None
-        self.sprite_chopped: pygame.Surface | None = None
-        self._load_tree_sprites()
-
-    def _load_tree_sprites(self) -> None:
-        """Load sprites for active and chopped states"""
-        # Load active tree sprite
-        self.load_sprite(AssetPaths.TREE_ACTIVE_SPRITE, Colors.BROWN)
-        self.sprite_active = self.sprite
-
-        # Load chopped tree sprite (stump)
-        self.load_sprite(AssetPaths.TREE_CHOPPED_SPRITE, Colors.BROWN)
-        self.sprite_chopped = self.sprite
+        # Sprite for the current state (decoded lazily on first draw)
+        self.load_sprite(self.active_sprite_path, Colors.BROWN)
 
-        # Set current sprite to active
-        self.sprite = self.sprite_active
-
-    def chop(self, player: 'Player') -> bool:
+    def chop(self, player: 'Player', events: EventBus) -> bool:
         """
         Player chops the tree
 
         Args:
             player: Player entity chopping the tree
+            events: Event bus the XP grant and chop are emitted on (the chop
+                listener rolls the tree's loot table)
 
         Returns:
             True if tree was successfully chopped, False if already chopped
@@ -61,40 +68,70 @@ class Tree(Entity):
         if not self.active:
             return False
 
-        # Give player logs and XP
-        player.inventory.add_item("Logs", 1)
-        player.xp_system.add_xp('Woodcutting', GameBalance.TREE_XP_PER_LOG)
+        # Give player XP; the drops are rolled from the loot table on TREE_CHOPPED
+        events.emit(EventType.XP_GRANTED, self, player, SKILL_IDS['Woodcutting'], self.xp_reward)
+        events.emit(EventType.TREE_CHOPPED, player, self)
 
         # Tree becomes inactive
-        self.active = False
-        self.respawn_timer = GameBalance.TREE_RESPAWN_DELAY
-        self.sprite = self.sprite_chopped
+        self.deplete(self.respawn_delay)
 
         return True
 
-    def update(self) -> None:
-        """Update tree state and handle respawning"""
-        if not self.active:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.active = True
-                self.sprite = self.sprite_active
+    def deplete(self, respawn_ms: float) -> None:
+        """
+        Put the tree in its chopped state
+
+        Args:
+            respawn_ms: Game time in milliseconds until it grows back
+        """
+        self.active = False
+        self.respawn_timer = respawn_ms
+        self.sprite_path = self.chopped_sprite_path
+        self._notify_state_change()
+
+    @property
+    def respawn_due(self) -> bool:
+        """True once a chopped tree's respawn timer has run out"""
+        return not self.active and self.respawn_timer <= 0
+
+    def respawn(self) -> None:
+        """Restore the tree so it can be chopped again"""
+        self.active = True
+        self.respawn_timer = 0
+        self.sprite_path = self.active_sprite_path
+        self._notify_state_change()
+
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Count down the respawn timer
+
+        The respawn itself happens on the next game tick once respawn_due is set.
+
+        Args:
+            elapsed_ms: Game time since the previous update in milliseconds
+        """
+        if not self.active and self.respawn_timer > 0:
+            self.respawn_timer -= elapsed_ms
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
         """
         Draw tree to screen
 
         Args:
             screen: Pygame surface to draw on
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel
         """
-        if self.sprite:
+        rect = self.screen_rect(offset, scale)
+        sprite = self.sprite_at(scale)
+        if sprite:
             # Draw appropriate sprite (active or chopped)
-            sprite_rect = self.sprite.get_rect(center=(self.x, self.y))
-            screen.blit(self.sprite, sprite_rect)
+            screen.blit(sprite, rect)
         else:
             # Fallback: draw brown square (faded if chopped)
             if self.active:
-                pygame.draw.rect(screen, Colors.BROWN, self.get_rect())
+                pygame.draw.rect(screen, Colors.BROWN, rect)
             else:
                 # Draw faded brown when chopped
                 faded_color = (
@@ -102,4 +139,4 @@ class Tree(Entity):
                     Colors.BROWN[1] // 2,
                     Colors.BROWN[2] // 2
                 )
-                pygame.draw.rect(screen, faded_color, self.get_rect())
+                pygame.draw.rect(screen, faded_color, rect)
@@ -3,53 +3,412 @@ The Land RPG - Main Game Controller
 
 Orchestrates all game systems, entities, and rendering.
 """
+import argparse
+import os
 import pygame
 import sys
-from typing import List
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, Colors
+from src.config import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, AssetPaths, DiagnosticsSettings,
+                        ResolutionSettings, WorldSettings)
+from src.entities.base import Entity
 from src.entities.player import Player
 from src.entities.tree import Tree
 from src.entities.enemy import Enemy
+from src.rendering import sprites
+from src.rendering.pacing import FramePacer
+from src.rendering.particles import ParticleSystem
+from src.rendering.resolution import DynamicResolution, RenderTarget
+from src.rendering.static_layer import StaticLayer
+from src.systems.actions import ActionProcessor, ActionType
+from src.systems.content import ContentPack, EntityDef, EntityKind, NO_LOOT
+from src.systems.events import Event, EventBus, EventType
+from src.systems.items import ITEMS
+from src.systems.lod import LODBand, SimulationLOD
+from src.systems.loot import load_tables, world_rng
+from src.systems.movement import MovementSystem
+from src.systems.worldgen import Chunk, ChunkIndex, ChunkKey, ChunkStreamer, WorldGenerator
+from src.systems.xp_system import SKILL_IDS
 from src.ui.hud import draw_hud
 from src.ui.inventory_ui import draw_inventory
 
+if TYPE_CHECKING:
+    from src.diagnostics.memory import AllocationTracker
+    from src.diagnostics.profiler import FrameProfiler
+
 
 class Game:
     """Main game class that orchestrates all systems"""
 
-    def __init__(self) -> None:
-        """Initialize game and create all game objects"""
-        # Initialize Pygame
-        pygame.init()
+    def __init__(self, seed: int = WorldSettings.SEED,
+                 window_scale: float = ResolutionSettings.WINDOW_SCALE,
+                 render_scale: float = ResolutionSettings.RENDER_SCALE,
+                 dynamic_resolution: bool = ResolutionSettings.DYNAMIC) -> None:
+        """
+        Initialize game and create all game objects
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        Args:
+            seed: Seed of the procedurally generated world
+            window_scale: Window size as a multiple of SCREEN_WIDTH x SCREEN_HEIGHT
+            render_scale: Resolution the world is drawn at, as a fraction of
+                SCREEN_WIDTH x SCREEN_HEIGHT (the starting scale if dynamic)
+            dynamic_resolution: Lower the render scale while frames run over budget
+        """
+        # Initialize only the Pygame modules the game uses (no audio/joystick)
+        pygame.display.init()
+        pygame.font.init()
+
+        # The world is drawn at the render scale and upscaled to the window
+        self.display = RenderTarget(window_scale, render_scale)
+        self.dynamic_resolution = DynamicResolution(self.display) if dynamic_resolution else None
+        self._frame_start = time.perf_counter()
         pygame.display.set_caption("The Land RPG")
-        self.clock = pygame.time.Clock()
         self.running = True
 
+        # Full FPS while anything changes; low FPS or blocking on input otherwise
+        self.pacer = FramePacer()
+
+        # Pooled particles for hit splats, XP text and wood chips
+        self.particles = ParticleSystem()
+
+        # Entities emit events during the tick; they are dispatched at the end of update()
+        self.events = EventBus()
+        self._register_event_handlers()
+
+        # Chops, attacks and respawns are queued and resolved on fixed game ticks
+        self.actions = ActionProcessor()
+        self._register_action_handlers()
+
+        # All moving units are advanced together in one vectorized step per frame
+        self.movement = MovementSystem()
+
         # Create player
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-
-        # Create trees
-        self.trees: List[Tree] = [
-            Tree(150, 150),
-            Tree(650, 150),
-            Tree(150, 450),
-            Tree(650, 450),
-            Tree(400, 100),
-        ]
-
-        # Create enemies
-        self.enemies: List[Enemy] = [
-            Enemy(300, 300),
-            Enemy(500, 300),
-            Enemy(400, 400),
-        ]
-
-    def handle_events(self) -> None:
-        """Handle all game events (keyboard, mouse, etc.)"""
-        for event in pygame.event.get():
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, self.events, self.movement)
+
+        # Spawn the world from the compiled content pack
+        self.content = ContentPack(AssetPaths.CONTENT_PACK)
+        ITEMS.load_content(self.content)
+
+        # Drops are rolled from the pack's loot tables with the world's own RNG
+        self.loot_tables = load_tables(self.content)
+        self.loot_rng = world_rng(seed)
+
+        self.trees: List[Tree] = []
+        self.enemies: List[Enemy] = []
+
+        # Trees and enemies by world chunk, for clicks and on-screen checks
+        self.tree_index = ChunkIndex()
+        self.enemy_index = ChunkIndex()
+        self._max_entity_size = 0
+
+        # Trees and enemies update every frame near the player, less often further
+        # out and not at all far away; game time drives their timers
+        self.game_time_ms = 0.0
+        self.tree_lod = SimulationLOD()
+        self.enemy_lod = SimulationLOD()
+
+        # Trees never move, so they are baked into a cached background layer
+        self.static_layer = StaticLayer()
+        self._spawn_placements()
+
+        # The rest of the world is generated around the player on a worker thread,
+        # leaving the hand-placed area around the start clear
+        content = self.content
+        self._generated_tree = content.entity_type(content.entity_type_id(WorldSettings.TREE_TYPE))
+        self._generated_enemy = content.entity_type(content.entity_type_id(WorldSettings.ENEMY_TYPE))
+        generator = WorldGenerator(seed, clear_center=(self.player.x, self.player.y),
+                                   clear_radius=WorldSettings.CLEAR_RADIUS)
+        self.world = ChunkStreamer(generator)
+        self._streamed_around: Optional[ChunkKey] = None
+
+        # Trees and enemies spawned from each generated chunk, unloaded together
+        self._loaded_chunks: Dict[ChunkKey, List[Entity]] = {}
+
+        # Chopped trees and defeated enemies of unloaded chunks, as (position in the
+        # chunk's entity list, game time their respawn is due), restored on reload
+        self._chunk_deltas: Dict[ChunkKey, List[Tuple[int, float]]] = {}
+
+        # Chopped trees and defeated enemies in the world, whatever their LOD band
+        # (counted up when they go down, down when they respawn or are unloaded)
+        self._respawning = 0
+
+        # World position of the screen's top-left corner (follows the player)
+        self.camera: Tuple[int, int] = (0, 0)
+        self._update_camera()
+
+        # Memory report in progress (F9), finished after its frames have run
+        self.memory_tracker: Optional['AllocationTracker'] = None
+
+        # cProfile captures (F10 / F11), created on first use
+        self.profiler: Optional['FrameProfiler'] = None
+
+    def _spawn_placements(self) -> None:
+        """Create a tree or enemy for every placement in the content pack"""
+        content = self.content
+        for type_id, x, y in content.iter_placements():
+            self._spawn(content.entity_type(type_id), x, y)
+
+    def _spawn(self, definition: EntityDef, x: float, y: float) -> Entity:
+        """
+        Create a tree or enemy from its content definition and add it to the world
+
+        Args:
+            definition: Entity type from the content pack
+            x: X coordinate (center)
+            y: Y coordinate (center)
+
+        Returns:
+            The new entity
+        """
+        loot = None
+        if definition.loot_table != NO_LOOT:
+            loot = self.loot_tables[definition.loot_table]
+
+        if definition.kind == EntityKind.TREE:
+            return self._add_entity(Tree(x, y, definition, loot))
+        return self._add_entity(Enemy(x, y, definition, loot))
+
+    def _add_entity(self, entity: Entity) -> Entity:
+        """
+        Add a tree or enemy to the world
+
+        Args:
+            entity: Tree or Enemy (neither ever moves)
+
+        Returns:
+            The entity
+        """
+        if isinstance(entity, Tree):
+            self.trees.append(entity)
+            self.tree_lod.add(entity, self.game_time_ms)
+            self.tree_index.add(entity, entity.x, entity.y)
+            self.static_layer.add(entity)
+        else:
+            self.enemies.append(entity)
+            self.enemy_lod.add(entity, self.game_time_ms)
+            self.enemy_index.add(entity, entity.x, entity.y)
+        self._max_entity_size = max(self._max_entity_size, entity.size)
+        return entity
+
+    def _remove_entity(self, entity: Entity) -> None:
+        """
+        Remove a tree or enemy from the world
+
+        Args:
+            entity: Entity previously passed to _add_entity()
+        """
+        if isinstance(entity, Tree):
+            entities, lod, index = self.trees, self.tree_lod, self.tree_index
+            self.static_layer.remove(entity)
+            down = not entity.active
+        else:
+            entities, lod, index = self.enemies, self.enemy_lod, self.enemy_index
+            down = not entity.alive
+        if down:
+            self._respawning -= 1
+
+        # The LOD moves its last slot into the freed one; mirror that in the list
+        slot = lod.remove(entity)
+        entities[slot] = entities[-1]
+        entities.pop()
+        index.remove(entity, entity.x, entity.y)
+
+    def _stream_world(self) -> None:
+        """Request chunks around (and ahead of) the player and spawn finished ones"""
+        x, y = self.player.x, self.player.y
+        key = self.world.generator.chunk_at(x, y)
+        if key != self._streamed_around:
+            self._streamed_around = key
+            self.world.request_around(x, y)
+            self._unload_far_chunks()
+
+        # Generate ahead of the player towards where they are walking
+        if self.movement.moving[self.player.mover]:
+            self.world.request_around(*self.movement.targets[self.player.mover].tolist())
+
+        for chunk in self.world.poll():
+            self._spawn_chunk(chunk)
+
+    def _spawn_chunk(self, chunk: Chunk) -> None:
+        """
+        Add the trees and enemies of a generated chunk to the game
+
+        Args:
+            chunk: Chunk finished by the world generator
+        """
+        if self._is_far(chunk.key):
+            # The player moved on while it was generated; it can be requested again
+            self.world.forget((chunk.key,))
+            return
+
+        entities = [self._spawn(self._generated_tree, x, y) for x, y in chunk.trees.tolist()]
+        entities.extend(self._spawn(self._generated_enemy, x, y) for x, y in chunk.enemies.tolist())
+        self._loaded_chunks[chunk.key] = entities
+
+        # A chunk generates the same entities in the same order every time, so the
+        # ones still down when it was unloaded are found by their position
+        now = self.game_time_ms
+        for position, due_ms in self._chunk_deltas.pop(chunk.key, ()):
+            if due_ms > now:
+                entities[position].deplete(due_ms - now)
+                self._respawning += 1
+
+    def _unload_far_chunks(self) -> None:
+        """Remove the trees and enemies of generated chunks the player has left behind"""
+        now = self.game_time_ms
+        far = [key for key in self._loaded_chunks if self._is_far(key)]
+        for key in far:
+            delta = []
+            for position, entity in enumerate(self._loaded_chunks.pop(key)):
+                due_ms = self._respawn_due_ms(entity)
+                if due_ms > now:
+                    delta.append((position, due_ms))
+                self._remove_entity(entity)
+            if delta:
+                self._chunk_deltas[key] = delta
+
+        # Everything in a delta whose last respawn has come due is back as generated
+        expired = [key for key, delta in self._chunk_deltas.items()
+                   if max(due_ms for _, due_ms in delta) <= now]
+        for key in expired:
+            del self._chunk_deltas[key]
+
+        # Regenerated from the seed if the player comes back, with the delta re-applied
+        self.world.forget(far)
+
+    def _respawn_due_ms(self, entity: Entity) -> float:
+        """
+        Get the game time a chopped tree or defeated enemy will respawn at
+
+        Args:
+            entity: Tree or enemy in the world
+
+        Returns:
+            Game time in milliseconds (negative infinity if it is not down)
+        """
+        if isinstance(entity, Tree):
+            down, lod = not entity.active, self.tree_lod
+        else:
+            down, lod = not entity.alive, self.enemy_lod
+        if not down:
+            return float('-inf')
+        # Its timer has not been charged for the game time since its last LOD update
+        now = self.game_time_ms
+        return now + entity.respawn_timer - lod.pending_ms(entity, now)
+
+    def _is_far(self, key: ChunkKey) -> bool:
+        """Check whether a chunk is beyond the unload radius around the player's chunk"""
+        cx, cy = self.world.generator.chunk_at(self.player.x, self.player.y)
+        return max(abs(key[0] - cx), abs(key[1] - cy)) > WorldSettings.UNLOAD_RADIUS
+
+    def _update_camera(self) -> None:
+        """Center the view on the player"""
+        self.camera = (int(self.player.x) - SCREEN_WIDTH // 2,
+                       int(self.player.y) - SCREEN_HEIGHT // 2)
+
+    def _register_event_handlers(self) -> None:
+        """Subscribe the handlers that apply game events to entities"""
+        self.events.subscribe(EventType.ITEM_GRANTED, self._on_item_granted)
+        self.events.subscribe(EventType.XP_GRANTED, self._on_xp_granted)
+        self.events.subscribe(EventType.DAMAGE_DEALT, self._on_damage_dealt)
+        self.events.subscribe(EventType.TREE_CHOPPED, self._drop_loot)
+        self.events.subscribe(EventType.ENEMY_DEFEATED, self._drop_loot)
+        self.events.subscribe(EventType.TREE_CHOPPED, self._restart_tree_timer)
+        self.events.subscribe(EventType.ENEMY_DEFEATED, self._restart_enemy_timer)
+
+        # Visual feedback
+        self.events.subscribe(EventType.XP_GRANTED, self._show_xp_text)
+        self.events.subscribe(EventType.DAMAGE_DEALT, self._show_hit_splat)
+        self.events.subscribe(EventType.TREE_CHOPPED, self._show_wood_chips)
+
+    def _on_item_granted(self, event: Event) -> None:
+        """Add granted items to the receiving player's inventory"""
+        event.target.inventory.add_item(event.key, event.amount)
+
+    def _on_xp_granted(self, event: Event) -> None:
+        """Add granted XP to the receiving player's skills"""
+        event.target.xp_system.add_xp(event.key, event.amount)
+
+    def _on_damage_dealt(self, event: Event) -> None:
+        """Apply damage to an enemy and reward the attacker if it is defeated"""
+        enemy = event.target
+        if not enemy.alive:
+            return  # Already defeated earlier in this batch
+
+        if enemy.take_damage(event.amount):
+            attacker = event.source
+            self.events.emit(EventType.ENEMY_DEFEATED, attacker, enemy)
+            self.events.emit(EventType.XP_GRANTED, enemy, attacker, SKILL_IDS['Combat'], enemy.xp_reward)
+
+    def _drop_loot(self, event: Event) -> None:
+        """Roll the loot table of a chopped tree or defeated enemy for the player"""
+        entity = event.target
+        if entity.loot is not None:
+            entity.loot.grant(self.loot_rng, entity, event.source, self.events)
+
+    def _restart_tree_timer(self, event: Event) -> None:
+        """Start a chopped tree's respawn timer from now, whatever its update rate"""
+        self.tree_lod.touch(event.target, self.game_time_ms)
+        self._respawning += 1
+
+    def _restart_enemy_timer(self, event: Event) -> None:
+        """Start a defeated enemy's respawn timer from now, whatever its update rate"""
+        self.enemy_lod.touch(event.target, self.game_time_ms)
+        self._respawning += 1
+
+    def _register_action_handlers(self) -> None:
+        """Register the handlers that resolve each type of tick action"""
+        self.actions.register(ActionType.CHOP, self._resolve_chops)
+        self.actions.register(ActionType.ATTACK, self._resolve_attacks)
+        self.actions.register(ActionType.RESPAWN, self._resolve_respawns)
+
+    def _resolve_chops(self, chops: Dict[Player, Tree]) -> None:
+        """Resolve this tick's chop actions (the first player to reach a tree gets it)"""
+        for player, tree in chops.items():
+            tree.chop(player, self.events)
+
+    def _resolve_attacks(self, attacks: Dict[Player, Enemy]) -> None:
+        """Resolve this tick's attacks, queuing ongoing auto-attacks for the next tick"""
+        queue = self.actions.queue
+        for player, enemy in attacks.items():
+            if player.attack_tick(enemy):
+                queue(ActionType.ATTACK, player, enemy)
+
+    def _resolve_respawns(self, respawns: Dict[Entity, None]) -> None:
+        """Respawn every tree and enemy whose timer ran out before this tick"""
+        for entity in respawns:
+            lod = self.tree_lod if isinstance(entity, Tree) else self.enemy_lod
+            if entity in lod:  # not unloaded since it was queued
+                entity.respawn()
+                self._respawning -= 1
+
+    def _show_xp_text(self, event: Event) -> None:
+        """Float "+N XP" above the player receiving XP"""
+        player = event.target
+        self.particles.spawn_xp_text(player.x, player.y - player.size // 2, event.amount)
+
+    def _show_hit_splat(self, event: Event) -> None:
+        """Show a hit splat with the damage on the enemy that was hit"""
+        enemy = event.target
+        self.particles.spawn_hit_splat(enemy.x, enemy.y, event.amount)
+
+    def _show_wood_chips(self, event: Event) -> None:
+        """Burst wood chips from a chopped tree"""
+        tree = event.target
+        self.particles.spawn_wood_chips(tree.x, tree.y)
+
+    def handle_events(self, events: Optional[Iterable[pygame.event.Event]] = None) -> None:
+        """
+        Handle all game events (keyboard, mouse, etc.)
+
+        Args:
+            events: Events to handle (default: everything in Pygame's event queue)
+        """
+        if events is None:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -58,7 +417,7 @@ class Game:
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    self._handle_left_click(event.pos)
+                    self._handle_left_click(self.display.to_logical(event.pos))
 
     def _handle_keypress(self, key: int) -> None:
         """
@@ -70,19 +429,34 @@ class Game:
         if key == pygame.K_i:
             self.player.inventory.toggle()
 
+        elif key == pygame.K_F9:
+            self.start_memory_report()
+
+        elif key == pygame.K_F10:
+            self.start_profile()
+
+        elif key == pygame.K_F11:
+            # Toggle automatic captures of frames over budget
+            if self.profiler is not None and self.profiler.budget_ms is not None:
+                self.set_profile_budget(None)
+            else:
+                self.set_profile_budget(DiagnosticsSettings.FRAME_BUDGET_MS)
+
     def _handle_left_click(self, pos: tuple[int, int]) -> None:
         """
         Handle left mouse click
 
         Args:
-            pos: Mouse position (x, y)
+            pos: Mouse position (x, y) in logical screen coordinates
         """
-        mouse_x, mouse_y = pos
-
         # Don't process clicks if inventory is open
         if self.player.inventory.visible:
             return
 
+        # Screen to world coordinates
+        mouse_x = pos[0] + self.camera[0]
+        mouse_y = pos[1] + self.camera[1]
+
         # Try to chop a tree
         if self._try_chop_tree(mouse_x, mouse_y):
             return
@@ -100,17 +474,17 @@ class Game:
         Try to chop a tree at the clicked position
 
         Args:
-            x: Click X coordinate
-            y: Click Y coordinate
+            x: Click X coordinate (world)
+            y: Click Y coordinate (world)
 
         Returns:
-            True if a tree was clicked and chopped, False otherwise
+            True if a tree was clicked (a chop is queued if it is active), False otherwise
         """
-        for tree in self.trees:
-            if tree.get_rect().collidepoint(x, y):
-                if tree.active:
-                    tree.chop(self.player)
-                return True
+        tree = self._entity_at(self.tree_index, x, y)
+        if tree is not None:
+            if tree.active:
+                self.actions.queue(ActionType.CHOP, self.player, tree)
+            return True
         return False
 
     def _try_attack_enemy(self, x: int, y: int) -> bool:
@@ -118,69 +492,341 @@ class Game:
         Try to attack an enemy at the clicked position
 
         Args:
-            x: Click X coordinate
-            y: Click Y coordinate
+            x: Click X coordinate (world)
+            y: Click Y coordinate (world)
 
         Returns:
-            True if an enemy was clicked and attacked, False otherwise
+            True if an enemy was clicked (an attack is queued if it is alive), False otherwise
         """
-        for enemy in self.enemies:
-            if enemy.get_rect().collidepoint(x, y):
-                if enemy.alive:
-                    self.player.start_attack(enemy)
-                return True
+        enemy = self._entity_at(self.enemy_index, x, y)
+        if enemy is not None:
+            if enemy.alive:
+                self.player.start_attack(enemy)
+                self.actions.queue(ActionType.ATTACK, self.player, enemy)
+            return True
         return False
 
-    def update(self) -> None:
-        """Update all game entities"""
-        self.player.update()
+    def _entity_at(self, index: ChunkIndex, x: int, y: int) -> Optional[Entity]:
+        """
+        Find the entity of an index whose rect contains a world position
+
+        Args:
+            index: tree_index or enemy_index
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            The entity, or None if there is none at the position
+        """
+        reach = self._max_entity_size // 2 + 1
+        for entity in index.query(x - reach, y - reach, x + reach, y + reach):
+            if entity.get_rect().collidepoint(x, y):
+                return entity
+        return None
 
-        for tree in self.trees:
-            tree.update()
+    def update(self, elapsed_ms: float = 1000 / FPS) -> None:
+        """
+        Update all game entities and resolve any game ticks that came due
 
-        for enemy in self.enemies:
-            enemy.update()
+        Args:
+            elapsed_ms: Real time since the previous update in milliseconds
+        """
+        self.game_time_ms += elapsed_ms
+        self.movement.step(elapsed_ms)
+        self.player.update(elapsed_ms)
+        self._update_camera()
+        self._stream_world()
+
+        # Only trees and enemies whose LOD band is due this frame are updated, each
+        # by the game time since its own last update
+        queue = self.actions.queue
+        player_x, player_y = self.player.x, self.player.y
+        trees = self.trees
+        slots, elapsed = self.tree_lod.select(player_x, player_y, self.game_time_ms)
+        for slot, tree_elapsed_ms in zip(slots.tolist(), elapsed.tolist()):
+            tree = trees[slot]
+            tree.update(tree_elapsed_ms)
+            if tree.respawn_due:
+                queue(ActionType.RESPAWN, tree)
+
+        enemies = self.enemies
+        slots, elapsed = self.enemy_lod.select(player_x, player_y, self.game_time_ms)
+        for slot, enemy_elapsed_ms in zip(slots.tolist(), elapsed.tolist()):
+            enemy = enemies[slot]
+            enemy.update(enemy_elapsed_ms)
+            if enemy.respawn_due:
+                queue(ActionType.RESPAWN, enemy)
+
+        # Resolve queued actions on game ticks, independent of frame rate
+        self.actions.advance(elapsed_ms)
+
+        # Deliver everything that happened this tick in one batch
+        self.events.dispatch()
+
+        self.particles.update(elapsed_ms)
 
     def draw(self) -> None:
         """Draw all game elements"""
-        # Clear screen
-        self.screen.fill(Colors.BLACK)
+        # Swap in sprites the loader threads finished and re-bake the static entities
+        # that were baked with a fallback for one of them
+        installed = sprites.pump()
+        if installed:
+            self.static_layer.sprites_loaded(installed)
+
+        camera = self.camera
+        world = self.display.world
+        scale = self.display.render_scale
+
+        # Draw cached background (clears the screen and draws trees)
+        self.static_layer.draw(world, camera, scale)
+
+        # Draw enemies that are on screen
+        left, top = camera
+        right, bottom = left + SCREEN_WIDTH, top + SCREEN_HEIGHT
+        reach = self._max_entity_size
+        for enemy in self.enemy_index.query(left - reach, top - reach, right + reach, bottom + reach):
+            margin = enemy.size  # covers the sprite and the HP bar above it
+            if left - margin < enemy.x < right + margin and top - margin < enemy.y < bottom + margin:
+                enemy.draw(world, camera, scale)
 
-        # Draw trees
-        for tree in self.trees:
-            tree.draw(self.screen)
+        # Draw player
+        self.player.draw(world, camera, scale)
 
-        # Draw enemies
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        # Draw particles (hit splats, XP text, wood chips)
+        self.particles.draw(world, camera, scale)
 
-        # Draw player
-        self.player.draw(self.screen)
+        # Upscale the world; the UI is drawn over it at full resolution
+        self.display.present_world()
+        frame = self.display.frame
 
         # Draw HUD (skills and instructions)
-        draw_hud(self.screen, self.player.xp_system)
+        draw_hud(frame, self.player.xp_system)
 
         # Draw inventory (on top of everything)
-        draw_inventory(self.screen, self.player.inventory)
+        draw_inventory(frame, self.player.inventory)
+
+        # The frame's work is done; waiting on the display doesn't count against the budget
+        if self.dynamic_resolution is not None:
+            self.dynamic_resolution.add_frame((time.perf_counter() - self._frame_start) * 1000)
 
         # Update display
-        pygame.display.flip()
+        self.display.flip()
+
+    def start_memory_report(self, frames: int = DiagnosticsSettings.MEMORY_REPORT_FRAMES) -> None:
+        """
+        Start tracking allocations; the report is printed and saved after frames frames
+
+        Args:
+            frames: Frames to run between the two allocation snapshots
+        """
+        if self.memory_tracker is not None:
+            return
+
+        # Debug-only module, imported on first use to keep it off the startup path
+        from src.diagnostics.memory import AllocationTracker
+
+        print(f"Memory report: tracking allocations over {frames} frames")
+        self.memory_tracker = AllocationTracker(frames)
+        self.memory_tracker.start()
+
+    def _write_memory_report(self) -> None:
+        """Print and save the memory report once its allocation tracking is done"""
+        from src.diagnostics.memory import build_report, print_report, write_report
+
+        report = build_report(
+            [self.player, *self.trees, *self.enemies],
+            shared=(self, self.events, self.actions, self.movement, self.content,
+                    self.static_layer, self.particles, ITEMS, *self.loot_tables),
+            surfaces={
+                "<particle atlas>": self.particles.sprites,
+                "<static layer chunks>": self.static_layer.surfaces(),
+                "<render targets>": self.display.surfaces(),
+            },
+            tracker=self.memory_tracker,
+        )
+        print_report(report)
+        print(f"Saved {write_report(report)}")
+        self.memory_tracker = None
+
+    def start_profile(self, frames: int = DiagnosticsSettings.PROFILE_CAPTURE_FRAMES) -> None:
+        """
+        Profile the next frames frames with cProfile into a .pstats file
+
+        Args:
+            frames: Number of frames to profile
+        """
+        print(f"Profiling the next {frames} frames")
+        self._get_profiler().capture(frames)
+
+    def set_profile_budget(self, budget_ms: Optional[float]) -> None:
+        """
+        Turn automatic profiling of slow frames on or off
+
+        Args:
+            budget_ms: Frame time in milliseconds that triggers a capture, or None for off
+        """
+        if budget_ms is None:
+            print("Automatic profiling off")
+        else:
+            print(f"Profiling every frame; frames over {budget_ms:.1f} ms are saved")
+        self._get_profiler().set_budget(budget_ms)
+
+    def _get_profiler(self) -> 'FrameProfiler':
+        """Get the frame profiler, creating it on first use"""
+        if self.profiler is None:
+            # Debug-only module, imported on first use to keep it off the startup path
+            from src.diagnostics.profiler import FrameProfiler
+            self.profiler = FrameProfiler()
+        return self.profiler
+
+    def _begin_frame(self) -> None:
+        """Start per-frame diagnostics before a frame's work begins"""
+        self._frame_start = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.begin_frame()
+
+    def _finish_frame(self) -> None:
+        """Advance per-frame diagnostics after a frame has been drawn"""
+        if self.profiler is not None:
+            requested = self.profiler.capturing
+            path = self.profiler.end_frame()
+            if path is not None:
+                print(f"Saved {path}")
+                if requested:
+                    from src.diagnostics.profiler import print_summary
+                    print_summary(path)
+
+        if self.memory_tracker is not None and self.memory_tracker.tick():
+            self._write_memory_report()
+
+    def is_busy(self) -> bool:
+        """
+        Check whether anything in the game is changing on its own
+
+        Returns:
+            True if something is moving, counting down, loading or being measured;
+            False if the next frame would look the same without input
+        """
+        return bool(
+            self.movement.active_count
+            or self.player.attacking_enemy is not None
+            or self._respawning
+            or self.actions.pending
+            or self.events.pending
+            or self.particles.active_count
+            or sprites.pending_count()
+            or self.world.pending
+            or self.memory_tracker is not None
+            or (self.profiler is not None and self.profiler.active)
+        )
+
+    def lod_counts(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get the trees and enemies in each simulation LOD band on the last frame
+
+        Returns:
+            Band name -> (entities in the band, entities updated this frame)
+        """
+        return {
+            band.name.lower(): (self.tree_lod.band_counts[band] + self.enemy_lod.band_counts[band],
+                                self.tree_lod.updated_counts[band] + self.enemy_lod.updated_counts[band])
+            for band in LODBand
+        }
 
     def run(self) -> None:
         """Main game loop"""
         while self.running:
-            self.handle_events()
+            self.pacer.select(self.is_busy(), pygame.key.get_focused(), pygame.display.get_active())
+            elapsed_ms, events = self.pacer.wait()
+            self._begin_frame()
+            self.handle_events(events)
+            self.update(elapsed_ms)
+            self.draw()
+            self._finish_frame()
+
+        usage = ", ".join(f"{mode} {cpu:.0f} ms/s"
+                          for mode, cpu in self.pacer.cpu_ms_per_second().items())
+        print(f"CPU time per second by pacing mode: {usage}")
+        self.close()
+        sys.exit()
+
+    def run_headless(self, frames: int) -> None:
+        """
+        Run a number of frames as fast as possible, without input
+
+        Each frame advances the game by one frame's worth of time at FPS.
+
+        Args:
+            frames: Number of frames to run
+        """
+        for _ in range(frames):
+            self._begin_frame()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self._finish_frame()
 
+        bands = ", ".join(f"{band} {total} ({updated} updated)"
+                          for band, (total, updated) in self.lod_counts().items())
+        print(f"Entities per simulation LOD band on the last frame: {bands}")
+
+    def close(self) -> None:
+        """Stop background loading, release the content pack and shut down Pygame"""
+        self.world.close()
+        sprites.shutdown()
+        self.content.close()
         pygame.quit()
-        sys.exit()
 
 
-def main() -> None:
-    """Entry point for the game"""
-    game = Game()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Entry point for the game
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="The Land RPG")
+    parser.add_argument("--seed", type=int, default=WorldSettings.SEED,
+                        help="world seed (default: %(default)s)")
+    parser.add_argument("--headless", action="store_true",
+                        help="run --frames frames without a window or input, then exit")
+    parser.add_argument("--frames", type=int, default=DiagnosticsSettings.HEADLESS_FRAMES,
+                        help="frames to run headless (default: %(default)s)")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="run headless, then print and save a memory report")
+    parser.add_argument("--profile", type=int, metavar="N",
+                        help="profile the first N frames into a .pstats file")
+    parser.add_argument("--profile-budget", type=float, nargs="?", metavar="MS",
+                        const=DiagnosticsSettings.FRAME_BUDGET_MS,
+                        help="save a profile of any frame slower than MS "
+                             "(default: %.1f)" % DiagnosticsSettings.FRAME_BUDGET_MS)
+    parser.add_argument("--window-scale", type=float, default=ResolutionSettings.WINDOW_SCALE,
+                        help="window size as a multiple of %dx%d (default: %%(default)s)"
+                             % (SCREEN_WIDTH, SCREEN_HEIGHT))
+    parser.add_argument("--render-scale", type=float, default=ResolutionSettings.RENDER_SCALE,
+                        help="resolution the world is drawn at, as a fraction of %dx%d "
+                             "(default: %%(default)s)" % (SCREEN_WIDTH, SCREEN_HEIGHT))
+    parser.add_argument("--dynamic-resolution", action="store_true", default=ResolutionSettings.DYNAMIC,
+                        help="lower the render scale while frames run over budget")
+    args = parser.parse_args(argv)
+
+    headless = args.headless or args.memory_report
+    if headless:
+        # No window is needed for a headless run
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    game = Game(args.seed, args.window_scale, args.render_scale, args.dynamic_resolution)
+    if args.memory_report:
+        game.start_memory_report(args.frames)
+    if args.profile:
+        game.start_profile(args.profile)
+    if args.profile_budget is not None:
+        game.set_profile_budget(args.profile_budget)
+
+    if headless:
+        game.run_headless(args.frames)
+        game.close()
+        return
+
     game.run()
 
 
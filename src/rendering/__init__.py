@@ -0,0 +1 @@
+# Rendering helpers (surface caches, layers, etc.)
@@ -0,0 +1,143 @@
+"""
+Frame Pacer - Adaptive frame rate for an idle or unfocused game
+
+Runs the game loop at full FPS while anything is happening, at a low FPS while the
+window is unfocused or minimized, and blocks on pygame.event.wait() (waking at a
+low rate) once nothing has changed for a short while. Any input event wakes an
+idle loop immediately. CPU time is accounted per mode so the savings can be
+measured.
+"""
+from enum import IntEnum
+from typing import Dict, List, Tuple
+import time
+import pygame
+
+from src.config import FPS, PacingSettings
+
+
+class PacingMode(IntEnum):
+    """How the game loop waits between frames"""
+    ACTIVE = 0      # full FPS
+    BACKGROUND = 1  # window unfocused or minimized while the game is busy: low FPS
+    IDLE = 2        # nothing changing: block on input with a wake-up timeout
+
+
+class FramePacer:
+    """Picks a pacing mode each frame, waits accordingly and tracks CPU use per mode"""
+
+    def __init__(self, fps: int = FPS,
+                 background_fps: int = PacingSettings.BACKGROUND_FPS,
+                 idle_wake_ms: int = PacingSettings.IDLE_WAKE_MS,
+                 idle_delay_ms: int = PacingSettings.IDLE_DELAY_MS) -> None:
+        """
+        Initialize pacer in active mode
+
+        Args:
+            fps: Frame rate while active
+            background_fps: Frame rate while unfocused or minimized but busy
+            idle_wake_ms: Longest wait for input while idle before drawing a frame anyway
+            idle_delay_ms: Time without activity before the pacer goes idle
+        """
+        self.fps = fps
+        self.background_fps = background_fps
+        self.idle_wake_ms = idle_wake_ms
+        self.idle_delay_ms = idle_delay_ms
+
+        self.mode = PacingMode.ACTIVE
+        self.clock = pygame.time.Clock()
+        self._quiet_ms = 0.0  # time since the game was last busy
+
+        # Wall and CPU seconds spent in each mode
+        self.reset_stats()
+
+    def select(self, busy: bool, focused: bool = True, visible: bool = True) -> PacingMode:
+        """
+        Pick the pacing mode for the next frame
+
+        Args:
+            busy: Whether anything is moving, counting down or otherwise changing
+            focused: Whether the window has input focus
+            visible: Whether the window is shown (not minimized)
+
+        Returns:
+            Mode the next wait() will use
+        """
+        if busy:
+            self._quiet_ms = 0.0
+        elif self._quiet_ms >= self.idle_delay_ms:
+            return self._set_mode(PacingMode.IDLE)
+
+        if focused and visible:
+            return self._set_mode(PacingMode.ACTIVE)
+        return self._set_mode(PacingMode.BACKGROUND)
+
+    def wait(self) -> Tuple[float, List[pygame.event.Event]]:
+        """
+        Wait until the next frame is due (or input arrives, when idle)
+
+        Returns:
+            Tuple of (milliseconds since the previous frame, input events received)
+        """
+        if self.mode == PacingMode.IDLE:
+            event = pygame.event.wait(self.idle_wake_ms)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            elapsed_ms = self.clock.tick()
+        else:
+            fps = self.fps if self.mode == PacingMode.ACTIVE else self.background_fps
+            elapsed_ms = self.clock.tick(fps)
+            events = pygame.event.get()
+
+        # Input ramps straight back up to full rate
+        if events:
+            self._quiet_ms = 0.0
+            if self.mode == PacingMode.IDLE:
+                self._set_mode(PacingMode.ACTIVE)
+        else:
+            self._quiet_ms += elapsed_ms
+        return elapsed_ms, events
+
+    def cpu_ms_per_second(self) -> Dict[str, float]:
+        """
+        Get the average CPU time used per second of wall time in each mode
+
+        Returns:
+            Mode name -> CPU milliseconds per second (1000 = one full core),
+            for modes that have been used
+        """
+        self._account()
+        return {mode.name.lower(): self._cpu[mode] / self._wall[mode] * 1000
+                for mode in PacingMode if self._wall[mode] > 0}
+
+    def seconds_per_mode(self) -> Dict[str, float]:
+        """
+        Get the wall time spent in each mode
+
+        Returns:
+            Mode name -> seconds
+        """
+        self._account()
+        return {mode.name.lower(): self._wall[mode] for mode in PacingMode}
+
+    def reset_stats(self) -> None:
+        """Forget the time and CPU use recorded so far"""
+        self._wall = [0.0 for _ in PacingMode]
+        self._cpu = [0.0 for _ in PacingMode]
+        self._last_wall = time.perf_counter()
+        self._last_cpu = time.process_time()
+
+    def _set_mode(self, mode: PacingMode) -> PacingMode:
+        """Switch mode, charging the time so far to the previous one"""
+        if mode != self.mode:
+            self._account()
+            self.mode = mode
+        return mode
+
+    def _account(self) -> None:
+        """Add wall and CPU time since the last call to the current mode"""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        self._wall[self.mode] += wall - self._last_wall
+        self._cpu[self.mode] += cpu - self._last_cpu
+        self._last_wall = wall
+        self._last_cpu = cpu
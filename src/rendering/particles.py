@@ -0,0 +1,259 @@
+"""
+Particle System - Pooled, array-backed particles and floating text
+
+Every particle lives in a slot of fixed-capacity NumPy arrays (position, velocity,
+gravity, lifetime, sprite index) handed out from a free list, so spawning a hit
+splat or a burst of wood chips creates no Python objects or surfaces. All sprites,
+including the glyphs used for damage numbers and "+25 XP" text, are rendered once
+at startup. Particles are advanced in one vectorized step and drawn with a single
+batched blits call.
+"""
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import pygame
+
+from src.config import Colors, RenderSettings
+from src.ui.fonts import get_font
+
+XP_TEXT_CHARS = "+0123456789 XP"
+DIGITS = "0123456789"
+
+
+class ParticleSystem:
+    """Fixed-capacity pool of simple sprite particles"""
+
+    def __init__(self, capacity: int = RenderSettings.PARTICLE_CAPACITY) -> None:
+        """
+        Allocate particle arrays and pre-render all particle sprites
+
+        Args:
+            capacity: Maximum number of live particles (spawns beyond it are dropped)
+        """
+        self.capacity = capacity
+
+        # Per-particle state; positions are the top-left corner of the sprite
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)  # pixels per second
+        self.gravity = np.zeros(capacity, dtype=np.float32)          # pixels per second^2
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)        # milliseconds left
+        self.sprite_ids = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Free slots as a stack; the top is popped first
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = capacity
+
+        self._rng = np.random.default_rng()
+
+        # Sprite atlas, indexed by sprite_ids
+        self.sprites: List[pygame.Surface] = []
+        self._scaled_sprites: List[pygame.Surface] = []  # the atlas at _sprite_scale
+        self._sprite_scale = 1.0
+        self._xp_glyphs = self._render_glyphs(XP_TEXT_CHARS, Colors.GOLD)
+        self._damage_glyphs = self._render_glyphs(DIGITS, Colors.WHITE)
+        self._hit_splats = [self._add_sprite(self._render_hit_splat(value))
+                            for value in range(RenderSettings.HIT_SPLAT_MAX_VALUE + 1)]
+        self._wood_chips = [self._add_sprite(self._render_chip(color))
+                            for color in (Colors.BROWN, Colors.LIGHT_BROWN)]
+
+    def spawn_xp_text(self, x: float, y: float, amount: int) -> None:
+        """
+        Spawn rising "+N XP" text centered above a point
+
+        Args:
+            x: Center X coordinate
+            y: Bottom Y coordinate of the text
+            amount: XP amount to show (negative values show as 0)
+        """
+        self._spawn_text(x, y, f"+{max(0, amount)} XP", self._xp_glyphs,
+                         (0.0, -RenderSettings.FLOATING_TEXT_SPEED),
+                         RenderSettings.FLOATING_TEXT_LIFETIME_MS)
+
+    def spawn_hit_splat(self, x: float, y: float, damage: int) -> None:
+        """
+        Spawn a hit splat showing a damage number centered on a point
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            damage: Damage to show (negative values show as 0)
+        """
+        lifetime = RenderSettings.HIT_SPLAT_LIFETIME_MS
+        damage = max(0, damage)
+        if damage <= RenderSettings.HIT_SPLAT_MAX_VALUE:
+            sprite = self._hit_splats[damage]
+            size = self.sprites[sprite].get_size()
+            self._spawn(x - size[0] / 2, y - size[1] / 2, 0.0, 0.0, 0.0, lifetime, sprite)
+        else:
+            # Too large for a pre-rendered splat; show the bare digits instead
+            self._spawn_text(x, y, str(damage), self._damage_glyphs, (0.0, 0.0), lifetime)
+
+    def spawn_wood_chips(self, x: float, y: float) -> None:
+        """
+        Spawn a burst of falling wood chips from a point
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+        """
+        slots = self._allocate(RenderSettings.WOOD_CHIP_COUNT)
+        count = len(slots)
+        if not count:
+            return
+
+        # Random upward-biased directions and speeds
+        angles = self._rng.uniform(-np.pi * 0.9, -np.pi * 0.1, count)
+        speeds = self._rng.uniform(0.5, 1.0, count) * RenderSettings.WOOD_CHIP_SPEED
+
+        self.positions[slots] = (x, y)
+        self.velocities[slots, 0] = np.cos(angles) * speeds
+        self.velocities[slots, 1] = np.sin(angles) * speeds
+        self.gravity[slots] = RenderSettings.PARTICLE_GRAVITY
+        self.lifetimes[slots] = RenderSettings.WOOD_CHIP_LIFETIME_MS
+        self.sprite_ids[slots] = self._rng.choice(self._wood_chips, count)
+        self.alive[slots] = True
+
+    def update(self, elapsed_ms: float) -> None:
+        """
+        Advance all particles and free the ones whose lifetime ran out
+
+        Args:
+            elapsed_ms: Time since the previous update in milliseconds
+        """
+        if self._free_count == self.capacity:
+            return
+
+        dt = elapsed_ms / 1000
+        self.velocities[:, 1] += self.gravity * dt
+        self.positions += self.velocities * dt
+        self.lifetimes -= elapsed_ms
+
+        expired = np.flatnonzero(self.alive & (self.lifetimes <= 0))
+        if expired.size:
+            self.alive[expired] = False
+            self.velocities[expired] = 0
+            self.gravity[expired] = 0
+            self._release(expired)
+
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
+        """
+        Draw all live particles with one blits call
+
+        Args:
+            screen: Pygame surface to draw on
+            offset: World position of the surface's top-left corner
+            scale: Surface pixels per world pixel
+        """
+        if self._free_count == self.capacity:
+            return
+
+        live = np.flatnonzero(self.alive)
+        if scale == 1.0:
+            atlas = self.sprites
+            dests = (self.positions[live] - offset).astype(np.int32)
+        else:
+            atlas = self._scaled_atlas(scale)
+            dests = ((self.positions[live] - offset) * scale).astype(np.int32)
+
+        # Rows of an array are not tracked by the garbage collector and zip reuses its
+        # tuple once blits lets go of it, so the draw creates no per-particle garbage
+        surfaces = map(atlas.__getitem__, self.sprite_ids[live].tolist())
+        screen.blits(zip(surfaces, dests), doreturn=False)
+
+    @property
+    def active_count(self) -> int:
+        """Number of live particles"""
+        return self.capacity - self._free_count
+
+    def _spawn(self, x: float, y: float, vx: float, vy: float, gravity: float,
+               lifetime_ms: float, sprite: int) -> None:
+        """Spawn one particle (dropped if the pool is full)"""
+        if not self._free_count:
+            return
+
+        self._free_count -= 1
+        slot = self._free[self._free_count]
+        self.positions[slot] = (x, y)
+        self.velocities[slot] = (vx, vy)
+        self.gravity[slot] = gravity
+        self.lifetimes[slot] = lifetime_ms
+        self.sprite_ids[slot] = sprite
+        self.alive[slot] = True
+
+    def _spawn_text(self, x: float, y: float, text: str, glyphs: Dict[str, int],
+                    velocity: Tuple[float, float], lifetime_ms: float) -> None:
+        """Spawn one glyph particle per character, laid out centered on x (skips unknown ones)"""
+        chars = [char for char in text if char in glyphs]
+        if not chars:
+            return
+
+        sprites = self.sprites
+        width = sum(sprites[glyphs[char]].get_width() for char in chars)
+        height = sprites[glyphs[chars[0]]].get_height()
+        cursor = x - width / 2
+        for char in chars:
+            glyph = glyphs[char]
+            if char != " ":
+                self._spawn(cursor, y - height, velocity[0], velocity[1], 0.0, lifetime_ms, glyph)
+            cursor += sprites[glyph].get_width()
+
+    def _allocate(self, count: int) -> np.ndarray:
+        """
+        Take up to count free slots
+
+        Returns:
+            Slot indices (fewer than count if the pool is nearly full)
+        """
+        count = min(count, self._free_count)
+        self._free_count -= count
+        return self._free[self._free_count:self._free_count + count]
+
+    def _release(self, slots: np.ndarray) -> None:
+        """Return slots to the free list"""
+        self._free[self._free_count:self._free_count + slots.size] = slots
+        self._free_count += slots.size
+
+    def _scaled_atlas(self, scale: float) -> List[pygame.Surface]:
+        """Get the sprite atlas scaled for a surface drawn at scale (rebuilt when it changes)"""
+        if scale != self._sprite_scale or len(self._scaled_sprites) != len(self.sprites):
+            self._sprite_scale = scale
+            self._scaled_sprites = [
+                pygame.transform.scale(sprite, (max(1, round(sprite.get_width() * scale)),
+                                                max(1, round(sprite.get_height() * scale))))
+                for sprite in self.sprites
+            ]
+        return self._scaled_sprites
+
+    def _add_sprite(self, surface: pygame.Surface) -> int:
+        """Add a surface to the sprite atlas and return its index"""
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.sprites.append(surface)
+        return len(self.sprites) - 1
+
+    def _render_glyphs(self, chars: Sequence[str], color: Tuple[int, int, int]) -> Dict[str, int]:
+        """Render each character once and return char -> sprite index"""
+        font = get_font(RenderSettings.PARTICLE_FONT_SIZE)
+        return {char: self._add_sprite(font.render(char, True, color)) for char in chars}
+
+    def _render_hit_splat(self, value: int) -> pygame.Surface:
+        """Render a red hit splat with a damage number on it"""
+        size = RenderSettings.HIT_SPLAT_SIZE
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, Colors.RED, (size // 2, size // 2), size // 2)
+
+        digits = [self.sprites[self._damage_glyphs[char]] for char in str(value)]
+        x = (size - sum(digit.get_width() for digit in digits)) // 2
+        for digit in digits:
+            surface.blit(digit, (x, (size - digit.get_height()) // 2))
+            x += digit.get_width()
+        return surface
+
+    @staticmethod
+    def _render_chip(color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render a small wood chip"""
+        size = RenderSettings.WOOD_CHIP_SIZE
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        surface.fill(color)
+        return surface
@@ -0,0 +1,174 @@
+"""
+Render Target - Internal render resolution and presentation to the window
+
+The game composes each frame on a logical SCREEN_WIDTH x SCREEN_HEIGHT frame
+surface. The world is drawn into a separate target at a fraction of that size
+(the render scale) and upscaled into the frame, then the HUD and inventory are
+drawn on the frame at full resolution so text stays sharp. If the window is a
+different size than the frame, the frame is upscaled onto it when presented.
+Exact 2x upscales use scale2x, everything else pygame.transform.scale. At scale
+1 the targets are the same surface and nothing is copied.
+
+DynamicResolution watches frame times and steps the render scale down while
+frames run over budget and back up once there is headroom again.
+"""
+from collections import deque
+from typing import Deque, List, Sequence, Tuple
+import pygame
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, ResolutionSettings
+
+
+class RenderTarget:
+    """Window, logical frame and world render surfaces"""
+
+    def __init__(self, window_scale: float = ResolutionSettings.WINDOW_SCALE,
+                 render_scale: float = ResolutionSettings.RENDER_SCALE,
+                 scale2x: bool = ResolutionSettings.SCALE2X) -> None:
+        """
+        Open the window and create the render surfaces
+
+        Args:
+            window_scale: Window size as a multiple of the logical size
+            render_scale: World render resolution as a fraction of the logical size
+            scale2x: Use scale2x for exact 2x upscales
+        """
+        self.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.scale2x = scale2x
+
+        window_size = (round(SCREEN_WIDTH * window_scale), round(SCREEN_HEIGHT * window_scale))
+        self.window = pygame.display.set_mode(window_size)
+        if window_size == self.logical_size:
+            self.frame = self.window
+        else:
+            self.frame = pygame.Surface(self.logical_size).convert()
+
+        self.render_scale = 1.0
+        self.world = self.frame
+        self.set_render_scale(render_scale)
+
+    def set_render_scale(self, scale: float) -> None:
+        """
+        Change the resolution the world is drawn at
+
+        Args:
+            scale: Fraction of the logical size (clamped to 0.25..1)
+        """
+        scale = min(1.0, max(0.25, scale))
+        if scale == self.render_scale and (scale == 1.0) == (self.world is self.frame):
+            return
+
+        self.render_scale = scale
+        if scale == 1.0:
+            self.world = self.frame
+        else:
+            size = (round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))
+            self.world = pygame.Surface(size).convert()
+
+    def present_world(self) -> None:
+        """Upscale the world target into the frame (call before drawing the UI)"""
+        if self.world is not self.frame:
+            self._upscale(self.world, self.frame)
+
+    def flip(self) -> None:
+        """Show the finished frame in the window"""
+        if self.frame is not self.window:
+            self._upscale(self.frame, self.window)
+        pygame.display.flip()
+
+    def to_logical(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Map a window position (e.g. the mouse) to logical frame coordinates
+
+        Args:
+            pos: Position in window pixels
+
+        Returns:
+            Position in logical pixels
+        """
+        if self.frame is self.window:
+            return pos
+        width, height = self.window.get_size()
+        return (pos[0] * SCREEN_WIDTH // width, pos[1] * SCREEN_HEIGHT // height)
+
+    def surfaces(self) -> List[pygame.Surface]:
+        """
+        Get the off-screen surfaces the target holds
+
+        Returns:
+            Frame and world surfaces that are not the window itself
+        """
+        surfaces = []
+        if self.frame is not self.window:
+            surfaces.append(self.frame)
+        if self.world is not self.frame:
+            surfaces.append(self.world)
+        return surfaces
+
+    def _upscale(self, source: pygame.Surface, dest: pygame.Surface) -> None:
+        """Scale source to fill dest"""
+        width, height = source.get_size()
+        if self.scale2x and dest.get_size() == (width * 2, height * 2):
+            pygame.transform.scale2x(source, dest)
+        else:
+            pygame.transform.scale(source, dest.get_size(), dest)
+
+
+class DynamicResolution:
+    """Steps a render target's scale to keep frame times under budget"""
+
+    def __init__(self, target: RenderTarget,
+                 budget_ms: float = ResolutionSettings.FRAME_BUDGET_MS,
+                 steps: Sequence[float] = ResolutionSettings.SCALE_STEPS,
+                 headroom: float = ResolutionSettings.HEADROOM,
+                 sample_frames: int = ResolutionSettings.SAMPLE_FRAMES) -> None:
+        """
+        Initialize controller at the render target's current scale
+
+        Args:
+            target: Render target whose scale is adjusted
+            budget_ms: Frame time to stay under
+            steps: Render scales to move between, highest first
+            headroom: Share of the budget under which the scale is raised again
+            sample_frames: Frames averaged before each decision
+        """
+        self.target = target
+        self.budget_ms = budget_ms
+        self.steps = tuple(steps)
+        self.headroom = headroom
+        self.changes = 0  # number of scale changes so far
+
+        self._samples: Deque[float] = deque(maxlen=sample_frames)
+        self._total = 0.0
+
+        # Start from the step nearest the target's scale
+        self._step = min(range(len(self.steps)), key=lambda i: abs(self.steps[i] - target.render_scale))
+
+    def add_frame(self, frame_ms: float) -> None:
+        """
+        Record one frame's time and change the scale if a full sample calls for it
+
+        Args:
+            frame_ms: Time the frame's update and draw took in milliseconds
+        """
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._total -= samples[0]
+        samples.append(frame_ms)
+        self._total += frame_ms
+        if len(samples) < samples.maxlen:
+            return
+
+        mean = self._total / len(samples)
+        if mean > self.budget_ms and self._step < len(self.steps) - 1:
+            self._step += 1
+        elif mean < self.budget_ms * self.headroom and self._step > 0:
+            self._step -= 1
+        else:
+            return
+
+        # Judge the new scale on frames drawn at it only
+        self.target.set_render_scale(self.steps[self._step])
+        self.changes += 1
+        samples.clear()
+        self._total = 0.0
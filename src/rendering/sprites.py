@@ -0,0 +1,221 @@
+"""
+Sprite Cache - Shared sprite surfaces, decoded on background threads
+
+Sprites are requested the first time they are drawn rather than when entities are
+created, and every entity of the same size shares one scaled surface per file.
+Decoding and scaling run on a small thread pool; until a sprite arrives get_sprite()
+returns None and entities draw their colored fallback instead. Finished sprites are
+installed by pump() on the main thread, which also converts them to the display
+format.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+import os
+import queue
+import time
+import pygame
+
+from src.config import RenderSettings
+
+SpriteKey = Tuple[str, int]
+
+# (path, size) -> scaled surface, or None if the file is missing or unreadable
+_cache: Dict[SpriteKey, Optional[pygame.Surface]] = {}
+
+# Sprites being decoded -> time they were requested (time.perf_counter())
+_pending: Dict[SpriteKey, float] = {}
+
+# Decoded sprites waiting to be installed by pump()
+_finished: "queue.SimpleQueue[Tuple[SpriteKey, Optional[pygame.Surface]]]" = queue.SimpleQueue()
+
+# Created on the first request so importing this module starts no threads
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Request-to-install time of recently loaded sprites in milliseconds
+_latencies: Deque[float] = deque(maxlen=RenderSettings.SPRITE_LATENCY_WINDOW)
+_loaded = 0
+_failed = 0
+
+
+def get_sprite(path: str, size: int) -> Optional[pygame.Surface]:
+    """
+    Get a sprite scaled to size, requesting it in the background on first use
+
+    Args:
+        path: Path to sprite image file
+        size: Width and height to scale the sprite to
+
+    Returns:
+        Scaled sprite surface, or None if it is still loading or could not be loaded
+    """
+    key = (path, size)
+    sprite = _cache.get(key)
+    if sprite is not None or key in _cache:
+        return sprite
+
+    if key not in _pending:
+        _request(key)
+    return None
+
+
+def pump(limit: int = RenderSettings.SPRITE_INSTALLS_PER_FRAME) -> List[SpriteKey]:
+    """
+    Install sprites the loader threads have finished (call once per frame)
+
+    Args:
+        limit: Maximum number of sprites to install in this call
+
+    Returns:
+        (path, size) of each sprite installed (callers caching drawn sprites should
+        refresh whatever used them)
+    """
+    global _loaded, _failed
+
+    installed: List[SpriteKey] = []
+    while len(installed) < limit:
+        try:
+            key, sprite = _finished.get_nowait()
+        except queue.Empty:
+            break
+
+        if sprite is None:
+            _failed += 1
+        elif pygame.display.get_surface() is not None:
+            # convert_alpha needs the display, so it happens here rather than on a worker
+            sprite = sprite.convert_alpha()
+
+        _cache[key] = sprite
+        requested = _pending.pop(key, None)
+        if requested is not None:
+            _latencies.append((time.perf_counter() - requested) * 1000)
+        _loaded += 1
+        installed.append(key)
+    return installed
+
+
+def wait_for_sprites(timeout: Optional[float] = None) -> bool:
+    """
+    Block until every requested sprite has been installed
+
+    Meant for tools and screenshots; the game itself never waits.
+
+    Args:
+        timeout: Seconds to wait at most (None = no limit)
+
+    Returns:
+        True if nothing is left loading
+    """
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    while True:
+        pump(len(_pending))
+        if not _pending:
+            return True
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        time.sleep(0.001)
+
+
+def pending_count() -> int:
+    """
+    Get the loader queue depth
+
+    Returns:
+        Number of sprites requested but not yet installed
+    """
+    return len(_pending)
+
+
+def load_stats() -> Dict[str, float]:
+    """
+    Get sprite loading metrics
+
+    Returns:
+        Dict with pending (queue depth), loaded and failed counts, and the mean and
+        max request-to-install latency in milliseconds over recent loads
+    """
+    latencies = _latencies
+    return {
+        "pending": len(_pending),
+        "loaded": _loaded,
+        "failed": _failed,
+        "latency_mean_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+        "latency_max_ms": max(latencies) if latencies else 0.0,
+    }
+
+
+def cached_sprites() -> Iterator[Tuple[str, pygame.Surface]]:
+    """
+    Iterate over the decoded sprites currently in the cache
+
+    Returns:
+        Iterator of (path, surface) pairs, one per cached size
+    """
+    for (path, _size), sprite in _cache.items():
+        if sprite is not None:
+            yield path, sprite
+
+
+def clear_cache() -> None:
+    """Drop all decoded sprites (they are loaded again on next use)"""
+    _cache.clear()
+
+
+def shutdown() -> None:
+    """Stop the loader threads, dropping requests that have not started"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    _pending.clear()
+
+
+def _request(key: SpriteKey) -> None:
+    """
+    Queue a sprite for decoding on the loader threads
+
+    Args:
+        key: (path, size) of the sprite
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=RenderSettings.SPRITE_LOADER_THREADS,
+                                       thread_name_prefix="sprite-loader")
+    _pending[key] = time.perf_counter()
+    _executor.submit(_decode_job, key)
+
+
+def _decode_job(key: SpriteKey) -> None:
+    """
+    Loader thread: decode one sprite and hand it to the main thread
+
+    Args:
+        key: (path, size) of the sprite
+    """
+    sprite = None
+    try:
+        sprite = _decode(*key)
+    finally:
+        # Always report back so the sprite does not stay pending forever
+        _finished.put((key, sprite))
+
+
+def _decode(path: str, size: int) -> Optional[pygame.Surface]:
+    """
+    Decode and scale a sprite file
+
+    Args:
+        path: Path to sprite image file
+        size: Width and height to scale the sprite to
+
+    Returns:
+        Scaled sprite surface, or None if the file is missing or fails to load
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        sprite = pygame.image.load(path)
+    except pygame.error:
+        return None
+    return pygame.transform.scale(sprite, (size, size))
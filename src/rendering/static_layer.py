@@ -0,0 +1,276 @@
+"""
+Static Layer - Cached background surfaces for entities that never move
+
+Static entities (trees) are baked into per-chunk surfaces once. Each frame starts
+by blitting the chunks instead of clearing the screen and redrawing every tree.
+When a static entity changes appearance, only its region of the cache is patched.
+
+Chunks are always baked at world resolution. When the world is drawn at a reduced
+render scale, each visible chunk is scaled down once and the scaled copy is kept
+until the chunk is patched, dropped or the scale changes.
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+import math
+import pygame
+
+from src.entities.base import Entity
+from src.rendering.sprites import SpriteKey
+from src.config import Colors, RenderSettings
+
+ChunkKey = Tuple[int, int]
+
+
+class StaticLayer:
+    """Chunked surface cache for static entities"""
+
+    def __init__(self, chunk_size: int = RenderSettings.STATIC_CHUNK_SIZE,
+                 background: Tuple[int, int, int] = Colors.BLACK,
+                 max_chunks: int = RenderSettings.STATIC_CHUNK_CACHE) -> None:
+        """
+        Initialize an empty static layer
+
+        Args:
+            chunk_size: Width and height of each cached chunk surface in pixels
+            background: Color the layer is cleared to behind static entities
+            max_chunks: Baked chunks kept; the least recently drawn are dropped
+                (and baked again if they come back into view)
+        """
+        self.chunk_size = chunk_size
+        self.background = background
+        self.max_chunks = max_chunks
+
+        # Static entities indexed by every chunk their rect overlaps
+        self._entities: Dict[ChunkKey, List[Entity]] = {}
+
+        # Baked chunk surfaces (created lazily on first draw), least recently drawn first
+        self._chunks: 'OrderedDict[ChunkKey, pygame.Surface]' = OrderedDict()
+        self._blank: pygame.Surface | None = None
+
+        # Baked chunks scaled to the render scale of the last draw
+        self._scale = 1.0
+        self._scaled: Dict[ChunkKey, pygame.Surface] = {}
+        self._scaled_blank: pygame.Surface | None = None
+
+        # Entities whose region must be patched before the next draw
+        self._dirty: Set[Entity] = set()
+
+    def add(self, entity: Entity) -> None:
+        """
+        Register a static entity and bake it into the layer
+
+        Args:
+            entity: Entity that never moves (its appearance may still change)
+        """
+        rect = entity.get_rect()
+        for key in self._chunk_keys(rect):
+            self._entities.setdefault(key, []).append(entity)
+
+        entity.on_state_change = self.mark_dirty
+        self._dirty.add(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """
+        Unregister a static entity and erase it from the layer
+
+        Args:
+            entity: Entity previously passed to add()
+        """
+        rect = entity.get_rect()
+        for key in self._chunk_keys(rect):
+            entities = self._entities.get(key)
+            if entities and entity in entities:
+                entities.remove(entity)
+                if not entities:
+                    del self._entities[key]
+                    self._chunks.pop(key, None)
+                    self._scaled.pop(key, None)
+
+        entity.on_state_change = None
+        self._dirty.discard(entity)
+        self._patch(rect)
+
+    def mark_dirty(self, entity: Entity) -> None:
+        """
+        Schedule an entity's region to be re-rendered before the next draw
+
+        Args:
+            entity: Static entity whose appearance changed
+        """
+        self._dirty.add(entity)
+
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             scale: float = 1.0) -> None:
+        """
+        Blit all visible chunks, covering the whole screen
+
+        Args:
+            screen: Pygame surface to draw on
+            offset: World position of the screen's top-left corner
+            scale: Screen pixels per world pixel
+        """
+        self._flush()
+
+        if scale == 1.0:
+            view = pygame.Rect(offset, screen.get_size())
+            blits = []
+            for key in self._chunk_keys(view):
+                dest = (key[0] * self.chunk_size - offset[0], key[1] * self.chunk_size - offset[1])
+                blits.append((self._get_chunk(key), dest))
+            screen.blits(blits, doreturn=False)
+            return
+
+        if scale != self._scale:
+            self._scale = scale
+            self._scaled.clear()
+            self._scaled_blank = None
+
+        width, height = screen.get_size()
+        view = pygame.Rect(offset, (math.ceil(width / scale), math.ceil(height / scale)))
+        blits = []
+        for key in self._chunk_keys(view):
+            # Round every chunk's corner down the same way so neighbours meet without gaps
+            dest = (math.floor((key[0] * self.chunk_size - offset[0]) * scale),
+                    math.floor((key[1] * self.chunk_size - offset[1]) * scale))
+            blits.append((self._get_scaled_chunk(key), dest))
+        screen.blits(blits, doreturn=False)
+
+    def sprites_loaded(self, keys: Iterable[SpriteKey]) -> None:
+        """
+        Re-render baked entities drawn with a placeholder for sprites that just loaded
+
+        Args:
+            keys: (path, size) of the sprites installed (from sprites.pump())
+        """
+        loaded = set(keys)
+        for key in self._chunks:
+            for entity in self._entities.get(key, ()):
+                if (entity.sprite_path, entity.size) in loaded:
+                    self.mark_dirty(entity)
+
+    def invalidate(self) -> None:
+        """Drop every baked chunk so each is re-rendered on its next draw"""
+        self._chunks.clear()
+        self._scaled.clear()
+        self._dirty.clear()
+
+    def surfaces(self) -> List[pygame.Surface]:
+        """
+        Get every surface the layer currently holds
+
+        Returns:
+            Baked and scaled chunk surfaces, plus the shared blank chunks if they were created
+        """
+        surfaces = [*self._chunks.values(), *self._scaled.values()]
+        for blank in (self._blank, self._scaled_blank):
+            if blank is not None:
+                surfaces.append(blank)
+        return surfaces
+
+    def _flush(self) -> None:
+        """Patch the regions of all entities marked dirty"""
+        for entity in self._dirty:
+            self._patch(entity.get_rect())
+        self._dirty.clear()
+
+    def _patch(self, rect: pygame.Rect) -> None:
+        """
+        Re-render a world-space region in every baked chunk it overlaps
+
+        Args:
+            rect: World-space region to redraw
+        """
+        for key in self._chunk_keys(rect):
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                continue  # Not baked yet, will be rendered in full on first draw
+            self._scaled.pop(key, None)
+
+            origin = (key[0] * self.chunk_size, key[1] * self.chunk_size)
+            chunk.set_clip(rect.move(-origin[0], -origin[1]))
+            chunk.fill(self.background)
+            for entity in self._entities.get(key, ()):
+                if entity.get_rect().colliderect(rect):
+                    entity.draw(chunk, origin)
+            chunk.set_clip(None)
+
+    def _get_chunk(self, key: ChunkKey) -> pygame.Surface:
+        """
+        Get the baked surface for a chunk, baking it on first use
+
+        Args:
+            key: Chunk coordinates
+
+        Returns:
+            Surface for the chunk (a shared blank surface if it holds no entities)
+        """
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        entities = self._entities.get(key)
+        if not entities:
+            if self._blank is None:
+                self._blank = self._new_surface()
+            return self._blank
+
+        chunk = self._new_surface()
+        origin = (key[0] * self.chunk_size, key[1] * self.chunk_size)
+        for entity in entities:
+            entity.draw(chunk, origin)
+
+        self._chunks[key] = chunk
+        if len(self._chunks) > self.max_chunks:
+            evicted, _surface = self._chunks.popitem(last=False)
+            self._scaled.pop(evicted, None)
+        return chunk
+
+    def _get_scaled_chunk(self, key: ChunkKey) -> pygame.Surface:
+        """
+        Get a chunk scaled to the current render scale, scaling it on first use
+
+        Args:
+            key: Chunk coordinates
+
+        Returns:
+            Scaled surface for the chunk (a shared scaled blank if it holds no entities)
+        """
+        chunk = self._get_chunk(key)  # bakes the chunk and marks it recently drawn
+        if chunk is self._blank:
+            if self._scaled_blank is None:
+                self._scaled_blank = self._scale_surface(chunk)
+            return self._scaled_blank
+
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            scaled = self._scaled[key] = self._scale_surface(chunk)
+        return scaled
+
+    def _scale_surface(self, chunk: pygame.Surface) -> pygame.Surface:
+        """Scale a baked chunk to the current render scale (rounded up so chunks overlap, never gap)"""
+        size = math.ceil(self.chunk_size * self._scale)
+        return pygame.transform.scale(chunk, (size, size))
+
+    def _new_surface(self) -> pygame.Surface:
+        """Create an opaque chunk surface cleared to the background color"""
+        surface = pygame.Surface((self.chunk_size, self.chunk_size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.background)
+        return surface
+
+    def _chunk_keys(self, rect: pygame.Rect) -> Iterator[ChunkKey]:
+        """
+        Iterate over the keys of all chunks overlapping a world-space rect
+
+        Args:
+            rect: World-space rectangle
+
+        Yields:
+            (chunk_x, chunk_y) for each overlapped chunk
+        """
+        size = self.chunk_size
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield cx, cy
@@ -0,0 +1,138 @@
+"""
+Action Processor - Resolves queued actions on fixed game ticks
+
+Skilling and combat actions are queued as they happen and resolved together once
+per game tick (600 ms by default), independent of the render frame rate. Each tick
+resolves all queued actions grouped by type, in ActionType order, so every actor's
+chop, attack or respawn is handled in one pass per type.
+"""
+from collections import deque
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional
+import time
+
+from src.config import SimulationSettings
+
+
+class ActionType(IntEnum):
+    """Kinds of tick actions, in the order they are resolved within a tick"""
+    CHOP = 0     # actor (a player) chops target (a tree)
+    ATTACK = 1   # actor (a player) attacks target (an enemy)
+    RESPAWN = 2  # actor (a tree or enemy) respawns; no target
+
+
+# Handlers receive one tick's actions of their type as an actor -> target dict
+ActionHandler = Callable[[Dict[Any, Any]], None]
+
+
+class ActionProcessor:
+    """Queues actions and resolves them in batches on fixed-length game ticks"""
+
+    def __init__(self, tick_ms: float = SimulationSettings.GAME_TICK_MS) -> None:
+        """
+        Initialize processor with empty queues
+
+        Args:
+            tick_ms: Length of one game tick in milliseconds
+        """
+        self.tick_ms = tick_ms
+        self.tick = 0  # Number of ticks resolved so far
+        self._elapsed_ms = 0.0
+
+        # One queue per action type; an actor has at most one action of each type per tick
+        self._queues: List[Dict[Any, Any]] = [{} for _ in ActionType]
+        self._handlers: List[Optional[ActionHandler]] = [None for _ in ActionType]
+
+        # Processing time of recent ticks in milliseconds
+        self.tick_times: Deque[float] = deque(maxlen=SimulationSettings.TICK_STATS_WINDOW)
+
+    def register(self, action_type: ActionType, handler: ActionHandler) -> None:
+        """
+        Set the handler that resolves one action type
+
+        Args:
+            action_type: Type of action
+            handler: Called once per tick with that tick's actions of this type
+        """
+        self._handlers[action_type] = handler
+
+    def queue(self, action_type: ActionType, actor: Any, target: Any = None) -> None:
+        """
+        Queue an action for the next tick
+
+        Queuing the same action type again for an actor before the tick replaces
+        the earlier action.
+
+        Args:
+            action_type: Type of action
+            actor: Object performing the action
+            target: Object the action applies to (if any)
+        """
+        self._queues[action_type][actor] = target
+
+    def cancel(self, action_type: ActionType, actor: Any) -> None:
+        """
+        Remove an actor's queued action of one type
+
+        Args:
+            action_type: Type of action
+            actor: Object whose action to cancel
+        """
+        self._queues[action_type].pop(actor, None)
+
+    def advance(self, elapsed_ms: float) -> int:
+        """
+        Advance game time and resolve every tick that has come due
+
+        If the game falls far behind, at most SimulationSettings.MAX_CATCHUP_TICKS
+        ticks are resolved and the remaining backlog is dropped.
+
+        Args:
+            elapsed_ms: Real time since the previous call in milliseconds
+
+        Returns:
+            Number of ticks resolved
+        """
+        self._elapsed_ms += elapsed_ms
+        ticks = int(self._elapsed_ms // self.tick_ms)
+        if not ticks:
+            return 0
+
+        self._elapsed_ms -= ticks * self.tick_ms
+        ticks = min(ticks, SimulationSettings.MAX_CATCHUP_TICKS)
+        for _ in range(ticks):
+            self.run_tick()
+        return ticks
+
+    def run_tick(self) -> None:
+        """Resolve all queued actions, one batch per action type"""
+        start = time.perf_counter()
+
+        for action_type in ActionType:
+            batch = self._queues[action_type]
+            if not batch:
+                continue
+
+            # Actions queued while resolving (e.g. continuing an attack) go to the next tick
+            self._queues[action_type] = {}
+            handler = self._handlers[action_type]
+            if handler is not None:
+                handler(batch)
+
+        self.tick += 1
+        self.tick_times.append((time.perf_counter() - start) * 1000)
+
+    @property
+    def pending(self) -> int:
+        """Number of actions waiting for the next tick"""
+        return sum(len(queue) for queue in self._queues)
+
+    @property
+    def last_tick_ms(self) -> float:
+        """Processing time of the most recent tick in milliseconds"""
+        return self.tick_times[-1] if self.tick_times else 0.0
+
+    @property
+    def average_tick_ms(self) -> float:
+        """Mean processing time over recent ticks in milliseconds"""
+        return sum(self.tick_times) / len(self.tick_times) if self.tick_times else 0.0
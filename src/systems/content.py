@@ -0,0 +1,385 @@
+"""
+Content Pack - Compiled entity, item and placement definitions
+
+Game content is authored as JSON under content/ and compiled by
+scripts/build_content.py into a compact binary pack. At runtime the pack is
+memory-mapped and records are decoded on demand by integer ID, so large placement
+lists are loaded without parsing any text.
+
+Pack layout (little-endian):
+    header      HEADER struct (magic, version, section offsets and counts)
+    strings     (count + 1) u32 offsets into a UTF-8 blob, then the blob
+    items       ITEM_RECORD per item, indexed by item ID
+    entities    ENTITY_RECORD per entity type, indexed by type ID
+    placements  PLACEMENT_RECORD (type_id, x, y) per placed entity
+    loot        LOOT_TABLE_RECORD per loot table, indexed by table ID, then
+                LOOT_ENTRY_RECORD per table entry (each table's guaranteed
+                entries first, then its weighted ones)
+"""
+from enum import IntEnum
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+import mmap
+import struct
+
+PACK_MAGIC = b"TLRC"
+PACK_VERSION = 2
+
+# magic, version, reserved, then (offset, count) for
+# strings/items/entities/placements/loot tables/loot entries
+HEADER = struct.Struct("<4sHHIIIIIIIIIIII")
+# offset of one string in the string blob
+STRING_OFFSET = struct.Struct("<I")
+# name string, stack limit
+ITEM_RECORD = struct.Struct("<Ii")
+# name, sprite, depleted sprite, kind, size, max_hp, respawn_delay, xp, loot table ID
+ENTITY_RECORD = struct.Struct("<IIIBxHiiii")
+# entity type ID, x, y
+PLACEMENT_RECORD = struct.Struct("<iii")
+# name, first entry index, guaranteed entry count, weighted entry count
+LOOT_TABLE_RECORD = struct.Struct("<IIII")
+# item ID, weight, min quantity, max quantity
+LOOT_ENTRY_RECORD = struct.Struct("<ifii")
+
+PLACEMENT_BATCH = 4096  # placements copied out of the map at a time by iter_placements()
+
+NO_STRING = 0xFFFFFFFF  # string index meaning "no value"
+NO_ITEM = -1            # item ID meaning "no drop"
+NO_LOOT = -1            # loot table ID meaning "drops nothing"
+
+
+class EntityKind(IntEnum):
+    """Which entity class an entity type is instantiated as"""
+    TREE = 0
+    ENEMY = 1
+
+
+class ItemDef(NamedTuple):
+    """Compiled item definition"""
+    item_id: int
+    name: str
+    stack_limit: int
+
+
+class EntityDef(NamedTuple):
+    """Compiled entity type definition"""
+    type_id: int
+    name: str
+    kind: EntityKind
+    size: int
+    max_hp: int
+    respawn_delay: int
+    xp: int
+    loot_table: int
+    sprite: Optional[str]
+    depleted_sprite: Optional[str]
+
+
+class LootEntryDef(NamedTuple):
+    """Compiled loot table entry"""
+    item_id: int       # NO_ITEM for a roll that drops nothing
+    weight: float      # relative chance among the table's weighted entries
+    min_quantity: int
+    max_quantity: int
+
+
+class LootTableDef(NamedTuple):
+    """Compiled loot table definition"""
+    table_id: int
+    name: str
+    guaranteed: Tuple[LootEntryDef, ...]  # dropped on every roll
+    weighted: Tuple[LootEntryDef, ...]    # one of these is picked per roll
+
+
+class ContentPack:
+    """Read-only view of a memory-mapped content pack"""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open and memory-map a content pack
+
+        Args:
+            path: Path to a pack written by scripts/build_content.py
+
+        Raises:
+            ValueError: If the file is not a content pack of a supported version
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _reserved,
+         self._strings_offset, self._string_count,
+         self._items_offset, self.item_count,
+         self._entities_offset, self.entity_type_count,
+         self._placements_offset, self.placement_count,
+         self._loot_tables_offset, self.loot_table_count,
+         self._loot_entries_offset, self._loot_entry_count) = HEADER.unpack_from(self._data, 0)
+
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {PACK_VERSION} content pack")
+
+        self._blob_offset = self._strings_offset + (self._string_count + 1) * STRING_OFFSET.size
+
+        # Decoded records, filled on first lookup
+        self._strings: Dict[int, str] = {}
+        self._items: Dict[int, ItemDef] = {}
+        self._entity_types: Dict[int, EntityDef] = {}
+        self._loot_tables: Dict[int, LootTableDef] = {}
+        self._item_ids: Optional[Dict[str, int]] = None
+        self._entity_type_ids: Optional[Dict[str, int]] = None
+
+    def item(self, item_id: int) -> ItemDef:
+        """
+        Look up an item definition
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Item definition
+
+        Raises:
+            KeyError: If the pack has no item with this ID
+        """
+        item = self._items.get(item_id)
+        if item is None:
+            if not 0 <= item_id < self.item_count:
+                raise KeyError(item_id)
+            name, stack_limit = ITEM_RECORD.unpack_from(
+                self._data, self._items_offset + item_id * ITEM_RECORD.size)
+            item = ItemDef(item_id, self._string(name), stack_limit)
+            self._items[item_id] = item
+        return item
+
+    def entity_type(self, type_id: int) -> EntityDef:
+        """
+        Look up an entity type definition
+
+        Args:
+            type_id: Entity type ID
+
+        Returns:
+            Entity type definition
+
+        Raises:
+            KeyError: If the pack has no entity type with this ID
+        """
+        entity_type = self._entity_types.get(type_id)
+        if entity_type is None:
+            if not 0 <= type_id < self.entity_type_count:
+                raise KeyError(type_id)
+            (name, sprite, depleted_sprite, kind, size,
+             max_hp, respawn_delay, xp, loot_table) = ENTITY_RECORD.unpack_from(
+                self._data, self._entities_offset + type_id * ENTITY_RECORD.size)
+            entity_type = EntityDef(
+                type_id, self._string(name), EntityKind(kind), size,
+                max_hp, respawn_delay, xp, loot_table,
+                self._optional_string(sprite), self._optional_string(depleted_sprite),
+            )
+            self._entity_types[type_id] = entity_type
+        return entity_type
+
+    def loot_table(self, table_id: int) -> LootTableDef:
+        """
+        Look up a loot table definition
+
+        Args:
+            table_id: Loot table ID
+
+        Returns:
+            Loot table definition
+
+        Raises:
+            KeyError: If the pack has no loot table with this ID
+        """
+        table = self._loot_tables.get(table_id)
+        if table is None:
+            if not 0 <= table_id < self.loot_table_count:
+                raise KeyError(table_id)
+            name, first, guaranteed, weighted = LOOT_TABLE_RECORD.unpack_from(
+                self._data, self._loot_tables_offset + table_id * LOOT_TABLE_RECORD.size)
+            entries = [
+                LootEntryDef(*LOOT_ENTRY_RECORD.unpack_from(
+                    self._data, self._loot_entries_offset + index * LOOT_ENTRY_RECORD.size))
+                for index in range(first, first + guaranteed + weighted)
+            ]
+            table = LootTableDef(table_id, self._string(name),
+                                 tuple(entries[:guaranteed]), tuple(entries[guaranteed:]))
+            self._loot_tables[table_id] = table
+        return table
+
+    def item_id(self, name: str) -> int:
+        """
+        Find an item ID by name (builds a name index on first use)
+
+        Args:
+            name: Item name
+
+        Returns:
+            Item ID
+
+        Raises:
+            KeyError: If no item has this name
+        """
+        if self._item_ids is None:
+            self._item_ids = {self.item(i).name: i for i in range(self.item_count)}
+        return self._item_ids[name]
+
+    def entity_type_id(self, name: str) -> int:
+        """
+        Find an entity type ID by name (builds a name index on first use)
+
+        Args:
+            name: Entity type name
+
+        Returns:
+            Entity type ID
+
+        Raises:
+            KeyError: If no entity type has this name
+        """
+        if self._entity_type_ids is None:
+            self._entity_type_ids = {
+                self.entity_type(i).name: i for i in range(self.entity_type_count)
+            }
+        return self._entity_type_ids[name]
+
+    def placement(self, index: int) -> Tuple[int, int, int]:
+        """
+        Read a single placement
+
+        Args:
+            index: Placement index
+
+        Returns:
+            Tuple of (type_id, x, y)
+        """
+        if not 0 <= index < self.placement_count:
+            raise IndexError(index)
+        return PLACEMENT_RECORD.unpack_from(
+            self._data, self._placements_offset + index * PLACEMENT_RECORD.size)
+
+    def iter_placements(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over all placements, reading the mapped file in batches
+
+        Each batch is copied out of the map, so the pack can be closed before the
+        iteration has finished.
+
+        Yields:
+            Tuple of (type_id, x, y) for each placement
+        """
+        step = PLACEMENT_BATCH * PLACEMENT_RECORD.size
+        end = self._placements_offset + self.placement_count * PLACEMENT_RECORD.size
+        for start in range(self._placements_offset, end, step):
+            yield from PLACEMENT_RECORD.iter_unpack(self._data[start:min(start + step, end)])
+
+    def close(self) -> None:
+        """Unmap the pack and close the file"""
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ContentPack':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _string(self, index: int) -> str:
+        """
+        Decode a string from the string table
+
+        Args:
+            index: String index
+
+        Returns:
+            Decoded string
+        """
+        text = self._strings.get(index)
+        if text is None:
+            position = self._strings_offset + index * STRING_OFFSET.size
+            start, = STRING_OFFSET.unpack_from(self._data, position)
+            end, = STRING_OFFSET.unpack_from(self._data, position + STRING_OFFSET.size)
+            text = self._data[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+            self._strings[index] = text
+        return text
+
+    def _optional_string(self, index: int) -> Optional[str]:
+        """Decode a string, mapping NO_STRING to None"""
+        return None if index == NO_STRING else self._string(index)
+
+
+def write_pack(path: str, items: List[Tuple[str, int]], entity_types: List[Tuple],
+               placements: List[Tuple[int, int, int]],
+               loot_tables: List[Tuple[str, List[Tuple], List[Tuple]]] = ()) -> None:
+    """
+    Write a content pack (used by scripts/build_content.py)
+
+    Args:
+        path: Output file path
+        items: (name, stack_limit) per item, in item ID order
+        entity_types: (name, sprite, depleted_sprite, kind, size, max_hp,
+            respawn_delay, xp, loot_table) per entity type, in type ID order.
+            Sprite paths may be None.
+        placements: (type_id, x, y) per placement
+        loot_tables: (name, guaranteed, weighted) per loot table, in table ID
+            order; both entry lists hold (item_id, weight, min_quantity,
+            max_quantity) tuples
+    """
+    strings: List[bytes] = []
+    string_index: Dict[str, int] = {}
+
+    def intern(text: Optional[str]) -> int:
+        if text is None:
+            return NO_STRING
+        if text not in string_index:
+            string_index[text] = len(strings)
+            strings.append(text.encode("utf-8"))
+        return string_index[text]
+
+    item_records = b"".join(ITEM_RECORD.pack(intern(name), limit) for name, limit in items)
+    entity_records = b"".join(
+        ENTITY_RECORD.pack(intern(name), intern(sprite), intern(depleted), int(kind), *stats)
+        for name, sprite, depleted, kind, *stats in entity_types
+    )
+    placement_records = b"".join(PLACEMENT_RECORD.pack(*p) for p in placements)
+
+    loot_table_records = []
+    loot_entry_records = []
+    for name, guaranteed, weighted in loot_tables:
+        loot_table_records.append(LOOT_TABLE_RECORD.pack(
+            intern(name), len(loot_entry_records), len(guaranteed), len(weighted)))
+        loot_entry_records.extend(LOOT_ENTRY_RECORD.pack(*entry) for entry in (*guaranteed, *weighted))
+
+    offsets = [0]
+    for text in strings:
+        offsets.append(offsets[-1] + len(text))
+    string_table = b"".join(STRING_OFFSET.pack(o) for o in offsets) + b"".join(strings)
+    string_table += b"\0" * (-len(string_table) % 4)  # keep records 4-byte aligned
+
+    strings_offset = HEADER.size
+    items_offset = strings_offset + len(string_table)
+    entities_offset = items_offset + len(item_records)
+    placements_offset = entities_offset + len(entity_records)
+    loot_tables_offset = placements_offset + len(placement_records)
+    loot_entries_offset = loot_tables_offset + LOOT_TABLE_RECORD.size * len(loot_table_records)
+
+    header = HEADER.pack(
+        PACK_MAGIC, PACK_VERSION, 0,
+        strings_offset, len(strings),
+        items_offset, len(items),
+        entities_offset, len(entity_types),
+        placements_offset, len(placements),
+        loot_tables_offset, len(loot_table_records),
+        loot_entries_offset, len(loot_entry_records),
+    )
+
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(string_table)
+        f.write(item_records)
+        f.write(entity_records)
+        f.write(placement_records)
+        f.write(b"".join(loot_table_records))
+        f.write(b"".join(loot_entry_records))
@@ -0,0 +1,157 @@
+"""
+Event Bus - Batched game events between entities and systems
+
+Entities report what happened (items granted, XP gained, damage dealt) by emitting
+events instead of mutating each other directly. Events are queued into
+preallocated records during the tick and dispatched to listeners in one batch at
+the end of it. Grants of the same item or skill to the same target within a batch
+are merged, so listeners run once per tick for them rather than once per grant.
+"""
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.config import SimulationSettings
+
+
+class EventType(IntEnum):
+    """Kinds of game events"""
+    ITEM_GRANTED = 0    # target receives `amount` of item ID `key`
+    XP_GRANTED = 1      # target gains `amount` XP in skill ID `key`
+    DAMAGE_DEALT = 2    # source hits target for `amount` damage
+    TREE_CHOPPED = 3    # source chopped target (a tree)
+    ENEMY_DEFEATED = 4  # source defeated target (an enemy)
+
+
+# Event types whose amounts are summed when emitted repeatedly within one batch
+MERGED_TYPES = frozenset((EventType.ITEM_GRANTED, EventType.XP_GRANTED))
+
+
+class Event:
+    """A reusable event record (owned by the bus; don't keep references to it)"""
+
+    __slots__ = ('type', 'source', 'target', 'key', 'amount')
+
+    def __init__(self) -> None:
+        self.type: EventType = EventType.ITEM_GRANTED
+        self.source: Any = None
+        self.target: Any = None
+        self.key: int = 0
+        self.amount: int = 0
+
+
+Listener = Callable[[Event], None]
+
+
+class EventBus:
+    """Queues events during a tick and dispatches them in one batch"""
+
+    def __init__(self, capacity: int = SimulationSettings.EVENT_QUEUE_CAPACITY) -> None:
+        """
+        Initialize bus with preallocated event records
+
+        Args:
+            capacity: Number of records allocated up front per queue (the queue
+                grows if a tick emits more than this)
+        """
+        # Two queues: listeners emit into the front one while the back one is dispatched
+        self._queue: List[Event] = [Event() for _ in range(capacity)]
+        self._spare: List[Event] = [Event() for _ in range(capacity)]
+        self._count = 0
+
+        # (type, target, key) -> queued record, for merging grants
+        self._merge_index: Dict[Tuple[EventType, Any, int], Event] = {}
+
+        self._listeners: List[List[Listener]] = [[] for _ in EventType]
+
+    def subscribe(self, event_type: EventType, listener: Listener) -> None:
+        """
+        Register a listener for one event type
+
+        Args:
+            event_type: Type of events to receive
+            listener: Called with each event of that type at dispatch time
+        """
+        self._listeners[event_type].append(listener)
+
+    def unsubscribe(self, event_type: EventType, listener: Listener) -> None:
+        """
+        Remove a previously registered listener
+
+        Args:
+            event_type: Type the listener was registered for
+            listener: Listener to remove
+        """
+        self._listeners[event_type].remove(listener)
+
+    def emit(self, event_type: EventType, source: Any, target: Any,
+             key: int = 0, amount: int = 0) -> None:
+        """
+        Queue an event for the next dispatch
+
+        Args:
+            event_type: Type of event
+            source: Object that caused the event
+            target: Object the event applies to
+            key: Type-specific ID (item ID, skill ID)
+            amount: Type-specific quantity (items, XP, damage)
+        """
+        if event_type in MERGED_TYPES:
+            merge_key = (event_type, target, key)
+            queued = self._merge_index.get(merge_key)
+            if queued is not None:
+                queued.amount += amount
+                return
+        else:
+            merge_key = None
+
+        if self._count == len(self._queue):
+            self._queue.append(Event())
+        event = self._queue[self._count]
+        self._count += 1
+
+        event.type = event_type
+        event.source = source
+        event.target = target
+        event.key = key
+        event.amount = amount
+
+        if merge_key is not None:
+            self._merge_index[merge_key] = event
+
+    def dispatch(self) -> int:
+        """
+        Deliver all queued events to their listeners
+
+        Events emitted by listeners are delivered in a follow-up batch within the
+        same call, up to SimulationSettings.EVENT_MAX_CASCADE batches.
+
+        Returns:
+            Number of events dispatched
+        """
+        dispatched = 0
+        for _ in range(SimulationSettings.EVENT_MAX_CASCADE):
+            count = self._count
+            if not count:
+                break
+
+            # Swap queues so listeners can emit while this batch is delivered
+            batch = self._queue
+            self._queue, self._spare = self._spare, batch
+            self._count = 0
+            self._merge_index.clear()
+
+            listeners = self._listeners
+            for index in range(count):
+                event = batch[index]
+                for listener in listeners[event.type]:
+                    listener(event)
+                event.source = event.target = None
+
+            dispatched += count
+
+        return dispatched
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be dispatched"""
+        return self._count
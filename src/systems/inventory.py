@@ -2,81 +2,298 @@
 Inventory System - Manages player item storage
 
 This module handles inventory data logic only. Rendering is handled by the UI module.
+
+Items live in a fixed number of slots, each holding one stack of a single item ID.
+A reverse index from item ID to its stacks and a running total per item keep
+add_item, remove_item and has_item O(1) regardless of how many items are held.
 """
-from typing import Dict
+from heapq import heappop, heappush
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.config import GameBalance
+from src.systems.items import ITEMS, ItemKey, ItemRegistry
+
+EMPTY_SLOT = -1
 
 
 class Inventory:
     """Manages player inventory items"""
 
-    def __init__(self) -> None:
-        """Initialize empty inventory"""
-        self.items: Dict[str, int] = {}
+    def __init__(self, capacity: int = GameBalance.INVENTORY_SLOTS,
+                 max_stack: Optional[int] = None, registry: ItemRegistry = ITEMS) -> None:
+        """
+        Initialize empty inventory
+
+        Args:
+            capacity: Number of slots
+            max_stack: Stack limit for every item, overriding per-item limits
+                (e.g. a bank where everything stacks)
+            registry: Item registry used to look up items
+        """
+        self.capacity = capacity
+        self.max_stack = max_stack
+        self.registry = registry
         self.visible: bool = False
 
-    def add_item(self, item_name: str, quantity: int = 1) -> None:
+        # Item ID and quantity per slot
+        self.slot_items: List[int] = [EMPTY_SLOT] * capacity
+        self.slot_counts: List[int] = [0] * capacity
+
+        # Item ID -> its slots in fill order; every stack but the last is full
+        self._stacks: Dict[int, List[int]] = {}
+        # Item ID -> total quantity held
+        self._totals: Dict[int, int] = {}
+        # Free slots as a min-heap, so new stacks fill the lowest slot first
+        self._free: List[int] = list(range(capacity))
+        # The registry's tables, used directly on the hot paths: item ID by name or
+        # ID (unknown items are missing) and per-item stack limits
+        self._lookup = registry.lookup
+        self._limits = registry.stack_limits
+
+    def add_item(self, item: ItemKey, quantity: int = 1) -> bool:
         """
         Add items to inventory
 
+        Nothing is added unless the full quantity fits.
+
         Args:
-            item_name: Name of the item to add
+            item: ID or name of a registered item
             quantity: Number of items to add (default: 1)
+
+        Returns:
+            True if the items were added, False if the item is unknown or there
+            was not enough room
         """
-        if item_name in self.items:
-            self.items[item_name] += quantity
-        else:
-            self.items[item_name] = quantity
+        item_id = self._lookup.get(item)
+        if item_id is None:
+            return False
 
-    def remove_item(self, item_name: str, quantity: int = 1) -> bool:
+        limit = self.max_stack or self._limits[item_id]
+        room = 0
+        stacks = self._stacks.get(item_id)
+        if stacks:
+            # Fast path: the quantity fits in the item's last stack
+            last = stacks[-1]
+            room = limit - self.slot_counts[last]
+            if 0 < quantity <= room:
+                self.slot_counts[last] += quantity
+                self._totals[item_id] += quantity
+                return True
+
+        if quantity > room + len(self._free) * limit:
+            return False
+
+        self._put(item_id, quantity)
+        return True
+
+    def remove_item(self, item: ItemKey, quantity: int = 1) -> bool:
         """
         Remove items from inventory
 
         Args:
-            item_name: Name of the item to remove
+            item: ID or name of the item to remove
             quantity: Number of items to remove (default: 1)
 
         Returns:
             True if items were removed successfully, False if not enough items
         """
-        if item_name not in self.items:
-            return False
+        item_id = self._lookup.get(item)
 
-        if self.items[item_name] < quantity:
-            return False
+        # Fast path: the last stack holds more than the quantity
+        stacks = self._stacks.get(item_id)
+        if stacks and 0 < quantity < self.slot_counts[stacks[-1]]:
+            self.slot_counts[stacks[-1]] -= quantity
+            self._totals[item_id] -= quantity
+            return True
 
-        self.items[item_name] -= quantity
-
-        # Remove item from dict if quantity reaches 0
-        if self.items[item_name] == 0:
-            del self.items[item_name]
+        if self._totals.get(item_id, 0) < quantity:
+            return False
 
+        self._take(item_id, quantity)
         return True
 
-    def has_item(self, item_name: str, quantity: int = 1) -> bool:
+    def has_item(self, item: ItemKey, quantity: int = 1) -> bool:
         """
         Check if inventory contains specified quantity of an item
 
         Args:
-            item_name: Name of the item to check
+            item: ID or name of the item to check
             quantity: Required quantity (default: 1)
 
         Returns:
             True if inventory has at least the specified quantity
         """
-        return self.items.get(item_name, 0) >= quantity
+        # Unknown items (None) are never in _totals
+        return self._totals.get(self._lookup.get(item), 0) >= quantity
+
+    def get_item_count(self, item: ItemKey) -> int:
+        """
+        Get the quantity of a specific item
+
+        Args:
+            item: ID or name of the item
+
+        Returns:
+            Quantity of the item (0 if not in inventory)
+        """
+        return self._totals.get(self._lookup.get(item), 0)
+
+    def transfer_item(self, dest: 'Inventory', item: ItemKey, quantity: int) -> bool:
+        """
+        Move a quantity of one item into another inventory
+
+        Args:
+            dest: Inventory to move the items into
+            item: ID or name of the item to move
+            quantity: Number of items to move
+
+        Returns:
+            True if the items were moved, False if this inventory has too few or
+            dest has too little room (nothing is moved in that case)
+        """
+        item_id = self._lookup.get(item)
+        if (item_id is None or self._totals.get(item_id, 0) < quantity
+                or quantity > dest._room_for(item_id)):
+            return False
+
+        self._take(item_id, quantity)
+        dest._put(item_id, quantity)
+        return True
+
+    def transfer_all(self, dest: 'Inventory') -> bool:
+        """
+        Move every item into another inventory (e.g. bank deposit-all)
+
+        Each item moves as one whole quantity rather than slot by slot. Items
+        that don't fit in dest stay behind, partially if only some fit.
+
+        Args:
+            dest: Inventory to move the items into
+
+        Returns:
+            True if everything was moved, False if some items stayed behind
+        """
+        for item_id, total in list(self._totals.items()):
+            moved = min(total, dest._room_for(item_id))
+            if moved:
+                dest._put(item_id, moved)
+                self._take(item_id, moved)
+
+        return not self._totals
+
+    def clear(self) -> None:
+        """Remove all items"""
+        self.slot_items = [EMPTY_SLOT] * self.capacity
+        self.slot_counts = [0] * self.capacity
+        self._stacks.clear()
+        self._totals.clear()
+        self._free = list(range(self.capacity))
+
+    def slots(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over occupied slots in slot order
+
+        Yields:
+            Tuple of (slot index, item ID, quantity)
+        """
+        for slot, item_id in enumerate(self.slot_items):
+            if item_id != EMPTY_SLOT:
+                yield slot, item_id, self.slot_counts[slot]
+
+    @property
+    def items(self) -> Dict[str, int]:
+        """Total quantity of each held item, keyed by item name"""
+        return {self.registry.name(item_id): total for item_id, total in self._totals.items()}
+
+    @property
+    def free_slots(self) -> int:
+        """Number of empty slots"""
+        return len(self._free)
 
     def toggle(self) -> None:
         """Toggle inventory visibility"""
         self.visible = not self.visible
 
-    def get_item_count(self, item_name: str) -> int:
+    def _stack_limit(self, item_id: int) -> int:
+        """Maximum quantity of an item per slot in this inventory"""
+        return self.max_stack or self._limits[item_id]
+
+    def _room_for(self, item_id: int) -> int:
         """
-        Get the quantity of a specific item
+        How many of an item can be added
 
         Args:
-            item_name: Name of the item
+            item_id: Item ID
 
         Returns:
-            Quantity of the item (0 if not in inventory)
+            Space left in the item's last stack plus all free slots
         """
-        return self.items.get(item_name, 0)
+        limit = self._stack_limit(item_id)
+        room = len(self._free) * limit
+        stacks = self._stacks.get(item_id)
+        if stacks:
+            room += limit - self.slot_counts[stacks[-1]]
+        return room
+
+    def _put(self, item_id: int, quantity: int) -> None:
+        """Add items assuming there is room (topping up the last stack first)"""
+        if quantity <= 0:
+            return
+
+        limit = self.max_stack or self._limits[item_id]
+        counts = self.slot_counts
+        stacks = self._stacks.get(item_id)
+        if stacks is None:
+            stacks = self._stacks[item_id] = []
+            self._totals[item_id] = quantity
+        else:
+            self._totals[item_id] += quantity
+            last = stacks[-1]
+            room = limit - counts[last]
+            if quantity <= room:
+                counts[last] += quantity
+                return
+            counts[last] = limit
+            quantity -= room
+
+        # Fill new stacks in the lowest free slots
+        free, items = self._free, self.slot_items
+        while quantity > 0:
+            slot = heappop(free)
+            items[slot] = item_id
+            counts[slot] = quantity if quantity < limit else limit
+            stacks.append(slot)
+            quantity -= limit
+
+    def _take(self, item_id: int, quantity: int) -> None:
+        """Remove items assuming enough are held (emptying the last stack first)"""
+        if quantity <= 0:
+            return
+
+        stacks = self._stacks[item_id]
+        total = self._totals[item_id] - quantity
+        free, items, counts = self._free, self.slot_items, self.slot_counts
+
+        if not total:
+            # Everything goes: free every stack
+            for slot in stacks:
+                items[slot] = EMPTY_SLOT
+                counts[slot] = 0
+                heappush(free, slot)
+            del self._totals[item_id]
+            del self._stacks[item_id]
+            return
+
+        self._totals[item_id] = total
+        while quantity > 0:
+            last = stacks[-1]
+            count = counts[last]
+            if count > quantity:
+                counts[last] = count - quantity
+                return
+
+            quantity -= count
+            items[last] = EMPTY_SLOT
+            counts[last] = 0
+            heappush(free, last)
+            stacks.pop()
@@ -0,0 +1,128 @@
+"""
+Item Registry - Interned integer IDs for item names
+
+Items are handled by integer ID everywhere at runtime; the registry maps names to
+IDs (and back) and stores each item's stack limit. Items are registered explicitly
+or from the content pack; lookups of unknown items never register them.
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from src.config import GameBalance
+
+if TYPE_CHECKING:
+    from src.systems.content import ContentPack
+
+# Items can be referred to by ID or by name
+ItemKey = Union[int, str]
+
+
+class ItemRegistry:
+    """Maps item names to interned integer IDs"""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry"""
+        self._names: List[str] = []
+        self._stack_limits: List[int] = []
+        # Name and ID of every registered item -> ID, so find() is one dict lookup
+        self._ids: Dict[ItemKey, int] = {}
+
+    def intern(self, name: str, stack_limit: int = GameBalance.DEFAULT_STACK_LIMIT) -> int:
+        """
+        Get the ID for an item name, registering it if new
+
+        Args:
+            name: Item name
+            stack_limit: Maximum quantity per inventory slot (used if the item is new)
+
+        Returns:
+            Item ID
+        """
+        item_id = self._ids.get(name)
+        if item_id is None:
+            item_id = len(self._names)
+            self._ids[name] = item_id
+            self._ids[item_id] = item_id
+            self._names.append(name)
+            self._stack_limits.append(stack_limit)
+        return item_id
+
+    def resolve(self, item: ItemKey) -> int:
+        """
+        Get the ID for an item given by ID or name, registering new names
+
+        For definitions (e.g. loot tables) only; use find() to look items up.
+
+        Args:
+            item: Item ID or name (names are interned if new)
+
+        Returns:
+            Item ID
+        """
+        if isinstance(item, str):
+            return self.intern(item)
+        return item
+
+    def find(self, item: ItemKey) -> Optional[int]:
+        """
+        Look up a registered item given by ID or name
+
+        Args:
+            item: Item ID or name
+
+        Returns:
+            Item ID, or None if no such item is registered
+        """
+        return self._ids.get(item)
+
+    def name(self, item_id: int) -> str:
+        """
+        Get an item's name
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Item name
+        """
+        return self._names[item_id]
+
+    def stack_limit(self, item_id: int) -> int:
+        """
+        Get an item's stack limit
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Maximum quantity per inventory slot
+        """
+        return self._stack_limits[item_id]
+
+    @property
+    def lookup(self) -> Dict[ItemKey, int]:
+        """Item ID by name or ID of every registered item (live; do not modify)"""
+        return self._ids
+
+    @property
+    def stack_limits(self) -> List[int]:
+        """Stack limit of every item indexed by item ID (live; do not modify)"""
+        return self._stack_limits
+
+    def load_content(self, content: 'ContentPack') -> None:
+        """
+        Register every item defined in a content pack
+
+        Args:
+            content: Open content pack
+        """
+        for pack_id in range(content.item_count):
+            item = content.item(pack_id)
+            item_id = self.intern(item.name, item.stack_limit)
+            self._stack_limits[item_id] = item.stack_limit
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# Shared registry used by all inventories
+ITEMS = ItemRegistry()
@@ -0,0 +1,188 @@
+"""
+Simulation LOD - Distance-based update rates for world entities
+
+Entities are sorted into bands by their distance from the player each frame:
+
+    NEAR    within the near radius: updated every frame
+    FAR     out to the active radius: updated every Nth frame, staggered so an
+            equal share of them runs on each frame
+    FROZEN  beyond the active radius: not updated at all
+
+Every entity remembers the game time of its last update and is always handed the
+full game time since then, so timers count down at the same rate in every band.
+A frozen entity that comes back into range receives everything it missed in one
+update; entity updates are plain countdowns, so that single large step is the
+exact fast-forward. When an entity's state changes between its updates (it is
+chopped or defeated), touch() moves its last update time up to the change so the
+new timer is not charged for time that passed before it started.
+"""
+from array import array
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import numpy as np
+
+from src.config import SimulationSettings
+
+if TYPE_CHECKING:
+    from src.entities.base import Entity
+
+
+class LODBand(IntEnum):
+    """Simulation detail level of an entity"""
+    NEAR = 0
+    FAR = 1
+    FROZEN = 2
+
+
+class SimulationLOD:
+    """Picks which entities of one group update this frame, and by how much game time"""
+
+    def __init__(self, near_radius: float = SimulationSettings.LOD_NEAR_RADIUS,
+                 active_radius: float = SimulationSettings.LOD_ACTIVE_RADIUS,
+                 far_interval: int = SimulationSettings.LOD_FAR_INTERVAL,
+                 capacity: int = 64) -> None:
+        """
+        Initialize an empty group
+
+        Args:
+            near_radius: Distance from the player within which entities update every frame
+            active_radius: Distance beyond which entities are frozen
+            far_interval: Frames between updates of an entity in the far band
+                (1 updates the far band every frame)
+            capacity: Initial number of entity slots (grows as needed)
+        """
+        self.near_radius = near_radius
+        self.active_radius = active_radius
+        self.far_interval = max(1, far_interval)
+
+        self.positions = np.zeros((capacity, 2))
+        self.last_update_ms = np.zeros(capacity)  # game time of each entity's last update
+        self.count = 0
+        self._slots: Dict['Entity', int] = {}
+        self._entities: List['Entity'] = []  # entity in each slot
+        self._frame = 0
+
+        # Entities in each band and entities updated in each band on the last select()
+        self.band_counts = array('i', [0]) * len(LODBand)
+        self.updated_counts = array('i', [0]) * len(LODBand)
+
+    def add(self, entity: 'Entity', now_ms: float) -> int:
+        """
+        Register an entity (entities in a group don't move)
+
+        Args:
+            entity: Entity to register
+            now_ms: Current game time in milliseconds
+
+        Returns:
+            Slot of the entity; slots are handed out in order, so they match the
+            index of the entity in a list it is appended to at the same time
+        """
+        if self.count == len(self.last_update_ms):
+            self._grow()
+
+        slot = self.count
+        self.positions[slot] = (entity.x, entity.y)
+        self.last_update_ms[slot] = now_ms
+        self._slots[entity] = slot
+        self._entities.append(entity)
+        self.count += 1
+        return slot
+
+    def remove(self, entity: 'Entity') -> int:
+        """
+        Unregister an entity (e.g. when its chunk is unloaded)
+
+        The entity in the last slot moves into the freed slot, so slots stay dense.
+
+        Args:
+            entity: Registered entity
+
+        Returns:
+            Slot the entity had; a list kept in step with the slots must move its
+            last item into that index and drop the end the same way
+        """
+        slot = self._slots.pop(entity)
+        last = self.count - 1
+        if slot != last:
+            moved = self._entities[last]
+            self._entities[slot] = moved
+            self._slots[moved] = slot
+            self.positions[slot] = self.positions[last]
+            self.last_update_ms[slot] = self.last_update_ms[last]
+        self._entities.pop()
+        self.count = last
+        return slot
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        """Check whether an entity is registered"""
+        return entity in self._slots
+
+    def touch(self, entity: 'Entity', now_ms: float) -> None:
+        """
+        Mark an entity as up to date after its state changed outside update()
+
+        Args:
+            entity: Registered entity (ignored if it has been removed)
+            now_ms: Current game time in milliseconds
+        """
+        slot = self._slots.get(entity)
+        if slot is not None:
+            self.last_update_ms[slot] = now_ms
+
+    def pending_ms(self, entity: 'Entity', now_ms: float) -> float:
+        """
+        Game time an entity has not been updated for yet
+
+        Args:
+            entity: Registered entity
+            now_ms: Current game time in milliseconds
+
+        Returns:
+            Milliseconds its next update would advance it by
+        """
+        return now_ms - float(self.last_update_ms[self._slots[entity]])
+
+    def select(self, x: float, y: float, now_ms: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pick the entities to update this frame (call once per frame)
+
+        Args:
+            x: Player X coordinate
+            y: Player Y coordinate
+            now_ms: Current game time in milliseconds
+
+        Returns:
+            Tuple of (slots to update, game time in milliseconds each of them
+            has to advance by)
+        """
+        n = self.count
+        delta = self.positions[:n] - (x, y)
+        dist_sq = np.einsum('ij,ij->i', delta, delta)
+        near = dist_sq <= self.near_radius * self.near_radius
+        far = (dist_sq <= self.active_radius * self.active_radius) & ~near
+
+        # Far entities take turns: slot s runs on frames where (s + frame) % interval == 0
+        far_due = np.zeros(n, dtype=bool)
+        far_due[(-self._frame) % self.far_interval::self.far_interval] = True
+        far_due &= far
+        self._frame += 1
+
+        slots = np.flatnonzero(near | far_due)
+        elapsed = now_ms - self.last_update_ms[slots]
+        self.last_update_ms[slots] = now_ms
+
+        near_count = int(np.count_nonzero(near))
+        far_count = int(np.count_nonzero(far))
+        self.band_counts[LODBand.NEAR] = near_count
+        self.band_counts[LODBand.FAR] = far_count
+        self.band_counts[LODBand.FROZEN] = n - near_count - far_count
+        self.updated_counts[LODBand.NEAR] = near_count
+        self.updated_counts[LODBand.FAR] = len(slots) - near_count
+        return slots, elapsed
+
+    def _grow(self) -> None:
+        """Double the number of entity slots"""
+        new = max(1, len(self.last_update_ms) * 2)
+        self.positions = np.resize(self.positions, (new, 2))
+        self.last_update_ms = np.resize(self.last_update_ms, new)
@@ -0,0 +1,324 @@
+"""
+Loot Tables - Weighted drops sampled with the alias method
+
+A loot table has guaranteed entries, dropped on every roll, and weighted entries,
+of which exactly one is picked per roll (an entry may be "nothing"). The weighted
+entries are compiled into a Vose alias table, so a roll costs one random number
+and one comparison however many entries and rare drops the table has.
+
+Rolls in the game draw from a per-world random.Random seeded from the world seed,
+so the same seed gives the same drops in the same order. roll_batch() and
+simulate() draw from a NumPy Generator instead, for drop-rate analysis over
+millions of kills.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import random
+import numpy as np
+
+from src.config import SimulationSettings
+from src.systems.content import NO_ITEM, ContentPack, LootEntryDef, LootTableDef
+from src.systems.events import EventBus, EventType
+from src.systems.items import ITEMS, ItemKey, ItemRegistry
+
+# Mixed into the world seed so loot rolls get their own random stream
+_LOOT_SALT = 0x6C6F6F74
+
+
+class LootEntry(NamedTuple):
+    """One possible drop of a loot table"""
+    item: Optional[ItemKey]  # ID or name of the item, or None for "nothing"
+    weight: float = 1.0      # relative chance among weighted entries (ignored if guaranteed)
+    min_quantity: int = 1
+    max_quantity: int = 1
+
+
+class LootTable:
+    """Guaranteed and weighted drops, sampled in O(1) per roll"""
+
+    def __init__(self, weighted: Sequence[LootEntry] = (), guaranteed: Sequence[LootEntry] = (),
+                 name: str = "", registry: ItemRegistry = ITEMS) -> None:
+        """
+        Compile a loot table
+
+        Args:
+            weighted: Entries one of which is picked per roll
+            guaranteed: Entries dropped on every roll
+            name: Table name (for reports)
+            registry: Item registry used to resolve item names
+
+        Raises:
+            ValueError: If a weight is negative, the weights sum to zero or a
+                quantity range is empty
+        """
+        self.name = name
+
+        # Guaranteed drops as (item ID, min quantity, quantity span)
+        self._guaranteed: List[Tuple[int, int, int]] = [
+            (item_id, low, span) for item_id, _weight, low, span in _resolve(guaranteed, registry)
+        ]
+
+        # Weighted drops, one slot per entry
+        resolved = _resolve(weighted, registry)
+        self._items = [item_id for item_id, _weight, _low, _span in resolved]
+        self._min = [low for _item_id, _weight, low, _span in resolved]
+        self._span = [span for _item_id, _weight, _low, span in resolved]
+        self._weights = [weight for _item_id, weight, _low, _span in resolved]
+        self._count = len(resolved)
+        self._prob, self._alias = _build_alias(self._weights)
+
+        # The same table as arrays for batch rolls
+        self._item_array = np.array(self._items, dtype=np.int64)
+        self._min_array = np.array(self._min, dtype=np.int64)
+        self._span_array = np.array(self._span, dtype=np.int64)
+        self._prob_array = np.array(self._prob, dtype=np.float64)
+        self._alias_array = np.array(self._alias, dtype=np.intp)
+
+    @classmethod
+    def from_definition(cls, definition: LootTableDef, item_names: Sequence[str],
+                        registry: ItemRegistry = ITEMS) -> 'LootTable':
+        """
+        Build a loot table from a content pack definition
+
+        Args:
+            definition: LootTableDef from the content pack
+            item_names: Item name per content pack item ID
+            registry: Item registry the pack's items are interned into
+
+        Returns:
+            Compiled loot table
+        """
+        def entries(defs: Sequence[LootEntryDef]) -> List[LootEntry]:
+            return [LootEntry(None if d.item_id == NO_ITEM else item_names[d.item_id],
+                              d.weight, d.min_quantity, d.max_quantity) for d in defs]
+
+        return cls(entries(definition.weighted), entries(definition.guaranteed),
+                   definition.name, registry)
+
+    def pick(self, rng: random.Random) -> int:
+        """
+        Pick one weighted entry
+
+        Args:
+            rng: Random number generator to draw from
+
+        Returns:
+            Index of the picked weighted entry
+        """
+        # One draw gives both the column (integer part) and the coin flip (fraction)
+        u = rng.random() * self._count
+        column = int(u)
+        return column if u - column < self._prob[column] else self._alias[column]
+
+    def roll(self, rng: random.Random) -> List[Tuple[int, int]]:
+        """
+        Roll the table once
+
+        Args:
+            rng: Random number generator to draw from
+
+        Returns:
+            List of (item ID, quantity) drops: every guaranteed entry, then the
+            picked weighted entry unless it is "nothing"
+        """
+        random_ = rng.random
+        drops = [(item_id, low + int(random_() * span) if span > 1 else low)
+                 for item_id, low, span in self._guaranteed]
+        if self._count:
+            # Inlined pick()
+            u = random_() * self._count
+            index = int(u)
+            if u - index >= self._prob[index]:
+                index = self._alias[index]
+
+            item_id = self._items[index]
+            if item_id != NO_ITEM:
+                span = self._span[index]
+                low = self._min[index]
+                drops.append((item_id, low + int(random_() * span) if span > 1 else low))
+        return drops
+
+    def grant(self, rng: random.Random, source: Any, target: Any, events: EventBus) -> None:
+        """
+        Roll the table once and grant the drops
+
+        Args:
+            rng: Random number generator to draw from
+            source: Object the drops come from (e.g. the defeated enemy)
+            target: Entity receiving the drops (its inventory gets them on dispatch)
+            events: Event bus the item grants are emitted on
+        """
+        for item_id, quantity in self.roll(rng):
+            events.emit(EventType.ITEM_GRANTED, source, target, item_id, quantity)
+
+    def roll_batch(self, count: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pick the weighted drop of many rolls at once
+
+        Guaranteed entries are not included; they drop on every roll.
+
+        Args:
+            count: Number of rolls
+            rng: NumPy random generator to draw from
+
+        Returns:
+            Tuple of (item ID per roll, NO_ITEM for "nothing"; quantity per roll)
+        """
+        if not self._count:
+            return np.full(count, NO_ITEM, dtype=np.int64), np.zeros(count, dtype=np.int64)
+
+        u = rng.random(count) * self._count
+        columns = u.astype(np.intp)
+        picked = np.where(u - columns < self._prob_array[columns], columns, self._alias_array[columns])
+        quantities = self._min_array[picked] + (rng.random(count) * self._span_array[picked]).astype(np.int64)
+        return self._item_array[picked], quantities
+
+    def simulate(self, rolls: int, rng: np.random.Generator,
+                 batch: int = SimulationSettings.LOOT_SIMULATION_BATCH) -> Dict[int, Tuple[int, int]]:
+        """
+        Roll the table many times and total the drops
+
+        Args:
+            rolls: Number of rolls (e.g. kills) to simulate
+            rng: NumPy random generator to draw from
+            batch: Rolls drawn per batch (bounds memory use)
+
+        Returns:
+            Item ID -> (number of drops, total quantity) for every item that dropped
+        """
+        size = max([NO_ITEM, *self._items, *(item_id for item_id, _low, _span in self._guaranteed)]) + 2
+        drops = np.zeros(size, dtype=np.int64)
+        quantities = np.zeros(size, dtype=np.int64)
+
+        done = 0
+        while done < rolls:
+            count = min(batch, rolls - done)
+            done += count
+
+            items, amounts = self.roll_batch(count, rng)
+            drops += np.bincount(items + 1, minlength=size)
+            quantities += np.bincount(items + 1, weights=amounts, minlength=size).astype(np.int64)
+
+            for item_id, low, span in self._guaranteed:
+                drops[item_id + 1] += count
+                quantities[item_id + 1] += count * low
+                if span > 1:
+                    quantities[item_id + 1] += (rng.random(count) * span).astype(np.int64).sum()
+
+        # Slot 0 counts rolls that dropped nothing
+        return {item_id - 1: (int(drops[item_id]), int(quantities[item_id]))
+                for item_id in np.flatnonzero(drops[1:]) + 1}
+
+    def drop_rates(self) -> Dict[int, float]:
+        """
+        Get the exact expected number of drops of each item per roll
+
+        Returns:
+            Item ID -> drops per roll (1.0 for a guaranteed item, the weight
+            share for a weighted one, summed if an item has several entries)
+        """
+        rates: Dict[int, float] = {}
+        for item_id, _low, _span in self._guaranteed:
+            rates[item_id] = rates.get(item_id, 0.0) + 1.0
+        total = sum(self._weights)
+        for item_id, weight in zip(self._items, self._weights):
+            if item_id != NO_ITEM and weight:
+                rates[item_id] = rates.get(item_id, 0.0) + weight / total
+        return rates
+
+    def __len__(self) -> int:
+        return len(self._guaranteed) + self._count
+
+
+def load_tables(content: ContentPack, registry: ItemRegistry = ITEMS) -> List[LootTable]:
+    """
+    Compile every loot table in a content pack
+
+    Args:
+        content: Open content pack
+        registry: Item registry the pack's items are interned into
+
+    Returns:
+        Loot tables indexed by loot table ID
+    """
+    item_names = [content.item(item_id).name for item_id in range(content.item_count)]
+    return [LootTable.from_definition(content.loot_table(table_id), item_names, registry)
+            for table_id in range(content.loot_table_count)]
+
+
+def world_rng(seed: int) -> random.Random:
+    """
+    Create the random number generator for a world's loot rolls
+
+    Args:
+        seed: World seed
+
+    Returns:
+        Generator that gives the same rolls, in the same order, for the same seed
+    """
+    return random.Random(seed ^ _LOOT_SALT)
+
+
+def _resolve(entries: Sequence[LootEntry], registry: ItemRegistry) -> List[Tuple[int, float, int, int]]:
+    """
+    Validate entries and resolve their items
+
+    Args:
+        entries: Loot entries
+        registry: Item registry used to resolve item names
+
+    Returns:
+        (item ID or NO_ITEM, weight, min quantity, quantity span) per entry
+    """
+    resolved = []
+    for entry in entries:
+        if entry.weight < 0:
+            raise ValueError(f"Loot entry {entry.item!r} has a negative weight")
+        if entry.max_quantity < entry.min_quantity:
+            raise ValueError(f"Loot entry {entry.item!r} has an empty quantity range")
+        item_id = NO_ITEM if entry.item is None else registry.resolve(entry.item)
+        resolved.append((item_id, float(entry.weight), entry.min_quantity,
+                         entry.max_quantity - entry.min_quantity + 1))
+    return resolved
+
+
+def _build_alias(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """
+    Build a Vose alias table
+
+    Column i is picked uniformly; it keeps entry i with probability prob[i] and
+    otherwise gives alias[i]. Every column's probability mass adds up to 1/n, so
+    each entry ends up with exactly its share of the total weight.
+
+    Args:
+        weights: Non-negative weight per entry
+
+    Returns:
+        Tuple of (prob, alias) lists, one item per entry
+
+    Raises:
+        ValueError: If there are weights and they sum to zero
+    """
+    n = len(weights)
+    if not n:
+        return [], []
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("Loot table weights sum to zero")
+
+    scaled = [weight * n / total for weight in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        # The large entry gives up what fills the small entry's column
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+
+    # Whatever is left is 1 up to rounding error and keeps its whole column
+    return prob, alias
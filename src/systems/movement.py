@@ -0,0 +1,162 @@
+"""
+Movement System - Vectorized click-to-move for every moving unit
+
+Positions, targets and speeds of all moving units live in NumPy arrays, and one
+step() advances every unit towards its target at once. Speeds are distances per
+millisecond and each step covers the frame's elapsed time, so units move at the
+same speed at any frame rate. A unit within one step of its target snaps onto it
+and is reported as arrived.
+"""
+from typing import List, Tuple
+import numpy as np
+
+from src.config import GameBalance
+
+
+class MovementSystem:
+    """Moves many units towards their targets in one vectorized step"""
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initialize an empty movement system
+
+        Args:
+            capacity: Initial number of unit slots (grows as needed)
+        """
+        self.positions = np.zeros((capacity, 2))
+        self.targets = np.zeros((capacity, 2))
+        self.speeds = np.zeros(capacity)
+        self.moving = np.zeros(capacity, dtype=bool)
+
+        # Unused slots, popped from the end so low slots are reused first
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def add(self, x: float, y: float, speed: float) -> int:
+        """
+        Register a unit standing at a position
+
+        Args:
+            x: Starting X coordinate
+            y: Starting Y coordinate
+            speed: Distance moved per millisecond
+
+        Returns:
+            Unit handle used with the other methods
+        """
+        if not self._free:
+            self._grow()
+
+        unit = self._free.pop()
+        self.positions[unit] = (x, y)
+        self.targets[unit] = (x, y)
+        self.speeds[unit] = speed
+        self.moving[unit] = False
+        return unit
+
+    def remove(self, unit: int) -> None:
+        """
+        Unregister a unit and free its slot
+
+        Args:
+            unit: Unit handle
+        """
+        self.moving[unit] = False
+        self._free.append(unit)
+
+    def move_to(self, unit: int, x: float, y: float) -> None:
+        """
+        Set a unit's movement target
+
+        Args:
+            unit: Unit handle
+            x: Target X coordinate
+            y: Target Y coordinate
+        """
+        self.targets[unit] = (x, y)
+        self.moving[unit] = True
+
+    def stop(self, unit: int) -> None:
+        """
+        Stop a unit where it stands
+
+        Args:
+            unit: Unit handle
+        """
+        self.targets[unit] = self.positions[unit]
+        self.moving[unit] = False
+
+    def get_position(self, unit: int) -> Tuple[float, float]:
+        """
+        Get a unit's position
+
+        Args:
+            unit: Unit handle
+
+        Returns:
+            Tuple of (x, y)
+        """
+        x, y = self.positions[unit].tolist()
+        return x, y
+
+    def set_position(self, unit: int, x: float, y: float) -> None:
+        """
+        Teleport a unit, keeping its current target
+
+        Args:
+            unit: Unit handle
+            x: New X coordinate
+            y: New Y coordinate
+        """
+        self.positions[unit] = (x, y)
+
+    def step(self, elapsed_ms: float,
+             max_step_ms: float = GameBalance.MOVEMENT_MAX_STEP_MS) -> np.ndarray:
+        """
+        Advance every moving unit towards its target
+
+        Units further than their step distance (speed * elapsed time) from the
+        target move that far along the direction to it; the rest snap onto the
+        target and stop.
+
+        Args:
+            elapsed_ms: Time since the previous step in milliseconds
+            max_step_ms: Most time a single step covers, so a long stall (such as
+                an idle wait before the click that started the move) can't jump
+                units across the screen
+
+        Returns:
+            Handles of the units that arrived this step
+        """
+        units = np.flatnonzero(self.moving)
+        if not units.size:
+            return units
+
+        delta = self.targets[units] - self.positions[units]
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        speed = self.speeds[units] * min(elapsed_ms, max_step_ms)
+        arrived = dist <= speed
+
+        # Move the rest one step along their normalized direction
+        scale = np.divide(speed, dist, out=np.zeros_like(dist), where=~arrived)
+        self.positions[units] += delta * scale[:, None]
+
+        # Snap arrived units onto their targets
+        done = units[arrived]
+        self.positions[done] = self.targets[done]
+        self.moving[done] = False
+        return done
+
+    @property
+    def active_count(self) -> int:
+        """Number of units currently moving"""
+        return int(np.count_nonzero(self.moving))
+
+    def _grow(self) -> None:
+        """Double the number of unit slots"""
+        old = len(self.speeds)
+        new = max(1, old * 2)
+        self.positions = np.resize(self.positions, (new, 2))
+        self.targets = np.resize(self.targets, (new, 2))
+        self.speeds = np.resize(self.speeds, new)
+        self.moving = np.concatenate((self.moving, np.zeros(new - old, dtype=bool)))
+        self._free.extend(range(new - 1, old - 1, -1))
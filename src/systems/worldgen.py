@@ -0,0 +1,421 @@
+"""
+World Generator - Seeded procedural placement of trees and enemies
+
+The world is split into square chunks that are generated independently from the
+world seed. Tree clusters follow a low-frequency value-noise "forest" field and
+enemies spawn in the clearings between them. All randomness comes from hashing the
+seed with world grid coordinates, so a chunk's contents depend only on the seed
+and its position - never on which chunks were generated before it or on which
+thread generated it. Each chunk is evaluated with vectorized NumPy operations.
+
+ChunkStreamer runs the generator on a worker thread and hands finished chunks to
+the main thread through a queue. Chunks the player has left far behind can be
+forgotten and are generated again, identically, if the player returns.
+
+ChunkIndex buckets objects at fixed positions by the chunk they stand in, so
+lookups around a point or a view only visit a few chunks however large the
+explored world has grown.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+import queue
+import threading
+import numpy as np
+
+from src.config import WorldSettings
+
+ChunkKey = Tuple[int, int]
+
+# Salts that give each random stream of the generator its own hash sequence
+_FOREST_SALT = 0x1F0A
+_TREE_SALT = 0x2B1C
+_ENEMY_SALT = 0x3C2D
+_JITTER_X_SALT = 0x4D3E
+_JITTER_Y_SALT = 0x5E4F
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+class Chunk(NamedTuple):
+    """Generated contents of one world chunk"""
+    key: ChunkKey
+    trees: np.ndarray    # (n, 2) world positions of tree centers
+    enemies: np.ndarray  # (m, 2) world positions of enemy spawn points
+
+
+class WorldGenerator:
+    """Deterministic chunk generator for a seeded world"""
+
+    def __init__(self, seed: int = WorldSettings.SEED,
+                 chunk_size: int = WorldSettings.CHUNK_SIZE,
+                 clear_center: Tuple[float, float] = (0.0, 0.0),
+                 clear_radius: float = 0.0) -> None:
+        """
+        Initialize generator
+
+        Args:
+            seed: World seed; the same seed always produces the same world
+            chunk_size: Width and height of a chunk in pixels
+            clear_center: Center of a circle kept free of generated objects
+                (e.g. around the player's start and the hand-placed spawns)
+            clear_radius: Radius of that circle in pixels (0 = none)
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.clear_center = clear_center
+        self.clear_radius = clear_radius
+
+        # Candidate cells: one possible tree per tree cell, one possible enemy per enemy cell
+        self.tree_cell = WorldSettings.TREE_CELL
+        self.enemy_cell = WorldSettings.ENEMY_CELL
+        self._tree_cells = self._cell_grid(self.tree_cell)
+        self._enemy_cells = self._cell_grid(self.enemy_cell)
+
+    def generate(self, key: ChunkKey) -> Chunk:
+        """
+        Generate the trees and enemy spawns of one chunk
+
+        Args:
+            key: Chunk coordinates (chunk_x, chunk_y)
+
+        Returns:
+            Chunk with world positions of its trees and enemies
+        """
+        # Trees: dense where the forest field is high
+        cells = self._tree_cells + self._cell_offset(key, self.tree_cell)
+        forest = self.forest_density(*self._cell_centers(cells, self.tree_cell))
+        chance = np.clip((forest - WorldSettings.FOREST_THRESHOLD)
+                         / (1.0 - WorldSettings.FOREST_THRESHOLD), 0.0, 1.0)
+        chance *= WorldSettings.TREE_MAX_DENSITY
+        picked = self._uniform(cells, _TREE_SALT) < chance
+        trees = self._place(cells[picked], self.tree_cell, WorldSettings.TREE_JITTER)
+
+        # Enemies: occasional spawns, mostly in clearings
+        cells = self._enemy_cells + self._cell_offset(key, self.enemy_cell)
+        forest = self.forest_density(*self._cell_centers(cells, self.enemy_cell))
+        chance = WorldSettings.ENEMY_CHANCE * (1.0 - forest)
+        picked = self._uniform(cells, _ENEMY_SALT) < chance
+        enemies = self._place(cells[picked], self.enemy_cell, WorldSettings.ENEMY_JITTER)
+
+        return Chunk(key, self._outside_clearing(trees), self._outside_clearing(enemies))
+
+    def chunk_at(self, x: float, y: float) -> ChunkKey:
+        """
+        Get the key of the chunk containing a world position
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Chunk coordinates (chunk_x, chunk_y)
+        """
+        return int(x // self.chunk_size), int(y // self.chunk_size)
+
+    def forest_density(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Sample the forest field (fractal value noise) at world positions
+
+        Args:
+            xs: World X coordinates
+            ys: World Y coordinates
+
+        Returns:
+            Density in [0, 1) for each position
+        """
+        total = np.zeros(np.shape(xs))
+        amplitude = 1.0
+        frequency = WorldSettings.FOREST_FREQUENCY
+        for octave in range(WorldSettings.FOREST_OCTAVES):
+            total += amplitude * self._value_noise(xs * frequency, ys * frequency,
+                                                   _FOREST_SALT + octave)
+            amplitude *= 0.5
+            frequency *= 2.0
+        return total / (2.0 - 2.0 ** (1 - WorldSettings.FOREST_OCTAVES))
+
+    def _value_noise(self, xs: np.ndarray, ys: np.ndarray, salt: int) -> np.ndarray:
+        """Smoothly interpolated random values on the integer lattice"""
+        x0 = np.floor(xs)
+        y0 = np.floor(ys)
+        fx = _smoothstep(xs - x0)
+        fy = _smoothstep(ys - y0)
+        ix = x0.astype(np.int64)
+        iy = y0.astype(np.int64)
+
+        top = _lerp(self._lattice(ix, iy, salt), self._lattice(ix + 1, iy, salt), fx)
+        bottom = _lerp(self._lattice(ix, iy + 1, salt), self._lattice(ix + 1, iy + 1, salt), fx)
+        return _lerp(top, bottom, fy)
+
+    def _lattice(self, ix: np.ndarray, iy: np.ndarray, salt: int) -> np.ndarray:
+        """Random value in [0, 1) for each lattice point"""
+        return _to_unit(_hash(ix, iy, self.seed, salt))
+
+    def _uniform(self, cells: np.ndarray, salt: int) -> np.ndarray:
+        """Random value in [0, 1) for each world grid cell"""
+        return _to_unit(_hash(cells[:, 0], cells[:, 1], self.seed, salt))
+
+    def _place(self, cells: np.ndarray, cell_size: int, jitter: float) -> np.ndarray:
+        """World positions for picked cells: cell center plus a random offset"""
+        positions = (cells + 0.5) * cell_size
+        positions[:, 0] += (self._uniform(cells, _JITTER_X_SALT) * 2 - 1) * jitter
+        positions[:, 1] += (self._uniform(cells, _JITTER_Y_SALT) * 2 - 1) * jitter
+        return np.round(positions)
+
+    def _outside_clearing(self, positions: np.ndarray) -> np.ndarray:
+        """Drop positions inside the cleared circle"""
+        if not self.clear_radius or not len(positions):
+            return positions
+        delta = positions - self.clear_center
+        return positions[np.hypot(delta[:, 0], delta[:, 1]) > self.clear_radius]
+
+    def _cell_grid(self, cell_size: int) -> np.ndarray:
+        """Grid cell indices within one chunk, relative to the chunk's first cell"""
+        per_side = self.chunk_size // cell_size
+        gy, gx = np.mgrid[0:per_side, 0:per_side]
+        return np.stack((gx.ravel(), gy.ravel()), axis=1).astype(np.int64)
+
+    def _cell_offset(self, key: ChunkKey, cell_size: int) -> np.ndarray:
+        """World grid index of a chunk's first cell"""
+        per_side = self.chunk_size // cell_size
+        return np.array((key[0] * per_side, key[1] * per_side), dtype=np.int64)
+
+    @staticmethod
+    def _cell_centers(cells: np.ndarray, cell_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """World coordinates of cell centers"""
+        centers = (cells + 0.5) * cell_size
+        return centers[:, 0], centers[:, 1]
+
+
+class ChunkStreamer:
+    """Generates chunks on a worker thread and hands them to the main thread"""
+
+    def __init__(self, generator: WorldGenerator,
+                 radius: int = WorldSettings.GENERATION_RADIUS) -> None:
+        """
+        Start the worker thread
+
+        Args:
+            generator: Generator used to build chunks
+            radius: Chunks generated in every direction around a requested position
+        """
+        self.generator = generator
+        self.radius = radius
+
+        # Chunks already requested (generated, in flight or queued)
+        self._requested: Set[ChunkKey] = set()
+        self._requests: "queue.Queue[Optional[ChunkKey]]" = queue.Queue()
+        self._results: "queue.Queue[Chunk]" = queue.Queue()
+
+        self._thread = threading.Thread(target=self._work, name="worldgen", daemon=True)
+        self._thread.start()
+
+    def request_around(self, x: float, y: float) -> int:
+        """
+        Queue every not yet requested chunk within radius of a world position
+
+        Chunks nearest to the position are queued first.
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Number of chunks newly queued
+        """
+        cx, cy = self.generator.chunk_at(x, y)
+        r = self.radius
+        keys = [(cx + dx, cy + dy) for dy in range(-r, r + 1) for dx in range(-r, r + 1)]
+        keys.sort(key=lambda key: (key[0] - cx) ** 2 + (key[1] - cy) ** 2)
+
+        queued = 0
+        for key in keys:
+            if key not in self._requested:
+                self._requested.add(key)
+                self._requests.put(key)
+                queued += 1
+        return queued
+
+    def forget(self, keys: Iterable[ChunkKey]) -> None:
+        """
+        Let chunks be requested (and generated) again, e.g. after they were unloaded
+
+        Only forget chunks that poll() has already returned; a forgotten chunk that
+        is still queued would be generated twice.
+
+        Args:
+            keys: Chunk coordinates
+        """
+        self._requested.difference_update(keys)
+
+    @property
+    def requested_count(self) -> int:
+        """Chunks requested and not forgotten"""
+        return len(self._requested)
+
+    def poll(self, limit: int = WorldSettings.CHUNKS_PER_FRAME) -> List[Chunk]:
+        """
+        Take finished chunks without waiting
+
+        Args:
+            limit: Maximum number of chunks to take
+
+        Returns:
+            Up to limit finished chunks, in the order they were generated
+        """
+        chunks = []
+        while len(chunks) < limit:
+            try:
+                chunks.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        return chunks
+
+    @property
+    def pending(self) -> int:
+        """Chunks requested but not yet taken by poll() (approximate while running)"""
+        return self._requests.qsize() + self._results.qsize()
+
+    def close(self) -> None:
+        """Stop the worker thread after the chunk it is working on"""
+        # Drop queued work so the worker sees the stop signal promptly
+        while True:
+            try:
+                self._requests.get_nowait()
+            except queue.Empty:
+                break
+        self._requests.put(None)
+        self._thread.join()
+
+    def _work(self) -> None:
+        """Worker thread: generate requested chunks until told to stop"""
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            self._results.put(self.generator.generate(key))
+
+
+class ChunkIndex:
+    """Objects at fixed world positions, bucketed by world chunk"""
+
+    def __init__(self, chunk_size: int = WorldSettings.CHUNK_SIZE) -> None:
+        """
+        Initialize an empty index
+
+        Args:
+            chunk_size: Width and height of a bucket in pixels
+        """
+        self.chunk_size = chunk_size
+        self._buckets: Dict[ChunkKey, List[Any]] = {}
+        self._count = 0
+
+    def key_at(self, x: float, y: float) -> ChunkKey:
+        """
+        Get the key of the chunk containing a world position
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Chunk coordinates (chunk_x, chunk_y)
+        """
+        return int(x // self.chunk_size), int(y // self.chunk_size)
+
+    def add(self, item: Any, x: float, y: float) -> ChunkKey:
+        """
+        Add an object standing at a position
+
+        Args:
+            item: Object to add
+            x: World X coordinate
+            y: World Y coordinate
+
+        Returns:
+            Key of the chunk the object was filed under
+        """
+        key = self.key_at(x, y)
+        self._buckets.setdefault(key, []).append(item)
+        self._count += 1
+        return key
+
+    def remove(self, item: Any, x: float, y: float) -> None:
+        """
+        Remove an object added at a position
+
+        Args:
+            item: Object previously passed to add()
+            x: World X coordinate it was added at
+            y: World Y coordinate it was added at
+        """
+        key = self.key_at(x, y)
+        bucket = self._buckets[key]
+        bucket.remove(item)
+        if not bucket:
+            del self._buckets[key]
+        self._count -= 1
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> Iterator[Any]:
+        """
+        Iterate over the objects in every chunk overlapping a world rectangle
+
+        Objects near the rectangle but outside it are included; callers test
+        exact bounds themselves.
+
+        Args:
+            left: Left edge of the rectangle
+            top: Top edge of the rectangle
+            right: Right edge of the rectangle
+            bottom: Bottom edge of the rectangle
+
+        Yields:
+            Objects in the overlapped chunks
+        """
+        size = self.chunk_size
+        buckets = self._buckets
+        for cy in range(int(top // size), int(bottom // size) + 1):
+            for cx in range(int(left // size), int(right // size) + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _hash(ix: np.ndarray, iy: np.ndarray, seed: int, salt: int) -> np.ndarray:
+    """
+    Hash integer grid coordinates with the seed into 64 random bits
+
+    Args:
+        ix: Grid X indices
+        iy: Grid Y indices
+        seed: World seed
+        salt: Random stream identifier
+
+    Returns:
+        uint64 hash for each coordinate pair
+    """
+    key = np.uint64((seed * 0x9E3779B97F4A7C15 + salt * 0xD1B54A32D192ED03) & 0xFFFFFFFFFFFFFFFF)
+    h = (np.asarray(ix).astype(np.uint64) * np.uint64(0x8CB92BA72F3D8DD7)
+         ^ np.asarray(iy).astype(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F)
+         ^ key)
+
+    # splitmix64 finalizer
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return (h ^ (h >> np.uint64(31))) & _MASK64
+
+
+def _to_unit(h: np.ndarray) -> np.ndarray:
+    """Map 64-bit hashes to floats in [0, 1)"""
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    """Ease a 0..1 fraction so noise has no creases at lattice points"""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Linear interpolation from a to b"""
+    return a + (b - a) * t
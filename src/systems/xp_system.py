@@ -2,67 +2,142 @@
 XP System - Manages experience points and leveling for different skills
 
 This module handles all skill progression logic, separated from game entities.
+Levels follow an exponential, RuneScape-style curve stored in a precomputed
+cumulative XP table, so a level lookup is a binary search.
 """
-from typing import Dict, Tuple
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Tuple, Union
 from src.config import GameBalance
 
+# Skill IDs are indexes into this tuple
+SKILLS: Tuple[str, ...] = ('Woodcutting', 'Combat')
+SKILL_IDS: Dict[str, int] = {name: skill_id for skill_id, name in enumerate(SKILLS)}
+
+
+def _build_xp_table(max_level: int) -> List[int]:
+    """
+    Build the cumulative XP table
+
+    Args:
+        max_level: Highest reachable level
+
+    Returns:
+        List where index i holds the total XP needed to reach level i + 1
+    """
+    table = [0]
+    points = 0
+    for level in range(1, max_level):
+        points += int(level + 300 * 2 ** (level / 7))
+        table.append(points // 4)
+    return table
+
+
+XP_TABLE: List[int] = _build_xp_table(GameBalance.MAX_LEVEL)
+
+
+def level_for_xp(xp: int) -> int:
+    """
+    Look up the level for an XP total
+
+    Args:
+        xp: Total experience points
+
+    Returns:
+        Level (minimum 1, maximum GameBalance.MAX_LEVEL)
+    """
+    return bisect_right(XP_TABLE, xp)
+
+
+def xp_for_level(level: int) -> int:
+    """
+    Get the total XP needed to reach a level
+
+    Args:
+        level: Level between 1 and GameBalance.MAX_LEVEL
+
+    Returns:
+        Total experience points required
+    """
+    return XP_TABLE[level - 1]
+
 
 class XPSystem:
     """Manages experience and levels for different skills"""
 
     def __init__(self) -> None:
         """Initialize XP system with default skills"""
-        self.skills: Dict[str, Dict[str, int]] = {
-            'Woodcutting': {'xp': 0, 'level': 1},
-            'Combat': {'xp': 0, 'level': 1}
-        }
+        # Per-skill XP and level, indexed by skill ID
+        self.xp = array('q', [0]) * len(SKILLS)
+        self.levels = array('H', [1]) * len(SKILLS)
 
-    def add_xp(self, skill: str, amount: int) -> bool:
+    def add_xp(self, skill: Union[str, int], amount: int) -> bool:
         """
         Add XP to a skill and level up if needed
 
         Args:
-            skill: Name of the skill (e.g., 'Woodcutting', 'Combat')
+            skill: Name or ID of the skill (e.g., 'Woodcutting', 'Combat')
             amount: Amount of XP to add
 
         Returns:
             True if the skill leveled up, False otherwise
         """
-        if skill not in self.skills:
+        skill_id = SKILL_IDS.get(skill) if isinstance(skill, str) else skill
+        if skill_id is None or not 0 <= skill_id < len(SKILLS):
             return False
 
-        self.skills[skill]['xp'] += amount
-        new_level = self._calculate_level(self.skills[skill]['xp'])
+        self.xp[skill_id] += amount
+        new_level = level_for_xp(self.xp[skill_id])
 
-        if new_level > self.skills[skill]['level']:
-            self.skills[skill]['level'] = new_level
+        if new_level > self.levels[skill_id]:
+            self.levels[skill_id] = new_level
             return True  # Leveled up
 
         return False
 
-    def get_skill_info(self, skill: str) -> Tuple[int, int]:
+    def add_xp_batch(self, grants: Iterable[Tuple[int, int]]) -> List[int]:
         """
-        Get skill level and XP
+        Apply many XP grants at once
+
+        Grants are summed per skill first, so levels are looked up once per skill
+        rather than once per grant. Grants for unknown skill IDs are ignored, as
+        in add_xp().
 
         Args:
-            skill: Name of the skill
+            grants: (skill_id, amount) pairs
 
         Returns:
-            Tuple of (level, xp). Returns (0, 0) if skill doesn't exist
+            IDs of the skills that leveled up
         """
-        if skill in self.skills:
-            return self.skills[skill]['level'], self.skills[skill]['xp']
-        return 0, 0
-
-    @staticmethod
-    def _calculate_level(xp: int) -> int:
+        count = len(SKILLS)
+        totals = [0] * count
+        for skill_id, amount in grants:
+            if 0 <= skill_id < count:
+                totals[skill_id] += amount
+
+        leveled = []
+        for skill_id, total in enumerate(totals):
+            if not total:
+                continue
+            self.xp[skill_id] += total
+            new_level = level_for_xp(self.xp[skill_id])
+            if new_level > self.levels[skill_id]:
+                self.levels[skill_id] = new_level
+                leveled.append(skill_id)
+
+        return leveled
+
+    def get_skill_info(self, skill: Union[str, int]) -> Tuple[int, int]:
         """
-        Calculate level from XP amount
+        Get skill level and XP
 
         Args:
-            xp: Total experience points
+            skill: Name or ID of the skill
 
         Returns:
-            Calculated level (minimum 1)
+            Tuple of (level, xp). Returns (0, 0) if skill doesn't exist
         """
-        return xp // GameBalance.XP_PER_LEVEL + 1
+        skill_id = SKILL_IDS.get(skill) if isinstance(skill, str) else skill
+        if skill_id is not None and 0 <= skill_id < len(SKILLS):
+            return self.levels[skill_id], self.xp[skill_id]
+        return 0, 0
@@ -0,0 +1,22 @@
+"""
+Font Cache - Shared font objects for UI rendering
+
+Fonts are created on first use and reused, instead of being loaded from disk every
+time a UI element is drawn.
+"""
+from functools import lru_cache
+import pygame
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """
+    Get the default font at a given size, creating it on first use
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        Shared pygame Font object
+    """
+    return pygame.font.Font(None, size)
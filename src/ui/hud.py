@@ -6,7 +6,9 @@ Pure rendering function for skills display and game instructions.
 from typing import TYPE_CHECKING
 import pygame
 
+from src.ui.fonts import get_font
 from src.config import Colors, SCREEN_HEIGHT
+from src.systems.xp_system import SKILLS
 
 if TYPE_CHECKING:
     from src.systems.xp_system import XPSystem
@@ -35,10 +37,10 @@ def _draw_skills(screen: pygame.Surface, xp_system: 'XPSystem') -> None:
         screen: Pygame surface to draw on
         xp_system: XP system containing skill data
     """
-    font = pygame.font.Font(None, 24)
+    font = get_font(24)
     y_offset = 10
 
-    for skill in ['Woodcutting', 'Combat']:
+    for skill in SKILLS:
         level, xp = xp_system.get_skill_info(skill)
         text = font.render(f"{skill}: Lv {level} ({xp} XP)", True, Colors.WHITE)
         screen.blit(text, (10, y_offset))
@@ -52,7 +54,7 @@ def _draw_instructions(screen: pygame.Surface) -> None:
     Args:
         screen: Pygame surface to draw on
     """
-    font = pygame.font.Font(None, 20)
+    font = get_font(20)
     instructions = [
         "Click to move",
         "Click trees to chop",
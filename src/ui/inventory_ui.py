@@ -6,6 +6,7 @@ Pure rendering function with no game logic. Takes inventory data and draws it.
 from typing import TYPE_CHECKING
 import pygame
 
+from src.ui.fonts import get_font
 from src.config import Colors, GameBalance, SCREEN_WIDTH, SCREEN_HEIGHT
 
 if TYPE_CHECKING:
@@ -40,21 +41,45 @@ def draw_inventory(screen: pygame.Surface, inventory: 'Inventory') -> None:
     pygame.draw.rect(screen, Colors.BLACK, (panel_x, panel_y, panel_width, panel_height), 3)
 
     # Draw title
-    font = pygame.font.Font(None, 36)
+    font = get_font(36)
     title = font.render("Inventory (Press I to close)", True, Colors.BLACK)
     screen.blit(title, (panel_x + 20, panel_y + 20))
 
-    # Draw items
-    item_font = pygame.font.Font(None, 28)
-    y_offset = panel_y + 70
-
-    if not inventory.items:
-        # Show "empty" message if no items
-        empty_text = item_font.render("(Empty)", True, Colors.GRAY)
-        screen.blit(empty_text, (panel_x + 30, y_offset))
-    else:
-        # Draw each item with quantity
-        for item_name, quantity in inventory.items.items():
-            text = item_font.render(f"{item_name}: {quantity}", True, Colors.BLACK)
-            screen.blit(text, (panel_x + 30, y_offset))
-            y_offset += 35
+    # Draw slot grid
+    _draw_slots(screen, inventory, panel_x + 20, panel_y + 70,
+                panel_width - 40, panel_height - 90)
+
+
+def _draw_slots(screen: pygame.Surface, inventory: 'Inventory',
+                x: int, y: int, width: int, height: int) -> None:
+    """
+    Draw every inventory slot as a grid cell with its item name and quantity
+
+    Args:
+        screen: Pygame surface to draw on
+        inventory: Inventory to draw
+        x: Left edge of the grid
+        y: Top edge of the grid
+        width: Grid width
+        height: Grid height
+    """
+    columns = GameBalance.INVENTORY_COLUMNS
+    rows = -(-inventory.capacity // columns)
+    cell_width = width // columns
+    cell_height = height // rows
+    item_font = get_font(18)
+
+    for slot in range(inventory.capacity):
+        cell_x = x + (slot % columns) * cell_width
+        cell_y = y + (slot // columns) * cell_height
+        pygame.draw.rect(screen, Colors.GRAY, (cell_x, cell_y, cell_width - 4, cell_height - 4), 1)
+
+    for slot, item_id, quantity in inventory.slots():
+        cell_x = x + (slot % columns) * cell_width
+        cell_y = y + (slot // columns) * cell_height
+
+        name = item_font.render(inventory.registry.name(item_id), True, Colors.BLACK)
+        screen.blit(name, (cell_x + 3, cell_y + 4), (0, 0, cell_width - 8, name.get_height()))
+
+        count = item_font.render(str(quantity), True, Colors.BLACK)
+        screen.blit(count, (cell_x + 3, cell_y + cell_height - count.get_height() - 8))
@@ -0,0 +1,78 @@
+"""Tests for tick-based action processing"""
+from src.config import SimulationSettings
+from src.systems.actions import ActionProcessor, ActionType
+
+
+def recording_processor(tick_ms=600):
+    """Processor whose handlers log (tick, action type, batch) in call order"""
+    processor = ActionProcessor(tick_ms=tick_ms)
+    log = []
+    for action_type in ActionType:
+        processor.register(action_type, lambda batch, action_type=action_type: log.append(
+            (processor.tick, action_type, dict(batch))))
+    return processor, log
+
+
+def test_actions_wait_for_the_tick():
+    processor, log = recording_processor()
+    processor.queue(ActionType.CHOP, 'player', 'tree')
+
+    assert processor.advance(599) == 0
+    assert log == []
+    assert processor.pending == 1
+
+    assert processor.advance(1) == 1
+    assert log == [(0, ActionType.CHOP, {'player': 'tree'})]
+    assert processor.pending == 0
+
+
+def test_ticks_are_independent_of_frame_length():
+    frames_60, _log = recording_processor()
+    for _ in range(360):
+        frames_60.advance(1000 / 60)
+    frames_10, _log = recording_processor()
+    for _ in range(60):
+        frames_10.advance(100)
+    assert frames_60.tick == frames_10.tick == 10
+
+
+def test_types_resolve_in_order_within_a_tick():
+    processor, log = recording_processor()
+    processor.queue(ActionType.RESPAWN, 'goblin')
+    processor.queue(ActionType.ATTACK, 'player', 'goblin')
+    processor.queue(ActionType.CHOP, 'player', 'tree')
+    processor.run_tick()
+    assert [action_type for _tick, action_type, _batch in log] == list(ActionType)
+
+
+def test_requeue_replaces_and_cancel_removes():
+    processor, log = recording_processor()
+    processor.queue(ActionType.ATTACK, 'player', 'goblin')
+    processor.queue(ActionType.ATTACK, 'player', 'imp')
+    processor.queue(ActionType.CHOP, 'player', 'tree')
+    processor.cancel(ActionType.CHOP, 'player')
+    processor.run_tick()
+    assert log == [(0, ActionType.ATTACK, {'player': 'imp'})]
+
+
+def test_actions_queued_by_a_handler_run_next_tick():
+    processor = ActionProcessor()
+    seen = []
+
+    def attack(batch):
+        seen.append((processor.tick, dict(batch)))
+        processor.queue(ActionType.ATTACK, 'player', 'goblin')
+
+    processor.register(ActionType.ATTACK, attack)
+    processor.queue(ActionType.ATTACK, 'player', 'goblin')
+    processor.run_tick()
+    processor.run_tick()
+    assert seen == [(0, {'player': 'goblin'}), (1, {'player': 'goblin'})]
+
+
+def test_catchup_is_capped():
+    processor, _log = recording_processor()
+    limit = SimulationSettings.MAX_CATCHUP_TICKS
+    assert processor.advance(600 * (limit + 10) + 300) == limit
+    # The dropped backlog is not resolved later; only the leftover fraction carries over
+    assert processor.advance(300) == 1
@@ -0,0 +1,158 @@
+"""Tests for the compiled content pack"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.systems.content import (NO_ITEM, NO_LOOT, PLACEMENT_BATCH, ContentPack, EntityKind,
+                                 LootEntryDef, write_pack)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT, "content")
+
+
+def load_source(name):
+    with open(os.path.join(SOURCE_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def pack_path(tmp_path_factory):
+    """Compile content/ with the build script into a temporary pack"""
+    path = str(tmp_path_factory.mktemp("content") / "content.pack")
+    subprocess.run([sys.executable, os.path.join(ROOT, "scripts", "build_content.py"),
+                    "--source", SOURCE_DIR, "--output", path],
+                   check=True, capture_output=True)
+    return path
+
+
+@pytest.fixture
+def pack(pack_path):
+    with ContentPack(pack_path) as pack:
+        yield pack
+
+
+def test_items_round_trip(pack):
+    items = load_source("items.json")["items"]
+    assert pack.item_count == len(items)
+    for item in items:
+        definition = pack.item(item["id"])
+        assert definition.name == item["name"]
+        assert definition.stack_limit == item.get("stack_limit", 1)
+        assert pack.item_id(item["name"]) == item["id"]
+
+
+def test_entity_types_round_trip(pack):
+    entity_types = load_source("entities.json")["entity_types"]
+    assert pack.entity_type_count == len(entity_types)
+    for entity_type in entity_types:
+        definition = pack.entity_type(entity_type["id"])
+        assert definition.name == entity_type["name"]
+        assert definition.kind == EntityKind[entity_type["kind"].upper()]
+        assert definition.size == entity_type["size"]
+        assert definition.max_hp == entity_type.get("max_hp", 0)
+        assert definition.respawn_delay == entity_type.get("respawn_delay", 0)
+        assert definition.xp == entity_type.get("xp", 0)
+        assert definition.sprite == entity_type.get("sprite")
+        assert definition.depleted_sprite == entity_type.get("depleted_sprite")
+        assert pack.entity_type_id(entity_type["name"]) == entity_type["id"]
+
+
+def test_entity_loot_tables_round_trip(pack):
+    for entity_type in load_source("entities.json")["entity_types"]:
+        loot = entity_type.get("loot")
+        table_id = pack.entity_type(entity_type["id"]).loot_table
+        if loot is None:
+            assert table_id == NO_LOOT
+        else:
+            assert pack.loot_table(table_id).name == loot
+
+
+def test_loot_tables_round_trip(pack):
+    def check(entries, rows):
+        assert len(entries) == len(rows)
+        for entry, row in zip(entries, rows):
+            item = row.get("item")
+            low = row.get("min", 1)
+            expected = (NO_ITEM if item is None else pack.item_id(item), row.get("weight", 1),
+                        low, row.get("max", low))
+            # Weights are stored as 32-bit floats
+            assert tuple(entry) == pytest.approx(expected)
+
+    tables = load_source("loot.json")["loot_tables"]
+    assert pack.loot_table_count == len(tables)
+    for table in tables:
+        definition = pack.loot_table(table["id"])
+        assert definition.name == table["name"]
+        check(definition.guaranteed, table.get("guaranteed", []))
+        check(definition.weighted, table.get("weighted", []))
+
+
+def test_placements_round_trip(pack):
+    placements = load_source("spawns.json")["placements"]
+    expected = [(pack.entity_type_id(p["type"]), p["x"], p["y"]) for p in placements]
+    assert pack.placement_count == len(expected)
+    assert list(pack.iter_placements()) == expected
+    assert [pack.placement(i) for i in range(pack.placement_count)] == expected
+
+
+def test_write_pack_round_trip(tmp_path):
+    path = str(tmp_path / "test.pack")
+    items = [("Logs", 1000), ("Bones", 1), ("Épée", 1)]
+    entity_types = [
+        ("oak", "oak.png", "stump.png", EntityKind.TREE, 40, 0, 300, 25, 0),
+        ("imp", None, None, EntityKind.ENEMY, 30, 80, 600, 40, NO_LOOT),
+    ]
+    placements = [(0, -5, 7), (1, 2 ** 20, -(2 ** 20))]
+    loot_tables = [("oak", [(0, 1.0, 1, 1)], [(NO_ITEM, 3.0, 1, 1), (2, 0.5, 1, 2)])]
+    write_pack(path, items, entity_types, placements, loot_tables)
+
+    with ContentPack(path) as pack:
+        assert [pack.item(i)[1:] for i in range(pack.item_count)] == items
+        oak, imp = pack.entity_type(0), pack.entity_type(1)
+        assert (oak.sprite, oak.depleted_sprite, oak.kind, oak.respawn_delay) == \
+            ("oak.png", "stump.png", EntityKind.TREE, 300)
+        assert (imp.sprite, imp.depleted_sprite, imp.kind, imp.max_hp) == \
+            (None, None, EntityKind.ENEMY, 80)
+        assert list(pack.iter_placements()) == placements
+        assert pack.loot_table(0) == (0, "oak", (LootEntryDef(0, 1.0, 1, 1),),
+                                      (LootEntryDef(NO_ITEM, 3.0, 1, 1), LootEntryDef(2, 0.5, 1, 2)))
+
+
+
+def test_placements_span_several_batches(tmp_path):
+    path = str(tmp_path / "test.pack")
+    oak = ("oak", None, None, EntityKind.TREE, 40, 0, 300, 25, NO_LOOT)
+    placements = [(0, i, -i) for i in range(2 * PLACEMENT_BATCH + 5)]
+    write_pack(path, [("Logs", 1)], [oak], placements, [])
+
+    with ContentPack(path) as pack:
+        assert list(pack.iter_placements()) == placements
+
+
+def test_close_during_iteration(pack_path):
+    pack = ContentPack(pack_path)
+    placements = pack.iter_placements()
+    assert next(placements) == pack.placement(0)
+    pack.close()
+
+def test_missing_records_raise(pack):
+    with pytest.raises(KeyError):
+        pack.item(pack.item_count)
+    with pytest.raises(KeyError):
+        pack.entity_type(-1)
+    with pytest.raises(KeyError):
+        pack.item_id("No such item")
+    with pytest.raises(KeyError):
+        pack.loot_table(pack.loot_table_count)
+    with pytest.raises(IndexError):
+        pack.placement(pack.placement_count)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "not_a.pack"
+    path.write_bytes(b"\0" * 256)
+    with pytest.raises(ValueError):
+        ContentPack(str(path))
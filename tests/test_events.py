@@ -0,0 +1,89 @@
+"""Tests for the batched event bus"""
+from src.config import SimulationSettings
+from src.systems.events import EventBus, EventType
+
+
+def record(bus, event_type):
+    """Subscribe a listener that records (source, target, key, amount) per event"""
+    received = []
+    bus.subscribe(event_type, lambda event: received.append(
+        (event.source, event.target, event.key, event.amount)))
+    return received
+
+
+def test_grants_to_the_same_target_and_key_merge():
+    bus = EventBus(capacity=2)
+    items = record(bus, EventType.ITEM_GRANTED)
+    xp = record(bus, EventType.XP_GRANTED)
+
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'player', key=1, amount=1)
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'player', key=1, amount=2)
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'player', key=2, amount=5)
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'other', key=1, amount=4)
+    bus.emit(EventType.XP_GRANTED, 'tree', 'player', key=1, amount=25)
+    bus.emit(EventType.XP_GRANTED, 'tree', 'player', key=1, amount=25)
+    assert bus.pending == 4
+
+    assert bus.dispatch() == 4
+    assert items == [('tree', 'player', 1, 3), ('tree', 'player', 2, 5), ('tree', 'other', 1, 4)]
+    assert xp == [('tree', 'player', 1, 50)]
+    assert bus.pending == 0
+
+
+def test_damage_is_not_merged():
+    bus = EventBus()
+    hits = record(bus, EventType.DAMAGE_DEALT)
+    bus.emit(EventType.DAMAGE_DEALT, 'player', 'goblin', amount=3)
+    bus.emit(EventType.DAMAGE_DEALT, 'player', 'goblin', amount=3)
+    bus.dispatch()
+    assert hits == [('player', 'goblin', 0, 3), ('player', 'goblin', 0, 3)]
+
+
+def test_merging_stops_at_dispatch():
+    bus = EventBus()
+    items = record(bus, EventType.ITEM_GRANTED)
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'player', key=1, amount=1)
+    bus.dispatch()
+    bus.emit(EventType.ITEM_GRANTED, 'tree', 'player', key=1, amount=1)
+    bus.dispatch()
+    assert items == [('tree', 'player', 1, 1), ('tree', 'player', 1, 1)]
+
+
+def test_listener_emits_are_delivered_in_the_same_dispatch():
+    bus = EventBus()
+    xp = record(bus, EventType.XP_GRANTED)
+    bus.subscribe(EventType.TREE_CHOPPED, lambda event: bus.emit(
+        EventType.XP_GRANTED, event.target, event.source, key=0, amount=25))
+
+    bus.emit(EventType.TREE_CHOPPED, 'player', 'tree')
+    assert bus.dispatch() == 2
+    assert xp == [('tree', 'player', 0, 25)]
+
+
+def test_cascade_is_limited():
+    bus = EventBus()
+    calls = []
+
+    def echo(event):
+        calls.append(event.amount)
+        bus.emit(EventType.DAMAGE_DEALT, None, None, amount=event.amount + 1)
+
+    bus.subscribe(EventType.DAMAGE_DEALT, echo)
+    bus.emit(EventType.DAMAGE_DEALT, None, None, amount=0)
+
+    limit = SimulationSettings.EVENT_MAX_CASCADE
+    assert bus.dispatch() == limit
+    assert calls == list(range(limit))
+    # The event emitted by the last batch waits for the next dispatch
+    assert bus.pending == 1
+    bus.dispatch()
+    assert calls[limit] == limit
+
+
+def test_queue_grows_past_capacity():
+    bus = EventBus(capacity=1)
+    hits = record(bus, EventType.DAMAGE_DEALT)
+    for amount in range(10):
+        bus.emit(EventType.DAMAGE_DEALT, 'player', 'goblin', amount=amount)
+    assert bus.dispatch() == 10
+    assert [amount for _source, _target, _key, amount in hits] == list(range(10))
@@ -0,0 +1,134 @@
+"""Tests for the slot inventory and its reverse index"""
+import pytest
+
+from src.systems.inventory import EMPTY_SLOT, Inventory
+from src.systems.items import ItemRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ItemRegistry()
+    registry.intern('Logs', 1)
+    registry.intern('Coins', 100)
+    return registry
+
+
+def check_index(inventory):
+    """The reverse index and totals must agree with the slot arrays"""
+    totals = {}
+    for slot, item_id, count in inventory.slots():
+        assert count > 0
+        totals[item_id] = totals.get(item_id, 0) + count
+    assert inventory._totals == totals
+
+    for item_id, stacks in inventory._stacks.items():
+        assert all(inventory.slot_items[slot] == item_id for slot in stacks)
+        limit = inventory._stack_limit(item_id)
+        assert all(inventory.slot_counts[slot] == limit for slot in stacks[:-1])
+    occupied = sum(len(stacks) for stacks in inventory._stacks.values())
+    assert occupied + inventory.free_slots == inventory.capacity
+
+
+def test_stackable_items_share_slots(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    assert inventory.add_item('Coins', 60)
+    assert inventory.add_item('Coins', 60)
+
+    assert list(inventory.slots()) == [(0, registry.find('Coins'), 100),
+                                      (1, registry.find('Coins'), 20)]
+    assert inventory.get_item_count('Coins') == 120
+    check_index(inventory)
+
+
+def test_unstackable_items_take_one_slot_each(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    assert inventory.add_item('Logs', 3)
+    assert inventory.free_slots == 1
+    assert not inventory.add_item('Logs', 2)
+    assert inventory.get_item_count('Logs') == 3
+    assert inventory.add_item('Logs')
+    assert not inventory.add_item('Coins')
+    check_index(inventory)
+
+
+def test_remove_empties_last_stack_first(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    inventory.add_item('Coins', 250)
+    assert inventory.remove_item('Coins', 60)
+    assert [count for _slot, _item, count in inventory.slots()] == [100, 90]
+
+    assert not inventory.remove_item('Coins', 191)
+    assert inventory.remove_item('Coins', 190)
+    assert not inventory.has_item('Coins')
+    assert list(inventory.slot_items) == [EMPTY_SLOT] * 4
+    check_index(inventory)
+
+
+def test_freed_slots_are_reused_lowest_first(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    inventory.add_item('Logs', 2)
+    inventory.add_item('Coins', 5)
+    inventory.remove_item('Logs', 2)
+
+    inventory.add_item('Logs')
+    assert inventory.slot_items[0] == registry.find('Logs')
+    assert inventory.slot_items[1] == EMPTY_SLOT
+    check_index(inventory)
+
+
+def test_max_stack_overrides_item_limits(registry):
+    bank = Inventory(capacity=2, max_stack=1000, registry=registry)
+    assert bank.add_item('Logs', 500)
+    assert bank.free_slots == 1
+    check_index(bank)
+
+
+def test_transfer_all_moves_what_fits(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    inventory.add_item('Logs', 2)
+    inventory.add_item('Coins', 150)
+    dest = Inventory(capacity=3, registry=registry)
+
+    assert not inventory.transfer_all(dest)
+    assert dest.get_item_count('Logs') + inventory.get_item_count('Logs') == 2
+    assert dest.get_item_count('Coins') + inventory.get_item_count('Coins') == 150
+    assert dest.free_slots == 0
+    check_index(inventory)
+    check_index(dest)
+
+
+def test_index_survives_mixed_operations(registry):
+    inventory = Inventory(capacity=6, registry=registry)
+    for step in range(200):
+        item = ('Logs', 'Coins')[step % 2]
+        quantity = step % 7 + 1
+        if step % 3:
+            inventory.add_item(item, quantity)
+        else:
+            inventory.remove_item(item, quantity)
+        check_index(inventory)
+
+
+def test_unknown_items_are_not_registered(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    inventory.add_item('Logs')
+    other = Inventory(capacity=4, registry=registry)
+
+    assert registry.find('Logz') is None
+    assert not inventory.has_item('Logz')
+    assert inventory.get_item_count('Logz') == 0
+    assert not inventory.remove_item('Logz')
+    assert not inventory.transfer_item(other, 'Logz', 1)
+    assert not inventory.add_item('Logz')
+    assert len(registry) == 2
+    check_index(inventory)
+
+
+def test_unknown_item_ids_are_rejected(registry):
+    inventory = Inventory(capacity=4, registry=registry)
+    assert registry.find(registry.find('Coins')) == registry.find('Coins')
+    for item_id in (len(registry), -1):
+        assert registry.find(item_id) is None
+        assert not inventory.add_item(item_id)
+        assert not inventory.has_item(item_id)
+    assert inventory.free_slots == 4
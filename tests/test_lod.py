@@ -0,0 +1,103 @@
+"""Tests for distance-based simulation LOD"""
+import numpy as np
+import pytest
+
+from src.systems.lod import LODBand, SimulationLOD
+
+
+class Thing:
+    """Stand-in for a static entity"""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@pytest.fixture
+def lod():
+    return SimulationLOD(near_radius=100, active_radius=1000, far_interval=4)
+
+
+def test_bands(lod):
+    for x in (0, 50, 500, 900, 2000):
+        lod.add(Thing(x, 0), 0)
+    slots, _elapsed = lod.select(0, 0, 0)
+
+    assert list(lod.band_counts) == [2, 2, 1]
+    assert list(slots[:2]) == [0, 1]
+    assert 4 not in slots
+
+
+def test_far_band_is_staggered(lod):
+    for _ in range(40):
+        lod.add(Thing(500, 0), 0)
+
+    updated = np.zeros(40, dtype=int)
+    for frame in range(4):
+        slots, _elapsed = lod.select(0, 0, frame * 16.0)
+        assert len(slots) == 10
+        assert lod.updated_counts[LODBand.FAR] == 10
+        updated[slots] += 1
+    # Every far entity runs exactly once per interval
+    assert list(updated) == [1] * 40
+
+
+def test_elapsed_covers_time_since_last_update(lod):
+    near, far = Thing(0, 0), Thing(500, 0)
+    lod.add(near, 0)
+    lod.add(far, 0)
+
+    seen = {0: [], 1: []}
+    for frame in range(1, 9):
+        slots, elapsed = lod.select(0, 0, frame * 10.0)
+        for slot, ms in zip(slots.tolist(), elapsed.tolist()):
+            seen[slot].append(ms)
+    # The far entity is updated less often but by the same total game time
+    assert len(seen[0]) == 8
+    assert len(seen[1]) == 2
+    assert sum(seen[0]) == sum(seen[1]) == 80.0
+
+
+def test_frozen_entity_fast_forwards_on_return(lod):
+    lod.add(Thing(0, 0), 0)
+    for frame in range(1, 11):
+        slots, _elapsed = lod.select(5000, 0, frame * 100.0)
+        assert len(slots) == 0
+    assert lod.band_counts[LODBand.FROZEN] == 1
+
+    slots, elapsed = lod.select(0, 0, 1100.0)
+    assert list(slots) == [0]
+    assert list(elapsed) == [1100.0]
+
+
+def test_touch_restarts_the_clock(lod):
+    thing = Thing(0, 0)
+    lod.add(thing, 0)
+    lod.select(5000, 0, 100.0)
+
+    # State changed while frozen: only time since then counts afterwards
+    lod.touch(thing, 700.0)
+    slots, elapsed = lod.select(0, 0, 1000.0)
+    assert list(elapsed) == [300.0]
+
+    # Removed entities are ignored
+    lod.remove(thing)
+    lod.touch(thing, 2000.0)
+
+
+def test_remove_moves_the_last_slot(lod):
+    things = [Thing(x * 10, 0) for x in range(5)]
+    for now, thing in enumerate(things):
+        lod.add(thing, float(now))
+
+    assert lod.remove(things[1]) == 1
+    things[1] = things[-1]
+    things.pop()
+    assert lod.count == 4
+    assert [lod._slots[thing] for thing in things] == [0, 1, 2, 3]
+    assert list(lod.positions[:4, 0]) == [thing.x for thing in things]
+    assert lod.last_update_ms[1] == 4.0
+
+    # Removing the last slot moves nothing
+    assert lod.remove(things[-1]) == 3
+    assert lod.count == 3
@@ -0,0 +1,93 @@
+"""Tests for alias-method loot tables"""
+import random
+
+import numpy as np
+import pytest
+
+from src.systems.items import ItemRegistry
+from src.systems.loot import LootEntry, LootTable
+
+
+@pytest.fixture
+def registry():
+    return ItemRegistry()
+
+
+@pytest.fixture
+def table(registry):
+    weighted = [
+        LootEntry('Coins', 50, 5, 15),
+        LootEntry('Bones', 30),
+        LootEntry('Logs', 15, 1, 3),
+        LootEntry('Coins', 4, 100, 100),
+        LootEntry(None, 1),
+    ]
+    return LootTable(weighted, guaranteed=[LootEntry('Ashes', min_quantity=1, max_quantity=2)],
+                     registry=registry)
+
+
+def alias_rates(table):
+    """Exact chance of each weighted entry encoded by the alias table"""
+    count = table._count
+    rates = [0.0] * count
+    for column in range(count):
+        rates[column] += table._prob[column] / count
+        rates[table._alias[column]] += (1 - table._prob[column]) / count
+    return rates
+
+
+def test_alias_table_matches_weights(table):
+    total = sum(table._weights)
+    assert alias_rates(table) == pytest.approx([weight / total for weight in table._weights])
+
+
+def test_drop_rates(table, registry):
+    rates = table.drop_rates()
+    assert rates == pytest.approx({
+        registry.resolve('Ashes'): 1.0,
+        registry.resolve('Coins'): 54 / 100,
+        registry.resolve('Bones'): 30 / 100,
+        registry.resolve('Logs'): 15 / 100,
+    })
+
+
+def test_picks_follow_drop_rates(table):
+    rng = random.Random(3)
+    rolls = 200_000
+    picks = np.bincount([table.pick(rng) for _ in range(rolls)], minlength=len(table._weights))
+    total = sum(table._weights)
+    for index, weight in enumerate(table._weights):
+        assert picks[index] / rolls == pytest.approx(weight / total, abs=0.005)
+
+
+def test_simulate_follows_drop_rates(table):
+    rolls = 200_000
+    totals = table.simulate(rolls, np.random.default_rng(3), batch=30_000)
+    for item_id, rate in table.drop_rates().items():
+        drops, _quantity = totals[item_id]
+        assert drops / rolls == pytest.approx(rate, abs=0.005)
+
+
+def test_roll_quantities_stay_in_range(table, registry):
+    rng = random.Random(5)
+    ranges = {
+        registry.resolve('Bones'): [(1, 1)],
+        registry.resolve('Logs'): [(1, 3)],
+        registry.resolve('Coins'): [(5, 15), (100, 100)],
+        registry.resolve('Ashes'): [(1, 2)],
+    }
+    for _ in range(5_000):
+        drops = table.roll(rng)
+        assert drops[0][0] == registry.resolve('Ashes')
+        assert len(drops) <= 2
+        for item_id, quantity in drops:
+            assert any(low <= quantity <= high for low, high in ranges[item_id])
+
+
+def test_invalid_tables_are_rejected(registry):
+    with pytest.raises(ValueError):
+        LootTable([LootEntry('Coins', -1), LootEntry('Bones', 2)], registry=registry)
+    with pytest.raises(ValueError):
+        LootTable([LootEntry('Coins', 0)], registry=registry)
+    with pytest.raises(ValueError):
+        LootTable([LootEntry('Coins', 1, 5, 4)], registry=registry)
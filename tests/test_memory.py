@@ -0,0 +1,83 @@
+"""Tests for the memory report"""
+import json
+
+import pygame
+
+from src.diagnostics.memory import (AllocationTracker, build_report, entity_memory, print_report,
+                                    surface_bytes, write_report)
+from src.entities.base import Entity
+
+
+class Holder(Entity):
+    """Entity owning a list"""
+
+    def __init__(self, values=()) -> None:
+        super().__init__(0, 0, 10)
+        self.values = list(values)
+
+    def update(self, elapsed_ms: float) -> None:
+        pass
+
+    def draw(self, screen, offset=(0, 0)) -> None:
+        pass
+
+
+class Other(Holder):
+    """Second entity class"""
+
+
+def test_entities_are_grouped_by_class():
+    rows = entity_memory([Holder(), Other(), Holder()])
+    assert [(row["class"], row["count"]) for row in rows] == [("Holder", 2), ("Other", 1)]
+    holder = rows[0]
+    assert holder["total_bytes"] == 2 * holder["bytes_per_instance"]
+
+
+def test_owned_containers_count_and_shared_objects_do_not():
+    empty = entity_memory([Holder()])[0]["bytes_per_instance"]
+    full = entity_memory([Holder(range(1000, 2000))])[0]["bytes_per_instance"]
+    assert full > empty + 1000 * 8
+
+    table = list(range(1000, 2000))
+    holder = Holder()
+    holder.values = table
+    assert entity_memory([holder], shared=[table])[0]["bytes_per_instance"] < empty
+
+    # Other entities an entity points at are not part of its size
+    holder = Holder()
+    holder.values = Holder(range(1000))
+    assert entity_memory([holder])[0]["bytes_per_instance"] < empty + 1000
+
+
+def test_surface_bytes_include_row_padding():
+    surface = pygame.Surface((10, 4), 0, 32)
+    assert surface_bytes(surface) == surface.get_pitch() * 4
+    assert surface_bytes(surface) >= 10 * 4 * 4
+
+
+def test_report_is_printed_and_saved(tmp_path, capsys):
+    tracker = AllocationTracker(frames=2, top=5)
+    tracker.start()
+    assert not tracker.tick()
+    kept = [bytearray(1000) for _ in range(200)]
+    assert tracker.tick()
+    assert tracker.tick()  # finished; further ticks change nothing
+
+    surfaces = {"<test surfaces>": [pygame.Surface((8, 8), 0, 32)]}
+    report = build_report([Holder(kept)], surfaces=surfaces, tracker=tracker)
+    assert report["frames"] == 2
+    assert report["entities"][0]["class"] == "Holder"
+    assert {"source": "<test surfaces>", "surfaces": 1, "bytes": 8 * 8 * 4} in report["sprites"]
+    assert 0 < len(report["allocations"]) <= 5
+    assert report["allocations"][0]["size_diff"] >= 200 * 1000
+    assert report["traced_memory"]["peak"] >= report["traced_memory"]["current"] > 0
+
+    path = write_report(report, str(tmp_path))
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == report
+
+    print_report(report)
+    out = capsys.readouterr().out
+    assert "Holder" in out
+    assert "<test surfaces>" in out
+    assert "top allocation sites over 2 frames" in out
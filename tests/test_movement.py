@@ -0,0 +1,45 @@
+"""Tests for the vectorized movement system"""
+import pytest
+
+from src.systems.movement import MovementSystem
+
+
+def walk(frame_ms: float, duration_ms: float) -> float:
+    """Distance a unit at 0.1 px/ms covers in duration_ms at a given frame time"""
+    system = MovementSystem()
+    unit = system.add(0, 0, 0.1)
+    system.move_to(unit, 10_000, 0)
+    for _ in range(round(duration_ms / frame_ms)):
+        system.step(frame_ms)
+    return system.get_position(unit)[0]
+
+
+def test_speed_is_independent_of_frame_rate():
+    assert walk(1000 / 60, 1000) == pytest.approx(100)
+    assert walk(100, 1000) == pytest.approx(100)
+
+
+def test_long_stall_is_capped():
+    system = MovementSystem()
+    unit = system.add(0, 0, 0.1)
+    system.move_to(unit, 10_000, 0)
+    system.step(500, max_step_ms=100)
+    assert system.get_position(unit) == pytest.approx((10, 0))
+
+
+def test_arrival_snaps_and_stops():
+    system = MovementSystem()
+    unit = system.add(0, 0, 1.0)
+    system.move_to(unit, 3, 4)
+    arrived = system.step(10)
+    assert arrived.tolist() == [unit]
+    assert system.get_position(unit) == (3, 4)
+    assert system.active_count == 0
+
+
+def test_slots_grow_and_are_reused():
+    system = MovementSystem(capacity=1)
+    units = [system.add(i, 0, 1.0) for i in range(5)]
+    assert sorted(units) == list(range(5))
+    system.remove(units[2])
+    assert system.add(0, 0, 1.0) == units[2]
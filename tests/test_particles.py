@@ -0,0 +1,66 @@
+"""Tests for the pooled particle system"""
+import pygame
+import pytest
+
+from src.config import RenderSettings
+from src.rendering.particles import ParticleSystem
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fonts():
+    pygame.font.init()
+    yield
+
+
+def test_hit_splat_uses_one_particle():
+    particles = ParticleSystem(capacity=16)
+    particles.spawn_hit_splat(100, 100, 10)
+    assert particles.active_count == 1
+
+
+def test_negative_damage_shows_zero():
+    particles = ParticleSystem(capacity=16)
+    particles.spawn_hit_splat(100, 100, -5)
+    assert particles.active_count == 1
+    slot = particles.alive.nonzero()[0][0]
+    assert particles.sprite_ids[slot] == particles._hit_splats[0]
+
+
+def test_negative_xp_shows_zero():
+    particles = ParticleSystem(capacity=16)
+    particles.spawn_xp_text(100, 100, -5)
+    slots = particles.alive.nonzero()[0]
+    assert [particles.sprite_ids[slot] for slot in slots] == \
+        [particles._xp_glyphs[char] for char in "+0XP"]
+
+
+def test_text_without_glyphs_is_skipped():
+    particles = ParticleSystem(capacity=16)
+    particles._spawn_text(0, 0, "", particles._xp_glyphs, (0.0, 0.0), 100)
+    particles._spawn_text(0, 0, "?", particles._xp_glyphs, (0.0, 0.0), 100)
+    assert particles.active_count == 0
+    particles._spawn_text(0, 0, "?1", particles._xp_glyphs, (0.0, 0.0), 100)
+    assert particles.active_count == 1
+
+
+def test_large_damage_shows_digits():
+    particles = ParticleSystem(capacity=16)
+    particles.spawn_hit_splat(100, 100, RenderSettings.HIT_SPLAT_MAX_VALUE + 1)
+    assert particles.active_count == len(str(RenderSettings.HIT_SPLAT_MAX_VALUE + 1))
+
+
+def test_full_pool_drops_spawns():
+    particles = ParticleSystem(capacity=4)
+    particles.spawn_wood_chips(0, 0)
+    particles.spawn_hit_splat(0, 0, 1)
+    assert particles.active_count == 4
+
+
+def test_expired_particles_return_to_pool():
+    particles = ParticleSystem(capacity=16)
+    particles.spawn_hit_splat(0, 0, 1)
+    particles.spawn_xp_text(0, 0, 25)
+    particles.update(RenderSettings.HIT_SPLAT_LIFETIME_MS)
+    assert particles.active_count == len("+25 XP") - 1  # the space is not drawn
+    particles.update(RenderSettings.FLOATING_TEXT_LIFETIME_MS)
+    assert particles.active_count == 0
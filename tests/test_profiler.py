@@ -0,0 +1,149 @@
+"""Tests for on-demand and automatic frame profiling"""
+import os
+import pstats
+import sys
+import time
+
+import pygame
+
+from src.config import DiagnosticsSettings
+from src.diagnostics.profiler import FrameProfiler, print_summary
+from src.main import Game
+
+
+def busy() -> int:
+    return sum(i * i for i in range(2000))
+
+
+def slow() -> None:
+    time.sleep(0.06)
+
+
+def run_frames(profiler, frames, work=busy):
+    """Run frames through the profiler and return the capture files written"""
+    paths = []
+    for _ in range(frames):
+        profiler.begin_frame()
+        work()
+        path = profiler.end_frame()
+        if path is not None:
+            paths.append(path)
+    return paths
+
+
+def calls(path, name):
+    """Number of calls to a function recorded in a capture file"""
+    stats = pstats.Stats(path).stats
+    return sum(ncalls for (_file, _line, func), (_cc, ncalls, *_rest) in stats.items() if func == name)
+
+
+def test_idle_profiler_writes_nothing(tmp_path):
+    profiler = FrameProfiler(directory=str(tmp_path))
+    assert run_frames(profiler, 3) == []
+    assert profiler.last_frame_ms > 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_capture_spans_the_requested_frames(tmp_path):
+    profiler = FrameProfiler(directory=str(tmp_path))
+    profiler.capture(3)
+    assert profiler.capturing
+
+    paths = run_frames(profiler, 5)
+    assert len(paths) == 1
+    assert paths == profiler.captures
+    assert not profiler.capturing
+    assert os.path.basename(paths[0]).startswith("profile-")
+    assert paths[0].endswith("-frames3.pstats")
+    assert calls(paths[0], "busy") == 3
+
+
+def test_frame_over_budget_saves_the_recent_window(tmp_path):
+    profiler = FrameProfiler(budget_ms=40, window=4, directory=str(tmp_path))
+    assert run_frames(profiler, 6) == []
+
+    paths = run_frames(profiler, 1, work=slow)
+    assert len(paths) == 1
+    assert "-spike" in paths[0]
+    # The slow frame and the three before it
+    assert calls(paths[0], "busy") == 3
+    assert calls(paths[0], "slow") == 1
+
+    # Another slow frame right away is not saved until a fresh window has run
+    assert run_frames(profiler, 1, work=slow) == []
+    run_frames(profiler, 3)
+    assert len(run_frames(profiler, 1, work=slow)) == 1
+
+
+def test_budget_can_be_turned_off(tmp_path):
+    profiler = FrameProfiler(budget_ms=40, window=2, directory=str(tmp_path))
+    profiler.set_budget(None)
+    assert run_frames(profiler, 2, work=slow) == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_summary_lists_top_functions(tmp_path, capsys):
+    profiler = FrameProfiler(directory=str(tmp_path))
+    profiler.capture(1)
+    path, = run_frames(profiler, 1)
+    print_summary(path, limit=5)
+    assert "busy" in capsys.readouterr().out
+
+
+def test_profiler_created_mid_frame_starts_with_the_next_frame(tmp_path):
+    # As on the first F11 press: created and given a budget after the frame began
+    profiler = FrameProfiler(directory=str(tmp_path))
+    profiler.set_budget(0)
+    assert profiler.end_frame() is None
+    assert os.listdir(tmp_path) == []
+    assert len(run_frames(profiler, 1)) == 1
+
+
+def test_capture_requested_mid_frame_starts_with_the_next_frame(tmp_path):
+    profiler = FrameProfiler(directory=str(tmp_path))
+    profiler.begin_frame()
+    profiler.capture(2)
+    assert profiler.end_frame() is None
+    assert profiler.frames_left == 2
+
+    path, = run_frames(profiler, 2)
+    assert calls(path, "busy") == 2
+
+
+def test_budget_toggled_mid_frame(tmp_path):
+    profiler = FrameProfiler(budget_ms=0, window=2, directory=str(tmp_path))
+    profiler.begin_frame()
+    profiler.set_budget(None)
+    assert profiler.end_frame() is None
+    assert sys.getprofile() is None
+
+    profiler.begin_frame()
+    profiler.set_budget(0)
+    assert profiler.end_frame() is None
+    assert os.listdir(tmp_path) == []
+    assert len(run_frames(profiler, 1)) == 1
+
+
+def test_f11_mid_frame_toggles_automatic_profiling(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    game = Game.__new__(Game)  # only the frame diagnostics are used
+    game.profiler = None
+    game.memory_tracker = None
+
+    def frame(key=None):
+        game._begin_frame()
+        if key is not None:
+            game._handle_keypress(key)
+        busy()
+        game._finish_frame()
+        assert sys.getprofile() is None
+
+    frame(pygame.K_F11)
+    assert game.profiler.budget_ms == DiagnosticsSettings.FRAME_BUDGET_MS
+    frame()
+    frame(pygame.K_F11)
+    assert game.profiler.budget_ms is None
+    frame()
+    frame(pygame.K_F11)
+    assert game.profiler.budget_ms == DiagnosticsSettings.FRAME_BUDGET_MS
+    frame()
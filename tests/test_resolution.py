@@ -0,0 +1,112 @@
+"""Tests for the render target and dynamic resolution"""
+import pygame
+import pytest
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.rendering.resolution import DynamicResolution, RenderTarget
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.display.init()
+    yield
+
+
+class FakeTarget:
+    """Records scale changes instead of creating surfaces"""
+
+    def __init__(self, render_scale=1.0):
+        self.render_scale = render_scale
+        self.scales = []
+
+    def set_render_scale(self, scale):
+        self.render_scale = scale
+        self.scales.append(scale)
+
+
+def controller(target, sample_frames=4):
+    return DynamicResolution(target, budget_ms=10.0, steps=(1.0, 0.75, 0.5),
+                             headroom=0.5, sample_frames=sample_frames)
+
+
+def test_to_logical_at_window_scale_1():
+    target = RenderTarget(1.0)
+    assert target.frame is target.window
+    assert target.to_logical((123, 45)) == (123, 45)
+
+
+def test_to_logical_at_window_scale_2():
+    target = RenderTarget(2.0)
+    assert target.window.get_size() == (SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2)
+    assert target.frame.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert target.to_logical((0, 0)) == (0, 0)
+    assert target.to_logical((101, 51)) == (50, 25)
+    assert target.to_logical((SCREEN_WIDTH * 2 - 1, SCREEN_HEIGHT * 2 - 1)) == (SCREEN_WIDTH - 1, SCREEN_HEIGHT - 1)
+
+
+def test_render_scale_is_clamped_and_shares_surfaces_at_1():
+    target = RenderTarget(1.0, render_scale=0.5)
+    assert target.world.get_size() == (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    assert target.surfaces() == [target.world]
+
+    target.set_render_scale(0.1)
+    assert target.render_scale == 0.25
+    target.set_render_scale(2.0)
+    assert target.render_scale == 1.0
+    assert target.world is target.frame
+    assert target.surfaces() == []
+
+
+def test_steps_down_one_step_per_full_sample():
+    target = FakeTarget()
+    dynamic = controller(target)
+    for _ in range(3):
+        dynamic.add_frame(20.0)
+    assert target.scales == []
+
+    dynamic.add_frame(20.0)
+    assert target.scales == [0.75]
+    # The sample restarts at the new scale
+    for _ in range(3):
+        dynamic.add_frame(20.0)
+    assert target.scales == [0.75]
+    dynamic.add_frame(20.0)
+    assert target.scales == [0.75, 0.5]
+
+    # Already at the lowest step
+    for _ in range(8):
+        dynamic.add_frame(20.0)
+    assert target.scales == [0.75, 0.5]
+    assert dynamic.changes == 2
+
+
+def test_steps_up_only_with_headroom():
+    target = FakeTarget(render_scale=0.5)
+    dynamic = controller(target)
+    for _ in range(8):
+        dynamic.add_frame(7.0)  # under budget but above the headroom share
+    assert target.scales == []
+
+    for _ in range(4):
+        dynamic.add_frame(2.0)
+    assert target.scales == [0.75]
+    for _ in range(4):
+        dynamic.add_frame(2.0)
+    assert target.scales == [0.75, 1.0]
+
+
+def test_decisions_use_the_sample_mean():
+    target = FakeTarget()
+    dynamic = controller(target)
+    for ms in (30.0, 2.0, 2.0, 2.0):
+        dynamic.add_frame(ms)  # mean 9 ms: within budget
+    assert target.scales == []
+    dynamic.add_frame(40.0)  # window is now 2, 2, 2, 40: mean 11.5 ms
+    assert target.scales == [0.75]
+
+
+def test_starts_at_nearest_step():
+    target = FakeTarget(render_scale=0.7)
+    dynamic = controller(target, sample_frames=1)
+    dynamic.add_frame(20.0)
+    assert target.scales == [0.5]
@@ -0,0 +1,101 @@
+"""Tests for the shared sprite cache and its background loader"""
+import time
+
+import pygame
+import pytest
+
+from src.entities.base import Entity
+from src.rendering import sprites
+
+GREEN = (0, 200, 0)
+
+
+class Block(Entity):
+    """Entity with a sprite"""
+
+    def __init__(self, size: int = 16) -> None:
+        super().__init__(0, 0, size)
+
+    def update(self, elapsed_ms: float) -> None:
+        pass
+
+    def draw(self, screen, offset=(0, 0)) -> None:
+        pass
+
+
+@pytest.fixture
+def sprite_path(tmp_path):
+    path = str(tmp_path / "block.png")
+    image = pygame.Surface((8, 8))
+    image.fill(GREEN)
+    pygame.image.save(image, path)
+    sprites.clear_cache()
+    yield path
+    sprites.clear_cache()
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Record every image file decoded"""
+    paths = []
+    load = pygame.image.load
+
+    def counting_load(path, *args):
+        paths.append(path)
+        return load(path, *args)
+
+    monkeypatch.setattr(pygame.image, "load", counting_load)
+    return paths
+
+
+def installed_keys(timeout=5.0):
+    """Pump the loader until it installs something"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        keys = sprites.pump()
+        if keys:
+            return keys
+        time.sleep(0.001)
+    return []
+
+
+def test_load_sprite_defers_decoding(sprite_path, decodes):
+    block = Block()
+    block.load_sprite(sprite_path, GREEN)
+    assert decodes == []
+
+    # The first draw requests the sprite; the fallback is drawn until it arrives
+    assert block.sprite is None
+    assert sprites.pending_count() == 1
+    assert installed_keys() == [(sprite_path, 16)]
+    assert sprites.pending_count() == 0
+
+    sprite = block.sprite
+    assert sprite.get_size() == (16, 16)
+    assert sprite.get_at((8, 8))[:3] == GREEN
+    assert decodes == [sprite_path]
+
+
+def test_entities_of_one_size_share_a_surface(sprite_path, decodes):
+    small, other, large = Block(), Block(), Block(size=32)
+    for block in (small, other, large):
+        block.load_sprite(sprite_path, GREEN)
+        assert block.sprite is None
+    assert sprites.wait_for_sprites(timeout=5)
+
+    assert small.sprite is other.sprite
+    assert large.sprite.get_size() == (32, 32)
+    assert decodes == [sprite_path, sprite_path]
+
+
+def test_missing_file_has_no_sprite(tmp_path, decodes):
+    failed = sprites.load_stats()["failed"]
+    block = Block()
+    block.load_sprite(str(tmp_path / "missing.png"), GREEN)
+    assert block.sprite is None
+    assert sprites.wait_for_sprites(timeout=5)
+
+    assert block.sprite is None
+    assert sprites.pending_count() == 0
+    assert sprites.load_stats()["failed"] == failed + 1
+    assert decodes == []
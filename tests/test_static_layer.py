@@ -0,0 +1,150 @@
+"""Tests for the chunked static layer cache"""
+import pygame
+
+from src.entities.base import Entity
+from src.rendering.static_layer import StaticLayer
+
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+class Block(Entity):
+    """Static entity that counts its draws"""
+
+    def __init__(self, x: float, y: float, color=RED) -> None:
+        super().__init__(x, y, 20)
+        self.color = color
+        self.draws = 0
+
+    def update(self, elapsed_ms: float) -> None:
+        pass
+
+    def draw(self, screen, offset=(0, 0), scale=1.0) -> None:
+        self.draws += 1
+        pygame.draw.rect(screen, self.color, self.screen_rect(offset, scale))
+
+
+def baked_layer(*entities: Entity) -> StaticLayer:
+    layer = StaticLayer(chunk_size=64)
+    for entity in entities:
+        layer.add(entity)
+    layer.draw(pygame.Surface((128, 128)))
+    return layer
+
+
+def test_entities_are_baked_once():
+    block = Block(30, 30)
+    layer = baked_layer(block)
+    baked = block.draws
+    layer.draw(pygame.Surface((128, 128)))
+    assert block.draws == baked
+
+
+def test_draw_applies_the_offset():
+    layer = baked_layer(Block(30, 30))
+    screen = pygame.Surface((64, 64))
+    layer.draw(screen, (10, 10))
+    # The block covers 20..39 in the world, so 10..29 on screen
+    assert screen.get_at((10, 10))[:3] == RED
+    assert screen.get_at((29, 29))[:3] == RED
+    assert screen.get_at((30, 30))[:3] == BLACK
+
+
+def test_patch_redraws_only_the_changed_entity():
+    a = Block(30, 30)
+    b = Block(100, 30)
+    layer = baked_layer(a, b)
+    a_draws, b_draws = a.draws, b.draws
+
+    a.color = BLUE
+    a._notify_state_change()
+    screen = pygame.Surface((128, 128))
+    layer.draw(screen)
+    assert a.draws == a_draws + 1
+    assert b.draws == b_draws
+    assert screen.get_at((30, 30))[:3] == BLUE
+    assert screen.get_at((100, 30))[:3] == RED
+
+
+def test_patch_covers_every_chunk_an_entity_overlaps():
+    block = Block(64, 30)  # straddles chunks (0, 0) and (1, 0)
+    layer = baked_layer(block)
+
+    block.color = BLUE
+    layer.mark_dirty(block)
+    screen = pygame.Surface((128, 128))
+    layer.draw(screen)
+    assert screen.get_at((58, 30))[:3] == BLUE
+    assert screen.get_at((70, 30))[:3] == BLUE
+
+
+def test_remove_erases_the_entity():
+    a = Block(30, 30)
+    b = Block(40, 50)
+    layer = baked_layer(a, b)
+
+    layer.remove(a)
+    a._notify_state_change()  # no longer registered, must not patch anything
+    screen = pygame.Surface((128, 128))
+    layer.draw(screen)
+    assert screen.get_at((25, 25))[:3] == BLACK
+    assert screen.get_at((40, 50))[:3] == RED
+
+    layer.remove(b)
+    layer.draw(screen)
+    assert screen.get_at((40, 50))[:3] == BLACK
+
+
+def test_least_recently_drawn_chunks_are_dropped():
+    blocks = [Block(32 + 64 * i, 32) for i in range(4)]
+    layer = StaticLayer(chunk_size=64, max_chunks=2)
+    for block in blocks:
+        layer.add(block)
+    screen = pygame.Surface((64, 64))
+    for i in range(4):
+        layer.draw(screen, (64 * i, 0))
+    assert list(layer._chunks) == [(2, 0), (3, 0)]
+
+    # A dropped chunk is baked again when it comes back into view
+    draws = blocks[0].draws
+    layer.draw(screen, (0, 0))
+    assert blocks[0].draws == draws + 1
+    assert list(layer._chunks) == [(3, 0), (0, 0)]
+    assert screen.get_at((32, 32))[:3] == RED
+
+
+def test_sprites_loaded_rebakes_only_matching_entities():
+    a = Block(30, 30)
+    b = Block(90, 30)
+    a.sprite_path = "a.png"
+    b.sprite_path = "b.png"
+    layer = baked_layer(a, b)
+    a_draws, b_draws = a.draws, b.draws
+
+    layer.sprites_loaded([("a.png", 20), ("b.png", 7)])  # b.png at another size
+    layer.draw(pygame.Surface((128, 128)))
+    assert a.draws == a_draws + 1
+    assert b.draws == b_draws
+
+
+def test_patch_drops_scaled_copy():
+    block = Block(30, 30)
+    layer = baked_layer(block)
+    screen = pygame.Surface((64, 64))
+    layer.draw(screen, scale=0.5)
+    scaled = layer._scaled[(0, 0)]
+    assert scaled.get_size() == (32, 32)
+
+    layer.mark_dirty(block)
+    layer.draw(screen, scale=0.5)
+    assert layer._scaled[(0, 0)] is not scaled
+
+
+def test_scaled_draw_covers_the_view():
+    layer = baked_layer(Block(30, 30))
+    screen = pygame.Surface((64, 48))
+    layer.draw(screen, (0, 0), scale=0.5)
+    # The block is centred at (30, 30) in the world, so (15, 15) on a half-scale screen
+    assert screen.get_at((15, 15))[:3] == RED
+    assert screen.get_at((40, 40))[:3] == BLACK
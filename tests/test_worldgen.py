@@ -0,0 +1,195 @@
+"""Tests for seeded world generation, chunk streaming and the chunk index"""
+import random
+import time
+
+import numpy as np
+import pytest
+
+from src.config import WorldSettings
+from src.entities.enemy import Enemy
+from src.entities.tree import Tree
+from src.main import Game
+from src.rendering.static_layer import StaticLayer
+from src.systems.events import EventBus, EventType
+from src.systems.items import ItemRegistry
+from src.systems.lod import SimulationLOD
+from src.systems.loot import LootEntry, LootTable, world_rng
+from src.systems.worldgen import ChunkIndex, ChunkStreamer, WorldGenerator
+
+KEYS = [(cx, cy) for cy in range(-2, 3) for cx in range(-2, 3)]
+FAR_AWAY = (WorldSettings.UNLOAD_RADIUS + 1) * WorldSettings.CHUNK_SIZE * 2
+
+
+def stream(generator, keys):
+    """Generate chunks through a ChunkStreamer, requesting keys one at a time"""
+    streamer = ChunkStreamer(generator, radius=0)
+    size = generator.chunk_size
+    for cx, cy in keys:
+        streamer.request_around(cx * size, cy * size)
+
+    chunks = {}
+    deadline = time.monotonic() + 30
+    while len(chunks) < len(keys) and time.monotonic() < deadline:
+        for chunk in streamer.poll(limit=len(keys)):
+            chunks[chunk.key] = chunk
+        time.sleep(0.001)
+    streamer.close()
+    return chunks
+
+
+def test_same_seed_same_world():
+    direct = {key: WorldGenerator(seed=7).generate(key) for key in KEYS}
+    keys = list(KEYS)
+    random.Random(1).shuffle(keys)
+    streamed = stream(WorldGenerator(seed=7), keys)
+
+    assert sorted(streamed) == sorted(KEYS)
+    for key in KEYS:
+        np.testing.assert_array_equal(streamed[key].trees, direct[key].trees)
+        np.testing.assert_array_equal(streamed[key].enemies, direct[key].enemies)
+
+
+def test_different_seed_different_world():
+    a, b = WorldGenerator(seed=7), WorldGenerator(seed=8)
+    chunks_a = [a.generate(key) for key in KEYS]
+    chunks_b = [b.generate(key) for key in KEYS]
+    assert any(not np.array_equal(x.trees, y.trees) or not np.array_equal(x.enemies, y.enemies)
+               for x, y in zip(chunks_a, chunks_b))
+
+
+def test_same_seed_same_loot():
+    table = LootTable([LootEntry('Logs', 3, 1, 4), LootEntry('Coins', 1, 1, 20), LootEntry(None, 2)],
+                      registry=ItemRegistry())
+
+    def rolls(seed):
+        rng = world_rng(seed)
+        return [table.roll(rng) for _ in range(200)]
+
+    assert rolls(7) == rolls(7)
+    assert rolls(7) != rolls(8)
+
+
+def test_forgotten_chunks_can_be_requested_again():
+    generator = WorldGenerator(seed=7)
+    streamer = ChunkStreamer(generator, radius=1)
+    try:
+        assert streamer.request_around(0, 0) == 9
+        assert streamer.request_around(0, 0) == 0
+        streamer.forget([(0, 0), (1, 1)])
+        assert streamer.requested_count == 7
+        assert streamer.request_around(0, 0) == 2
+    finally:
+        streamer.close()
+
+
+def test_chunk_index_add_remove_query():
+    index = ChunkIndex(chunk_size=100)
+    assert index.add('a', 10, 10) == (0, 0)
+    assert index.add('b', 150, 10) == (1, 0)
+    assert index.add('c', -5, 250) == (-1, 2)
+    assert len(index) == 3
+
+    assert set(index.query(0, 0, 99, 99)) == {'a'}
+    assert set(index.query(50, 0, 120, 50)) == {'a', 'b'}
+    assert set(index.query(-500, -500, 500, 500)) == {'a', 'b', 'c'}
+
+    index.remove('b', 150, 10)
+    assert len(index) == 2
+    assert set(index.query(-500, -500, 500, 500)) == {'a', 'c'}
+
+
+@pytest.fixture
+def game():
+    """Game with only chunk streaming set up, spawning default trees and enemies"""
+    game = Game.__new__(Game)
+    game.world = ChunkStreamer(WorldGenerator(seed=7))
+    game.player = type("Player", (), {"x": 0.0, "y": 0.0})()
+    game.trees, game.enemies = [], []
+    game.tree_index, game.enemy_index = ChunkIndex(), ChunkIndex()
+    game.tree_lod, game.enemy_lod = SimulationLOD(), SimulationLOD()
+    game.static_layer = StaticLayer()
+    game._max_entity_size = 0
+    game.game_time_ms = 0.0
+    game._loaded_chunks = {}
+    game._chunk_deltas = {}
+    game._respawning = 0
+    game.events = EventBus()
+    game.events.subscribe(EventType.TREE_CHOPPED, game._restart_tree_timer)
+    game.events.subscribe(EventType.ENEMY_DEFEATED, game._restart_enemy_timer)
+    game._generated_tree, game._generated_enemy = Tree, Enemy
+    game._spawn = lambda entity_class, x, y: game._add_entity(entity_class(x, y))
+    yield game
+    game.world.close()
+
+
+def leave_and_return(game, away_ms):
+    """Unload the chunks around the origin and regenerate (0, 0) after away_ms"""
+    game.player.x = FAR_AWAY
+    game._unload_far_chunks()
+    assert game.trees == [] and game.enemies == []
+    game.game_time_ms += away_ms
+    game.player.x = 0.0
+    game._spawn_chunk(game.world.generator.generate((0, 0)))
+    return game._loaded_chunks[(0, 0)]
+
+
+def test_unloaded_chunk_keeps_its_chopped_trees_and_defeated_enemies(game):
+    game._spawn_chunk(game.world.generator.generate((0, 0)))
+    tree, first, second = game._loaded_chunks[(0, 0)]
+    tree.deplete(tree.respawn_delay)
+    second.take_damage(second.max_hp)
+    game.game_time_ms += 1000  # not updated since: the LOD still owes them this time
+
+    tree, first, second = leave_and_return(game, 2000)
+    assert not tree.active
+    assert tree.respawn_timer == tree.respawn_delay - 3000
+    assert tree.sprite_path == tree.chopped_sprite_path
+    assert first.alive
+    assert not second.alive and second.hp == 0
+    assert second.respawn_timer == second.respawn_delay - 3000
+    assert game._chunk_deltas == {}
+
+
+def test_respawns_due_while_unloaded_come_back_as_generated(game):
+    game._spawn_chunk(game.world.generator.generate((0, 0)))
+    tree, _first, second = game._loaded_chunks[(0, 0)]
+    tree.deplete(tree.respawn_delay)
+    second.take_damage(second.max_hp)
+
+    tree, _first, second = leave_and_return(game, tree.respawn_delay)
+    assert tree.active
+    assert not second.alive
+
+    # A delta is dropped without a return once every timer in it has run out
+    game.player.x = FAR_AWAY
+    game._unload_far_chunks()
+    assert list(game._chunk_deltas) == [(0, 0)]
+    game.game_time_ms += second.respawn_timer
+    game._unload_far_chunks()
+    assert game._chunk_deltas == {}
+
+
+def test_respawning_counts_every_entity_that_is_down(game):
+    game._spawn_chunk(game.world.generator.generate((0, 0)))
+    tree, first, second = game._loaded_chunks[(0, 0)]
+    tree.chop(game.player, game.events)
+    for enemy in (first, second):
+        enemy.take_damage(enemy.max_hp)
+        game.events.emit(EventType.ENEMY_DEFEATED, game.player, enemy)
+    game.events.dispatch()
+    assert game._respawning == 3
+
+    # Unloading takes them out of the count and reloading puts them back
+    stale = second
+    game.player.x = FAR_AWAY
+    game._unload_far_chunks()
+    assert game._respawning == 0
+    game.player.x = 0.0
+    game._spawn_chunk(game.world.generator.generate((0, 0)))
+    assert game._respawning == 3
+
+    # A respawn queued before its chunk was unloaded is not counted
+    _tree, first, _second = game._loaded_chunks[(0, 0)]
+    game._resolve_respawns({first: None, stale: None})
+    assert first.alive
+    assert game._respawning == 2
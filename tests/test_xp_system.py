@@ -0,0 +1,61 @@
+"""Tests for the XP table and XPSystem"""
+from src.config import GameBalance
+from src.systems.xp_system import (SKILL_IDS, SKILLS, XP_TABLE, XPSystem,
+                                   level_for_xp, xp_for_level)
+
+
+def test_table_known_values():
+    assert len(XP_TABLE) == GameBalance.MAX_LEVEL
+    assert xp_for_level(1) == 0
+    assert xp_for_level(2) == 83
+    assert xp_for_level(99) == 13_034_431
+
+
+def test_level_boundaries():
+    for level in range(2, GameBalance.MAX_LEVEL + 1):
+        threshold = xp_for_level(level)
+        assert level_for_xp(threshold - 1) == level - 1
+        assert level_for_xp(threshold) == level
+
+
+def test_level_is_clamped():
+    assert level_for_xp(0) == 1
+    assert level_for_xp(10 ** 12) == GameBalance.MAX_LEVEL
+
+
+def test_add_xp_reports_level_up():
+    xp = XPSystem()
+    assert not xp.add_xp('Woodcutting', 82)
+    assert xp.add_xp('Woodcutting', 1)
+    assert xp.get_skill_info('Woodcutting') == (2, 83)
+
+
+def test_add_xp_ignores_unknown_skills():
+    xp = XPSystem()
+    assert not xp.add_xp('Fishing', 100)
+    assert not xp.add_xp(-1, 100)
+    assert not xp.add_xp(len(SKILLS), 100)
+    assert list(xp.xp) == [0] * len(SKILLS)
+
+
+def test_batch_matches_single_grants():
+    grants = [(skill_id, amount) for amount in range(1, 200) for skill_id in range(len(SKILLS))]
+    single = XPSystem()
+    for skill_id, amount in grants:
+        single.add_xp(skill_id, amount)
+    batched = XPSystem()
+    leveled = batched.add_xp_batch(grants)
+
+    assert list(batched.xp) == list(single.xp)
+    assert list(batched.levels) == list(single.levels)
+    assert sorted(leveled) == list(range(len(SKILLS)))
+
+
+def test_batch_ignores_unknown_skills():
+    xp = XPSystem()
+    combat = SKILL_IDS['Combat']
+    leveled = xp.add_xp_batch([(-1, 500), (len(SKILLS), 500), (combat, 10)])
+
+    assert leveled == []
+    assert xp.get_skill_info('Combat') == (1, 10)
+    assert xp.get_skill_info('Woodcutting') == (1, 0)